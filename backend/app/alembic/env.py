@@ -20,6 +20,7 @@ fileConfig(config.config_file_name)
 
 from app.models import SQLModel  # noqa
 from app.core.config import settings # noqa
+from app.core.db_pool import driver_connect_args  # noqa
 
 target_metadata = SQLModel.metadata
 
@@ -68,6 +69,7 @@ def run_migrations_online():
         configuration,
         prefix="sqlalchemy.",
         poolclass=pool.NullPool,
+        connect_args=driver_connect_args("psycopg", settings.DB_PGBOUNCER),
     )
 
     with connectable.connect() as connection:
@@ -0,0 +1,46 @@
+"""Add jti column to refresh_tokens for O(1) token lookup
+
+Revision ID: 7e1ab55d929e
+Revises: 09cffeef4f6b
+Create Date: 2026-10-17 09:12:41.382019
+
+Refresh tokens now carry a unique jti claim and are stored as an HMAC-SHA256
+digest instead of a bcrypt hash, so a token is found with one indexed lookup.
+
+Migration path for existing rows:
+- Existing rows keep jti = NULL and their bcrypt token_hash.
+- token_service falls back to the bcrypt scan only for tokens without a jti
+  claim, restricted to the user's rows where jti IS NULL.
+- Legacy rows stop being usable after REFRESH_TOKEN_EXPIRE_DAYS (30 days) and
+  are removed by expired token cleanup. No forced re-login is required.
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+
+# revision identifiers, used by Alembic.
+revision = '7e1ab55d929e'
+down_revision = '09cffeef4f6b'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Nullable: legacy bcrypt-hashed rows have no jti
+    op.add_column(
+        'refresh_tokens',
+        sa.Column('jti', sqlmodel.sql.sqltypes.AutoString(length=36), nullable=True),
+    )
+    op.create_index(op.f('ix_refresh_tokens_jti'), 'refresh_tokens', ['jti'], unique=True)
+
+
+def downgrade():
+    # Rows issued with jti store an HMAC digest that the old bcrypt scan cannot
+    # match, so revoke them to force re-login after downgrading
+    op.execute(
+        "UPDATE refresh_tokens SET revoked_at = now() "
+        "WHERE jti IS NOT NULL AND revoked_at IS NULL"
+    )
+    op.drop_index(op.f('ix_refresh_tokens_jti'), table_name='refresh_tokens')
+    op.drop_column('refresh_tokens', 'jti')
@@ -0,0 +1,40 @@
+"""Make the set_tenant_context() SQL helper transaction-local
+
+Revision ID: b4c9e21f7a30
+Revises: 7e1ab55d929e
+Create Date: 2026-10-17 14:05:12.518204
+
+set_tenant_context() set app.current_tenant for the whole session
+(is_local = false). Behind PgBouncer in transaction pooling mode the server
+connection is handed to another client after each transaction, so a
+session-level tenant would leak into that client's queries. The helper now
+sets it for the current transaction only, like the application does (see
+app.core.tenant_context); call it inside a transaction.
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'b4c9e21f7a30'
+down_revision = '7e1ab55d929e'
+branch_labels = None
+depends_on = None
+
+
+def _create_function(is_local: str) -> None:
+    op.execute(f'''
+        CREATE OR REPLACE FUNCTION set_tenant_context(p_tenant_id INTEGER)
+        RETURNS void AS $$
+        BEGIN
+            PERFORM set_config('app.current_tenant', p_tenant_id::TEXT, {is_local});
+        END;
+        $$ LANGUAGE plpgsql
+    ''')
+
+
+def upgrade():
+    _create_function('true')
+
+
+def downgrade():
+    _create_function('false')
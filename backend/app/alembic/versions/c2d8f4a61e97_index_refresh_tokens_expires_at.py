@@ -0,0 +1,28 @@
+"""Index refresh_tokens.expires_at for the expired-token cleanup
+
+Revision ID: c2d8f4a61e97
+Revises: b4c9e21f7a30
+Create Date: 2026-10-17 16:40:27.193846
+
+cleanup_expired_tokens() deletes expired rows in chunks, each chunk picked
+with `WHERE expires_at < now LIMIT n`; without an index every chunk scans
+the whole table.
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'c2d8f4a61e97'
+down_revision = 'b4c9e21f7a30'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        op.f('ix_refresh_tokens_expires_at'), 'refresh_tokens', ['expires_at'], unique=False
+    )
+
+
+def downgrade():
+    op.drop_index(op.f('ix_refresh_tokens_expires_at'), table_name='refresh_tokens')
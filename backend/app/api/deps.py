@@ -39,6 +39,7 @@ References:
 - Test Coverage: backend/tests/test_rls_tenant_isolation.py:204-394
 """
 
+import uuid
 from collections.abc import AsyncGenerator, Generator
 from typing import Annotated
 
@@ -47,18 +48,31 @@ from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jwt.exceptions import InvalidTokenError
 from pydantic import ValidationError
-from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import Session, select
 
 from app.core import security
 from app.core.config import settings
-from app.core.db import async_session_maker, engine
+from app.core.db import (
+    async_session_maker,
+    engine,
+    read_after_write,
+    replica_engine,
+    replica_session_maker,
+)
+from app.core.read_replica import USER_KEY
+from app.core.tenant_context import apply_tenant, reset_tenant
+from app.core.user_cache import UserSnapshot, user_snapshot_cache
 from app.models import TokenPayload, User
 
 reusable_oauth2 = OAuth2PasswordBearer(
     tokenUrl=f"{settings.API_V1_STR}/login/access-token"
 )
+# Same scheme without the 401; authentication is still enforced by the
+# CurrentUser dependencies
+optional_oauth2 = OAuth2PasswordBearer(
+    tokenUrl=f"{settings.API_V1_STR}/login/access-token", auto_error=False
+)
 
 
 # ============================================================================
@@ -70,16 +84,17 @@ async def set_tenant_context(session: AsyncSession, tenant_id: int) -> None:
     """Set tenant context for RLS policies.
 
     This function MUST be called before any database queries in a multi-tenant context.
-    It sets the PostgreSQL session variable that RLS policies use for tenant isolation.
+    It sets the PostgreSQL variable that RLS policies use for tenant isolation.
+
+    The setting is transaction-local and is sent together with the BEGIN of
+    each transaction, so it costs no extra round-trip and is cleared when the
+    connection returns to the pool (see app.core.tenant_context).
 
     Args:
         session: AsyncSession - The database session
         tenant_id: int - The tenant ID from the authenticated user's JWT token
     """
-    await session.execute(
-        text("SELECT set_config('app.current_tenant', :tenant_id, false)"),
-        {"tenant_id": str(tenant_id)},
-    )
+    await apply_tenant(session, tenant_id)
 
 
 # ============================================================================
@@ -94,7 +109,34 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
     after authentication via set_tenant_context().
     """
     async with async_session_maker() as session:
-        yield session
+        try:
+            yield session
+            # Keep the user's reads on the primary while the replica catches up
+            await read_after_write.session_closed(session)
+        finally:
+            reset_tenant(session)
+
+
+async def get_read_db(
+    token: Annotated[str | None, Depends(optional_oauth2)],
+) -> AsyncGenerator[AsyncSession, None]:
+    """Async session for read-only routes, served by the read replica.
+
+    Falls back to the primary when no replica is configured, or when the
+    authenticated user wrote within the last READ_REPLICA_STICKY_SECONDS
+    (read-your-writes). The tenant context is applied the same way as on
+    the primary. Do not write through this session.
+    """
+    session_maker = replica_session_maker
+    if replica_engine is not None and await read_after_write.use_primary(
+        _token_user_id(token)
+    ):
+        session_maker = async_session_maker
+    async with session_maker() as session:
+        try:
+            yield session
+        finally:
+            reset_tenant(session)
 
 
 # Sync session for backwards compatibility (migrations, scripts)
@@ -105,6 +147,7 @@ def get_db_sync() -> Generator[Session, None, None]:
 
 
 SessionDep = Annotated[AsyncSession, Depends(get_db)]
+ReadSessionDep = Annotated[AsyncSession, Depends(get_read_db)]
 TokenDep = Annotated[str, Depends(reusable_oauth2)]
 
 
@@ -113,6 +156,42 @@ TokenDep = Annotated[str, Depends(reusable_oauth2)]
 # ============================================================================
 
 
+def _decode_subject(token: str) -> TokenPayload:
+    """Validate the JWT and return its payload, raising 403 if invalid."""
+    try:
+        payload = jwt.decode(
+            token, settings.SECRET_KEY, algorithms=[security.ALGORITHM]
+        )
+        return TokenPayload(**payload)
+    except (InvalidTokenError, ValidationError):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Could not validate credentials",
+        )
+
+
+def _token_user_id(token: str | None) -> uuid.UUID | None:
+    """User ID from a valid token, or None (errors are left to CurrentUser)."""
+    if not token:
+        return None
+    try:
+        return uuid.UUID(str(_decode_subject(token).sub))
+    except (HTTPException, ValueError):
+        return None
+
+
+def _ensure_tenant(tenant_id: int | None) -> int:
+    # CRITICAL SECURITY VALIDATION: Ensure tenant_id is never NULL
+    # NULL tenant_id would bypass RLS policies and potentially expose all tenant data
+    # This check prevents catastrophic data leaks (NFR2.11-2.14)
+    if tenant_id is None:
+        raise HTTPException(
+            status_code=500,
+            detail="User has no tenant association - data isolation cannot be guaranteed",
+        )
+    return tenant_id
+
+
 async def get_current_user(session: SessionDep, token: TokenDep) -> User:
     """Get current authenticated user from JWT token and set tenant context.
 
@@ -121,22 +200,17 @@ async def get_current_user(session: SessionDep, token: TokenDep) -> User:
     2. Fetches the user from the database
     3. Sets the tenant context for RLS policies
 
+    Use this when the route needs the full ORM row (profile fields or updates).
+    For authorization-only routes prefer CurrentUserSnapshot, which skips the
+    user query on the common path.
+
     Returns:
         User: The authenticated user object
 
     Raises:
         HTTPException: If token is invalid, user not found, or user is inactive
     """
-    try:
-        payload = jwt.decode(
-            token, settings.SECRET_KEY, algorithms=[security.ALGORITHM]
-        )
-        token_data = TokenPayload(**payload)
-    except (InvalidTokenError, ValidationError):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Could not validate credentials",
-        )
+    token_data = _decode_subject(token)
 
     # Query user (before setting tenant context - this is the initial auth query)
     result = await session.execute(select(User).where(User.id == token_data.sub))
@@ -147,26 +221,60 @@ async def get_current_user(session: SessionDep, token: TokenDep) -> User:
     if not user.is_active:
         raise HTTPException(status_code=400, detail="Inactive user")
 
-    # CRITICAL SECURITY VALIDATION: Ensure tenant_id is never NULL
-    # NULL tenant_id would bypass RLS policies and potentially expose all tenant data
-    # This check prevents catastrophic data leaks (NFR2.11-2.14)
-    if user.tenant_id is None:
-        raise HTTPException(
-            status_code=500,
-            detail="User has no tenant association - data isolation cannot be guaranteed",
-        )
+    tenant_id = _ensure_tenant(user.tenant_id)
+    session.info[USER_KEY] = user.id
 
     # CRITICAL: Set tenant context for RLS policies
     # All subsequent queries in this session will be filtered by this tenant_id
-    await set_tenant_context(session, user.tenant_id)
+    await set_tenant_context(session, tenant_id)
 
     return user
 
 
+async def get_current_user_snapshot(
+    session: SessionDep, token: TokenDep
+) -> UserSnapshot:
+    """Get a cached snapshot of the authenticated user and set tenant context.
+
+    Same checks as get_current_user, but served from the user snapshot cache
+    (process LRU + Redis) so the user SELECT only runs on a cache miss.
+
+    Returns:
+        UserSnapshot: id, tenant_id, role and status flags of the user
+
+    Raises:
+        HTTPException: If token is invalid, user not found, or user is inactive
+    """
+    token_data = _decode_subject(token)
+    try:
+        user_id = uuid.UUID(str(token_data.sub))
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Could not validate credentials",
+        )
+
+    snapshot = await user_snapshot_cache.get(user_id, session)
+
+    if not snapshot:
+        raise HTTPException(status_code=404, detail="User not found")
+    if not snapshot.is_active:
+        raise HTTPException(status_code=400, detail="Inactive user")
+
+    tenant_id = _ensure_tenant(snapshot.tenant_id)
+    session.info[USER_KEY] = snapshot.id
+
+    # CRITICAL: Set tenant context for RLS policies
+    await set_tenant_context(session, tenant_id)
+
+    return snapshot
+
+
 CurrentUser = Annotated[User, Depends(get_current_user)]
+CurrentUserSnapshot = Annotated[UserSnapshot, Depends(get_current_user_snapshot)]
 
 
-def get_current_active_superuser(current_user: CurrentUser) -> User:
+def get_current_active_superuser(current_user: CurrentUserSnapshot) -> UserSnapshot:
     """Verify current user has superuser privileges"""
     if not current_user.is_superuser:
         raise HTTPException(
@@ -1,10 +1,17 @@
-"""Performance monitoring middleware for request timing and slow query detection."""
+"""Performance monitoring for request timing and slow request detection.
+
+Timing is taken by RequestLoggingMiddleware (app/middleware/logging.py), a
+pure ASGI middleware that handles request IDs, logging and timing in one
+pass. This module holds what is done with each measurement: per-route
+histograms (app.core.metrics) and the slow request warning.
+"""
 
 import logging
-import time
-from collections.abc import Awaitable, Callable
 
-from fastapi import Request, Response
+from starlette.types import Scope
+
+from app.core.metrics import UNMATCHED_ROUTE, request_metrics
+from app.core.request_timing import RequestTiming
 
 logger = logging.getLogger("ayni.api.performance")
 
@@ -12,43 +19,57 @@ logger = logging.getLogger("ayni.api.performance")
 SLOW_REQUEST_THRESHOLD_MS = 500
 
 
-async def performance_middleware(
-    request: Request, call_next: Callable[[Request], Awaitable[Response]]
-) -> Response:
-    """
-    Middleware to track API request performance.
+def format_response_time(duration_ms: float) -> str:
+    """Value of the X-Response-Time header (e.g. "12.34ms")."""
+    return f"{duration_ms:.2f}ms"
 
-    Measures request duration, logs slow requests, and adds performance
-    headers to responses for debugging.
 
-    Args:
-        request: Incoming FastAPI request
-        call_next: Next middleware/handler in chain
+def route_template(scope: Scope) -> str:
+    """Path template of the route that handled the request.
 
-    Returns:
-        Response with X-Response-Time header added
+    The router stores the matched route in the scope, so this is only
+    meaningful after the app has run. Templates keep metric labels bounded
+    ("/api/v1/users/{user_id}" rather than one label per user).
     """
-    start_time = time.time()
+    route = scope.get("route")
+    return getattr(route, "path", None) or UNMATCHED_ROUTE
+
 
-    # Process request
-    response = await call_next(request)
+def record_request(
+    method: str,
+    path: str,
+    route: str,
+    status_code: int,
+    duration_ms: float,
+    request_id: str | None = None,
+    timing: RequestTiming | None = None,
+) -> None:
+    """
+    Record a completed request.
 
-    # Calculate duration
-    duration_ms = (time.time() - start_time) * 1000
+    Adds it to the per-route latency histogram and logs a warning when the
+    request took longer than SLOW_REQUEST_THRESHOLD_MS.
 
-    # Log slow requests
+    Args:
+        method: HTTP method
+        path: Request path
+        route: Route template (see route_template)
+        status_code: Response status code (500 if the app raised)
+        duration_ms: Time until the response body was fully sent
+        request_id: Request ID assigned by the logging middleware
+        timing: DB/Redis breakdown, included in the slow request warning
+    """
+    request_metrics.observe(method, route, status_code, duration_ms)
     if duration_ms > SLOW_REQUEST_THRESHOLD_MS:
         logger.warning(
             "Slow request detected",
             extra={
-                "path": str(request.url.path),
-                "method": request.method,
+                "request_id": request_id,
+                "path": path,
+                "route": route,
+                "method": method,
                 "duration_ms": round(duration_ms, 2),
-                "status_code": response.status_code,
+                "status_code": status_code,
+                **(timing.log_fields() if timing is not None else {}),
             },
         )
-
-    # Add performance header for debugging
-    response.headers["X-Response-Time"] = f"{duration_ms:.2f}ms"
-
-    return response
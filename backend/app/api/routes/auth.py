@@ -22,7 +22,7 @@ from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app import utils
-from app.core.auth import get_current_active_user
+from app.core.auth import get_current_active_user, get_current_active_user_snapshot
 from app.core.config import settings
 from app.core.db import get_async_session
 from app.core.redis import RedisClient
@@ -31,11 +31,10 @@ from app.core.security import (
     create_password_reset_token,
     create_verification_token,
     encrypt_token,
-    get_password_hash,
     verify_email_token,
-    verify_password,
     verify_password_reset_token,
 )
+from app.core.user_cache import UserSnapshot, user_snapshot_cache
 from app.models import (
     Message,
     OAuthAccount,
@@ -49,6 +48,7 @@ from app.models import (
     UserPublic,
     UserRegister,
 )
+from app.services.password_service import PasswordHasher
 from app.services.token_service import (
     create_and_store_refresh_token,
     invalidate_refresh_token,
@@ -111,7 +111,7 @@ async def register(
     # Create user
     user = User(
         email=user_in.email,
-        hashed_password=get_password_hash(user_in.password),
+        hashed_password=await PasswordHasher.hash(user_in.password),
         full_name=user_in.full_name,
         tenant_id=tenant.id,
         role="Owner",
@@ -198,7 +198,9 @@ async def login(
     user = result.scalar_one_or_none()
 
     # Verify user exists and password is correct
-    if not user or not verify_password(form_data.password, user.hashed_password):
+    if not user or not await PasswordHasher.verify(
+        form_data.password, user.hashed_password
+    ):
         # Log failed login attempt
         sentry_sdk.add_breadcrumb(
             category="auth",
@@ -361,7 +363,7 @@ async def read_users_me(
 
 @router.post("/auth/logout", response_model=Message, tags=["auth"])
 async def logout(
-    current_user: User = Depends(get_current_active_user),
+    current_user: UserSnapshot = Depends(get_current_active_user_snapshot),
     session: AsyncSession = Depends(get_async_session),
 ) -> Any:
     """
@@ -386,7 +388,7 @@ async def logout(
 
     # Log logout
     logger.info(
-        f"User logged out: {current_user.email} (user_id={current_user.id}, tokens_revoked={revoked_count})"
+        f"User logged out: user_id={current_user.id}, tokens_revoked={revoked_count}"
     )
 
     return Message(message="Successfully logged out")
@@ -446,6 +448,7 @@ async def verify_email(
         user.is_verified = True
         session.add(user)
         await session.commit()
+        await user_snapshot_cache.invalidate(user.id)
 
         # Log successful verification
         sentry_sdk.add_breadcrumb(
@@ -1150,7 +1153,7 @@ async def confirm_password_reset(
         )
 
     # Update password with bcrypt hash
-    user.hashed_password = get_password_hash(new_password)
+    user.hashed_password = await PasswordHasher.hash(new_password)
     session.add(user)
 
     # Invalidate all refresh tokens for this user (force re-login on all devices)
@@ -1163,6 +1166,7 @@ async def confirm_password_reset(
     )
 
     await session.commit()
+    await user_snapshot_cache.invalidate(user_id)
 
     # Blacklist this reset token (1-hour TTL to match token expiration)
     await redis.setex(token_blacklist_key, 3600, "1")
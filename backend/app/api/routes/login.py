@@ -9,8 +9,10 @@ from app import crud
 from app.api.deps import CurrentUser, SessionDep, get_current_active_superuser
 from app.core import security
 from app.core.config import settings
-from app.core.security import get_password_hash
+from app.core.query_budget import query_budget
+from app.core.user_cache import user_snapshot_cache
 from app.models import Message, NewPassword, Token, UserPublic
+from app.services.password_service import PasswordHasher
 from app.utils import (
     generate_password_reset_token,
     generate_reset_password_email,
@@ -22,6 +24,7 @@ router = APIRouter(tags=["login"])
 
 
 @router.post("/login/access-token")
+@query_budget(max_queries=3, max_repeats=1)
 async def login_access_token(
     session: SessionDep, form_data: Annotated[OAuth2PasswordRequestForm, Depends()]
 ) -> Token:
@@ -91,10 +94,11 @@ async def reset_password(session: SessionDep, body: NewPassword) -> Message:
         )
     elif not user.is_active:
         raise HTTPException(status_code=400, detail="Inactive user")
-    hashed_password = get_password_hash(password=body.new_password)
+    hashed_password = await PasswordHasher.hash(body.new_password)
     user.hashed_password = hashed_password
     session.add(user)
     await session.commit()
+    await user_snapshot_cache.invalidate(user.id)
     return Message(message="Password updated successfully")
 
 
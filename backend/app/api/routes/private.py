@@ -4,11 +4,11 @@ from fastapi import APIRouter
 from pydantic import BaseModel
 
 from app.api.deps import SessionDep
-from app.core.security import get_password_hash
 from app.models import (
     User,
     UserPublic,
 )
+from app.services.password_service import PasswordHasher
 
 router = APIRouter(tags=["private"], prefix="/private")
 
@@ -21,7 +21,7 @@ class PrivateUserCreate(BaseModel):
 
 
 @router.post("/users/", response_model=UserPublic)
-def create_user(user_in: PrivateUserCreate, session: SessionDep) -> Any:
+async def create_user(user_in: PrivateUserCreate, session: SessionDep) -> Any:
     """
     Create a new user.
     """
@@ -29,10 +29,10 @@ def create_user(user_in: PrivateUserCreate, session: SessionDep) -> Any:
     user = User(
         email=user_in.email,
         full_name=user_in.full_name,
-        hashed_password=get_password_hash(user_in.password),
+        hashed_password=await PasswordHasher.hash(user_in.password),
     )
 
     session.add(user)
-    session.commit()
+    await session.commit()
 
     return user
@@ -7,11 +7,14 @@ from sqlmodel import col, delete, func, select
 from app import crud
 from app.api.deps import (
     CurrentUser,
+    CurrentUserSnapshot,
+    ReadSessionDep,
     SessionDep,
     get_current_active_superuser,
 )
 from app.core.config import settings
-from app.core.security import get_password_hash, verify_password
+from app.core.query_budget import query_budget
+from app.core.user_cache import user_snapshot_cache
 from app.models import (
     Item,
     Message,
@@ -24,6 +27,7 @@ from app.models import (
     UserUpdate,
     UserUpdateMe,
 )
+from app.services.password_service import PasswordHasher
 from app.utils import generate_new_account_email, send_email
 
 router = APIRouter(prefix="/users", tags=["users"])
@@ -34,7 +38,10 @@ router = APIRouter(prefix="/users", tags=["users"])
     dependencies=[Depends(get_current_active_superuser)],
     response_model=UsersPublic,
 )
-async def read_users(session: SessionDep, skip: int = 0, limit: int = 100) -> Any:
+@query_budget(max_queries=6, max_repeats=2)
+async def read_users(
+    session: ReadSessionDep, skip: int = 0, limit: int = 100
+) -> Any:
     """
     Retrieve users.
     """
@@ -64,7 +71,7 @@ async def create_user(*, session: SessionDep, user_in: UserCreate) -> Any:
             detail="The user with this email already exists in the system.",
         )
 
-    user = crud.create_user(session=session, user_create=user_in)
+    user = await crud.create_user(session=session, user_create=user_in)
     if settings.emails_enabled and user_in.email:
         email_data = generate_new_account_email(
             email_to=user_in.email, username=user_in.email, password=user_in.password
@@ -98,6 +105,7 @@ async def update_user_me(
     session.add(current_user)
     await session.commit()
     await session.refresh(current_user)
+    await user_snapshot_cache.invalidate(current_user.id)
     return current_user
 
 
@@ -108,21 +116,25 @@ async def update_password_me(
     """
     Update own password.
     """
-    if not verify_password(body.current_password, current_user.hashed_password):
+    if not await PasswordHasher.verify(
+        body.current_password, current_user.hashed_password
+    ):
         raise HTTPException(status_code=400, detail="Incorrect password")
     if body.current_password == body.new_password:
         raise HTTPException(
             status_code=400, detail="New password cannot be the same as the current one"
         )
-    hashed_password = get_password_hash(body.new_password)
+    hashed_password = await PasswordHasher.hash(body.new_password)
     current_user.hashed_password = hashed_password
     session.add(current_user)
     await session.commit()
+    await user_snapshot_cache.invalidate(current_user.id)
     return Message(message="Password updated successfully")
 
 
 @router.get("/me", response_model=UserPublic)
-def read_user_me(current_user: CurrentUser) -> Any:
+@query_budget(max_queries=3)
+async def read_user_me(current_user: CurrentUser) -> Any:
     """
     Get current user.
     """
@@ -140,6 +152,7 @@ async def delete_user_me(session: SessionDep, current_user: CurrentUser) -> Any:
         )
     await session.delete(current_user)
     await session.commit()
+    await user_snapshot_cache.invalidate(current_user.id)
     return Message(message="User deleted successfully")
 
 
@@ -155,19 +168,19 @@ async def register_user(session: SessionDep, user_in: UserRegister) -> Any:
             detail="The user with this email already exists in the system",
         )
     user_create = UserCreate.model_validate(user_in)
-    user = crud.create_user(session=session, user_create=user_create)
+    user = await crud.create_user(session=session, user_create=user_create)
     return user
 
 
 @router.get("/{user_id}", response_model=UserPublic)
-def read_user_by_id(
-    user_id: uuid.UUID, session: SessionDep, current_user: CurrentUser
+async def read_user_by_id(
+    user_id: uuid.UUID, session: SessionDep, current_user: CurrentUserSnapshot
 ) -> Any:
     """
     Get a specific user by id.
     """
-    user = session.get(User, user_id)
-    if user == current_user:
+    user = await session.get(User, user_id)
+    if user_id == current_user.id:
         return user
     if not current_user.is_superuser:
         raise HTTPException(
@@ -207,13 +220,16 @@ async def update_user(
                 status_code=409, detail="User with this email already exists"
             )
 
-    db_user = crud.update_user(session=session, db_user=db_user, user_in=user_in)
+    db_user = await crud.update_user(
+        session=session, db_user=db_user, user_in=user_in
+    )
+    await user_snapshot_cache.invalidate(user_id)
     return db_user
 
 
 @router.delete("/{user_id}", dependencies=[Depends(get_current_active_superuser)])
 async def delete_user(
-    session: SessionDep, current_user: CurrentUser, user_id: uuid.UUID
+    session: SessionDep, current_user: CurrentUserSnapshot, user_id: uuid.UUID
 ) -> Message:
     """
     Delete a user.
@@ -221,7 +237,7 @@ async def delete_user(
     user = await session.get(User, user_id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
-    if user == current_user:
+    if user.id == current_user.id:
         raise HTTPException(
             status_code=403, detail="Super users are not allowed to delete themselves"
         )
@@ -229,4 +245,5 @@ async def delete_user(
     await session.execute(statement)
     await session.delete(user)
     await session.commit()
+    await user_snapshot_cache.invalidate(user_id)
     return Message(message="User deleted successfully")
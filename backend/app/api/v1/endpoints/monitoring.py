@@ -3,15 +3,20 @@
 import logging
 import time
 from datetime import datetime, timezone
+from typing import Any
 
 from celery.result import AsyncResult
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy import text
 
-from app.core.cache import cache_result
-from app.core.db import async_engine
+from app.api.deps import get_current_active_superuser
+from app.core.cache import cache_result, get_cache_stats
+from app.core.db import async_engine, replica_engine, slow_query_log
 from app.core.redis import RedisClient
+from app.core.user_cache import user_snapshot_cache
 from app.workers.celery_app import celery_app
+from app.workers.event_monitor import celery_event_monitor
+from app.workers.task_stats import Window, read_task_stats
 
 logger = logging.getLogger("ayni.api.monitoring")
 router = APIRouter()
@@ -21,7 +26,6 @@ APP_START_TIME = time.time()
 
 
 @router.get("/metrics")
-@cache_result(ttl=60, key_prefix="monitoring_metrics")
 async def get_monitoring_metrics():
     """
     Get comprehensive monitoring metrics for the application.
@@ -32,6 +36,19 @@ async def get_monitoring_metrics():
 
     Returns 503 if critical services (database or Redis) are down.
     """
+    metrics = await collect_monitoring_metrics()
+    # Cache counters are kept per process: read them on every request
+    # rather than serving another worker's numbers from the shared cache
+    return {
+        **metrics,
+        "user_cache": user_snapshot_cache.stats(),
+        "cache": get_cache_stats(),
+    }
+
+
+@cache_result(ttl=60, key_prefix="monitoring_metrics", local_ttl=5)
+async def collect_monitoring_metrics() -> dict[str, Any]:
+    """Collect the shared part of the monitoring metrics, cached for 60s."""
     try:
         # Calculate uptime
         uptime_seconds = int(time.time() - APP_START_TIME)
@@ -87,6 +104,31 @@ async def check_services_health() -> dict:
         services["database"] = {"status": "unhealthy", "error": str(e)}
         all_healthy = False
 
+    # Check read replica (ReadSessionDep routes fail without it)
+    if replica_engine is not None:
+        try:
+            start = time.time()
+            async with replica_engine.begin() as conn:
+                result = await conn.execute(
+                    text(
+                        "SELECT EXTRACT(EPOCH FROM "
+                        "now() - pg_last_xact_replay_timestamp())"
+                    )
+                )
+                lag = result.scalar()
+            latency_ms = round((time.time() - start) * 1000, 2)
+            services["database_replica"] = {
+                "status": "healthy",
+                "latency_ms": latency_ms,
+                # Age of the last replayed transaction: also grows while the
+                # primary is idle; None until one has been replayed
+                "replication_lag_seconds": None if lag is None else float(lag),
+            }
+        except Exception as e:
+            logger.error("Replica health check failed", extra={"error": str(e)})
+            services["database_replica"] = {"status": "unhealthy", "error": str(e)}
+            all_healthy = False
+
     # Check Redis
     try:
         start = time.time()
@@ -103,26 +145,13 @@ async def check_services_health() -> dict:
 
 
 async def get_celery_metrics() -> dict:
-    """Get Celery task metrics using inspect API."""
+    """Get Celery task metrics from the event stream snapshot."""
     try:
-        # Get Celery inspector
-        inspect = celery_app.control.inspect()
-
-        # Get active tasks
-        active_tasks = inspect.active() or {}
-        active_count = sum(len(tasks) for tasks in active_tasks.values())
-
-        # Get scheduled tasks
-        scheduled_tasks = inspect.scheduled() or {}
-        scheduled_count = sum(len(tasks) for tasks in scheduled_tasks.values())
-
-        # Get reserved tasks (queued but not started)
-        reserved_tasks = inspect.reserved() or {}
-        reserved_count = sum(len(tasks) for tasks in reserved_tasks.values())
-
-        # Get worker stats
-        stats = inspect.stats() or {}
-        active_workers = len(stats)
+        snapshot = celery_event_monitor.snapshot()
+        active_count = _count_tasks(snapshot["active"])
+        scheduled_count = _count_tasks(snapshot["scheduled"])
+        reserved_count = _count_tasks(snapshot["reserved"])
+        active_workers = len(snapshot["workers"])
 
         # Calculate task counts for last 24 hours (approximation using Redis)
         completed_24h, failed_24h = await get_task_counts_24h()
@@ -134,6 +163,7 @@ async def get_celery_metrics() -> dict:
             "active_workers": active_workers,
             "completed_24h": completed_24h,
             "failed_24h": failed_24h,
+            "event_stream_connected": snapshot["connected"],
         }
 
     except Exception as e:
@@ -149,61 +179,83 @@ async def get_celery_metrics() -> dict:
         }
 
 
+def _count_tasks(per_worker: dict[str, list[Any]]) -> int:
+    return sum(len(tasks) for tasks in per_worker.values())
+
+
 async def get_task_counts_24h() -> tuple[int, int]:
-    """
-    Get completed and failed task counts for the last 24 hours.
+    """Get completed and failed task counts for the last 24 hours.
 
-    This is an approximation using Redis result backend.
-    For production, consider using a time-series database.
+    Read from the hourly task outcome buckets (see app.workers.task_stats).
     """
     try:
-        _ = await RedisClient.get_client()
-
-        # Get task IDs from the last 24 hours (stored in Redis result backend)
-        # This is a simplified implementation
-        # In production, you'd want to track task completion in a time-series DB
-
-        completed = 0
-        failed = 0
-
-        # For MVP, return placeholder values
-        # TODO: Implement proper task tracking with time-series data
-        return completed, failed
+        stats = await read_task_stats("24h")
+        return stats["completed"], stats["failed"]
 
     except Exception as e:
         logger.warning("Failed to get task counts", extra={"error": str(e)})
         return 0, 0
 
 
+@router.get("/slow-queries", dependencies=[Depends(get_current_active_superuser)])
+async def get_slow_queries() -> dict[str, Any]:
+    """
+    Get recent slow database queries (superuser only).
+
+    Returns:
+        Threshold and buffered slow queries, newest first, with normalized
+        SQL, parameter types, tenant, duration and EXPLAIN plan if captured.
+    """
+    return {
+        "threshold_ms": slow_query_log.threshold_ms,
+        "explain_enabled": slow_query_log.explain,
+        "queries": slow_query_log.entries(),
+    }
+
+
 @router.get("/celery/tasks")
 async def get_celery_tasks():
     """
     Get current Celery task status from all workers.
 
+    Served from the snapshot kept by the Celery event monitor, so it does
+    not wait on workers; `updated_at` is when the snapshot was taken.
+
     Returns:
         Active, scheduled, and reserved tasks from all Celery workers.
     """
-    try:
-        inspect = celery_app.control.inspect()
+    snapshot = celery_event_monitor.snapshot()
+    return {
+        "workers": list(snapshot["workers"]),
+        "active_tasks": snapshot["active"],
+        "scheduled_tasks": snapshot["scheduled"],
+        "reserved_tasks": snapshot["reserved"],
+        "worker_stats": snapshot["workers"],
+        "event_stream_connected": snapshot["connected"],
+        "updated_at": snapshot["updated_at"],
+    }
+
+
+@router.get("/celery/task-stats")
+async def get_celery_task_stats(window: Window = "24h") -> dict[str, Any]:
+    """
+    Get task outcome counts and runtime percentiles over a time window.
 
-        active = inspect.active() or {}
-        scheduled = inspect.scheduled() or {}
-        reserved = inspect.reserved() or {}
-        stats = inspect.stats() or {}
+    Args:
+        window: "1h" (minute buckets), "24h" or "7d" (hour buckets)
 
-        return {
-            "workers": list(stats.keys()),
-            "active_tasks": active,
-            "scheduled_tasks": scheduled,
-            "reserved_tasks": reserved,
-            "worker_stats": stats,
-        }
+    Returns:
+        Completed, failed and retried totals, and per task name the same
+        counts with runtime mean and p50/p95/p99 in milliseconds.
+    """
+    try:
+        return await read_task_stats(window)
 
     except Exception as e:
-        logger.error("Failed to get Celery tasks", extra={"error": str(e)})
+        logger.error("Failed to get task stats", extra={"error": str(e)})
         raise HTTPException(
             status_code=500,
-            detail="Failed to retrieve Celery task status",
+            detail="Failed to retrieve task statistics",
         ) from e
 
 
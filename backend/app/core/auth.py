@@ -16,22 +16,15 @@ from sqlmodel.ext.asyncio.session import AsyncSession
 from app.core.config import settings
 from app.core.db import get_async_session
 from app.core.security import ALGORITHM
+from app.core.user_cache import UserSnapshot, user_snapshot_cache
 from app.models import TokenPayload, User
 
 # OAuth2 scheme for token authentication
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_STR}/auth/login")
 
 
-async def get_current_user(
-    session: AsyncSession = Depends(get_async_session),
-    token: str = Depends(oauth2_scheme),
-) -> User:
-    """
-    Get current authenticated user from JWT token.
-
-    This dependency validates the JWT token and returns the user.
-    Raises 401 if token is invalid or user not found.
-    """
+def _get_token_user_id(token: str) -> uuid.UUID:
+    """Validate the JWT and return the user ID, raising 401 if invalid."""
     try:
         payload = jwt.decode(token, settings.JWT_SECRET, algorithms=[ALGORITHM])
         token_data = TokenPayload(**payload)
@@ -46,8 +39,21 @@ async def get_current_user(
             detail="Could not validate credentials",
         )
 
+    return uuid.UUID(token_data.sub)
+
+
+async def get_current_user(
+    session: AsyncSession = Depends(get_async_session),
+    token: str = Depends(oauth2_scheme),
+) -> User:
+    """
+    Get current authenticated user from JWT token.
+
+    This dependency validates the JWT token and returns the user.
+    Raises 401 if token is invalid or user not found.
+    """
     # Get user from database
-    user_id = uuid.UUID(token_data.sub)
+    user_id = _get_token_user_id(token)
     result = await session.execute(select(User).where(User.id == user_id))
     user = result.scalar_one_or_none()
 
@@ -75,6 +81,33 @@ async def get_current_active_user(
     return current_user
 
 
+async def get_current_active_user_snapshot(
+    session: AsyncSession = Depends(get_async_session),
+    token: str = Depends(oauth2_scheme),
+) -> UserSnapshot:
+    """
+    Get cached snapshot of the current active user.
+
+    Served from the user snapshot cache, so the user query only runs on a miss.
+    Use for routes that need identity and status flags but not profile fields.
+    Raises 401 if token is invalid, 404 if user not found, 400 if inactive.
+    """
+    user_id = _get_token_user_id(token)
+    snapshot = await user_snapshot_cache.get(user_id, session)
+
+    if not snapshot:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User not found",
+        )
+    if not snapshot.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Inactive user",
+        )
+    return snapshot
+
+
 async def get_current_verified_user(
     current_user: User = Depends(get_current_user),
 ) -> User:
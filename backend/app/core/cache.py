@@ -2,21 +2,118 @@
 
 Provides decorator-based caching with:
 - TTL-based expiration
+- Optional in-process L1 tier in front of Redis (see app.core.local_cache)
+- Stampede protection: single-flight per process, a Redis lock across
+  processes and optional stale-while-revalidate
 - Tenant-aware cache keys for data isolation
-- Cache invalidation helpers
-- Hit/miss logging for monitoring
+- Batched multi-key reads for fan-out endpoints (`decorated.many(...)`)
+- Tag-based invalidation (tenant, key prefix and declared kwargs), broadcast
+  to every worker
+- Hit/miss logging and L1/L2/miss counters for monitoring
 """
+import asyncio
 import functools
 import hashlib
+import inspect
 import json
 import logging
-from collections.abc import Callable
+import time
+import typing
+import uuid
+import warnings
+from collections.abc import (
+    Callable,
+    Mapping,
+    MutableMapping,
+    MutableSequence,
+    MutableSet,
+    Sequence,
+)
+from dataclasses import asdict, dataclass
+from datetime import date
+from decimal import Decimal
+from enum import Enum
 from typing import Any
 
+from redis.exceptions import RedisError, ResponseError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session as SASession
+
+from app.core.cache_codecs import CacheCodecError, PayloadSerializer
+from app.core.config import settings
+from app.core.local_cache import InvalidationBus, LocalCache
 from app.core.redis import RedisClient
 
 logger = logging.getLogger(__name__)
 
+LOCK_PREFIX = "cache_lock"
+LOCK_POLL_INTERVAL = 0.05
+TAG_PREFIX = "cache_tag"
+# Members read per SSCAN and keys removed per pipelined UNLINK
+INVALIDATION_CHUNK_SIZE = 500
+
+# Delete the lock only if it still holds our token (the lease may have expired
+# and been taken over by another process)
+_RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+# In-flight computations and background refreshes in this process, by cache key
+_inflight: dict[str, asyncio.Task[Any]] = {}
+_refreshing: dict[str, asyncio.Task[Any]] = {}
+
+
+@dataclass
+class CacheStats:
+    """Lookup counters for one cache_result decorator."""
+
+    l1_hits: int = 0
+    l2_hits: int = 0
+    misses: int = 0
+    stale_hits: int = 0
+
+
+_cache_stats: dict[str, CacheStats] = {}
+
+
+def get_cache_stats() -> dict[str, dict[str, Any]]:
+    """L1 hit, L2 (Redis) hit and miss counts per cached function.
+
+    Returns:
+        dict: Counters keyed by "{key_prefix}:{function_name}"
+    """
+    stats: dict[str, dict[str, Any]] = {}
+    for name, counters in _cache_stats.items():
+        lookups = counters.l1_hits + counters.l2_hits + counters.misses
+        hits = lookups - counters.misses
+        stats[name] = {
+            **asdict(counters),
+            "hit_ratio": round(hits / lookups, 4) if lookups else 0.0,
+        }
+    return stats
+
+
+def _hash_arguments(payload: str) -> str:
+    """64-bit blake2b digest of the serialized arguments (16 hex chars).
+
+    blake2b is in the stdlib, so every worker derives identical keys without
+    an optional dependency such as xxhash.
+    """
+    return hashlib.blake2b(payload.encode(), digest_size=8).hexdigest()
+
+
+def _key_prefix(function_name: str, key_prefix: str) -> str:
+    return f"{key_prefix}:{function_name}" if key_prefix else function_name
+
+
+def _with_tenant(static_prefix: str, tenant_id: int | None, args_hash: str) -> str:
+    if tenant_id is None:
+        return f"{static_prefix}:{args_hash}"
+    return f"{static_prefix}:tenant_{tenant_id}:{args_hash}"
+
 
 def _generate_cache_key(
     function_name: str,
@@ -29,6 +126,9 @@ def _generate_cache_key(
 
     Cache key format: {key_prefix}:{function_name}:{tenant_id}:{args_hash}
 
+    This is the key used by cache_result for functions that do not declare
+    key_args: every positional and keyword argument is serialized.
+
     Args:
         function_name: Name of the cached function
         key_prefix: Optional prefix for grouping related caches
@@ -41,76 +141,410 @@ def _generate_cache_key(
     """
     # Create stable hash of arguments
     args_str = json.dumps({"args": args, "kwargs": kwargs}, sort_keys=True, default=str)
-    args_hash = hashlib.md5(args_str.encode()).hexdigest()[:16]
+    return _with_tenant(
+        _key_prefix(function_name, key_prefix), tenant_id, _hash_arguments(args_str)
+    )
+
+
+# Values allowed in declared key_args: their repr() is stable across processes
+_KEY_SCALARS = (str, int, float, bool, type(None), uuid.UUID, date, Decimal, Enum)
+_UNHASHABLE_ORIGINS = (MutableMapping, MutableSequence, MutableSet)
+
+
+def _is_session_annotation(annotation: Any) -> bool:
+    # Unwrap Optional[...] / X | None
+    candidates = typing.get_args(annotation) or (annotation,)
+    return any(
+        isinstance(candidate, type) and issubclass(candidate, (SASession, AsyncSession))
+        for candidate in candidates
+    )
+
+
+def _is_unhashable_annotation(annotation: Any) -> bool:
+    origin = typing.get_origin(annotation) or annotation
+    return isinstance(origin, type) and issubclass(origin, _UNHASHABLE_ORIGINS)
+
+
+class CacheKeyBuilder:
+    """Builds cache keys for one decorated function.
+
+    The static "{key_prefix}:{function_name}" part is computed once. With
+    `key_args`, only the named parameters are bound and hashed (in declared
+    order, via repr), which is much cheaper than serializing every argument
+    and ignores values such as sessions that would make keys unstable.
+    Problems are reported when the decorator is applied, not at request time.
+    """
+
+    def __init__(
+        self,
+        func: Callable[..., Any],
+        key_prefix: str,
+        tenant_key: str | None,
+        key_args: Sequence[str] | None,
+    ) -> None:
+        self.function_name = func.__name__
+        self.key_prefix = key_prefix
+        self.static_prefix = _key_prefix(func.__name__, key_prefix)
+        self.tenant_key = tenant_key
+        self.key_args = tuple(key_args) if key_args is not None else None
+
+        signature = inspect.signature(func)
+        try:
+            hints = typing.get_type_hints(func)
+        except Exception:
+            hints = {}
+        name = func.__qualname__
+
+        if self.key_args is None:
+            sessions = [
+                param
+                for param in signature.parameters
+                if _is_session_annotation(hints.get(param))
+            ]
+            if sessions:
+                raise TypeError(
+                    f"@cache_result on {name}: parameter(s) {sessions} are database "
+                    "sessions and would make every key unique; declare key_args"
+                )
+            self.signature = None
+            return
+
+        self.signature = signature
+        for arg in (*self.key_args, *([tenant_key] if tenant_key else [])):
+            if arg not in signature.parameters:
+                raise TypeError(f"@cache_result on {name}: no parameter named '{arg}'")
+        for arg in self.key_args:
+            annotation = hints.get(arg)
+            if _is_session_annotation(annotation):
+                raise TypeError(
+                    f"@cache_result on {name}: key arg '{arg}' is a database session"
+                )
+            if _is_unhashable_annotation(annotation):
+                raise TypeError(
+                    f"@cache_result on {name}: key arg '{arg}' is unhashable "
+                    f"({annotation}); pass a tuple or scalar instead"
+                )
+
+    def build(
+        self, args: tuple[Any, ...], kwargs: Mapping[str, Any]
+    ) -> tuple[str, int | None, Mapping[str, Any]]:
+        """Build the key for one call.
+
+        Returns:
+            tuple: (cache_key, tenant_id, named arguments used for tags)
+        """
+        if self.signature is None:
+            tenant_id = kwargs.get(self.tenant_key) if self.tenant_key else None
+            cache_key = _generate_cache_key(
+                function_name=self.function_name,
+                key_prefix=self.key_prefix,
+                tenant_id=tenant_id,
+                args=args,
+                kwargs=dict(kwargs),
+            )
+            return cache_key, tenant_id, kwargs
+
+        bound = self.signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        named = bound.arguments
+        tenant_id = named[self.tenant_key] if self.tenant_key else None
+        key_args = self.key_args or ()
+        values = tuple(named[arg] for arg in key_args)
+        for arg, value in zip(key_args, values, strict=True):
+            if not isinstance(value, _KEY_SCALARS) and not (
+                isinstance(value, tuple)
+                and all(isinstance(item, _KEY_SCALARS) for item in value)
+            ):
+                raise TypeError(
+                    f"Cache key arg '{arg}' of {self.function_name} has "
+                    f"unsupported type {type(value).__name__}"
+                )
+        args_hash = _hash_arguments(repr(values))
+        return _with_tenant(self.static_prefix, tenant_id, args_hash), tenant_id, named
+
+
+async def _acquire_lock(redis: Any, cache_key: str, lease: float) -> str | None:
+    """Try to take the cross-process compute lock for a key.
+
+    Returns:
+        str | None: Lock token if acquired, None if another process holds it
+    """
+    token = uuid.uuid4().hex
+    acquired = await redis.set(
+        f"{LOCK_PREFIX}:{cache_key}", token, nx=True, px=int(lease * 1000)
+    )
+    return token if acquired else None
+
+
+async def _release_lock(redis: Any, cache_key: str, token: str) -> None:
+    """Release the compute lock only if this caller still owns it."""
+    try:
+        await redis.eval(_RELEASE_LOCK_SCRIPT, 1, f"{LOCK_PREFIX}:{cache_key}", token)
+    except Exception as e:
+        logger.warning(f"Failed to release cache lock for {cache_key}: {e}")
+
+
+def _track(
+    registry: dict[str, asyncio.Task[Any]], key: str, task: asyncio.Task[Any]
+) -> None:
+    """Register a task under a key until it finishes."""
+    registry[key] = task
+
+    def _done(finished: asyncio.Task[Any]) -> None:
+        if registry.get(key) is finished:
+            del registry[key]
+
+    task.add_done_callback(_done)
+
+
+def _running(
+    registry: dict[str, asyncio.Task[Any]], key: str
+) -> asyncio.Task[Any] | None:
+    """Return the unfinished task for a key on the running loop, if any."""
+    task = registry.get(key)
+    if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+        return None
+    return task
 
-    # Build key with tenant isolation
-    parts = [key_prefix, function_name] if key_prefix else [function_name]
-    if tenant_id is not None:
-        parts.append(f"tenant_{tenant_id}")
-    parts.append(args_hash)
 
-    return ":".join(parts)
+def _log_refresh_failure(task: asyncio.Task[Any]) -> None:
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning(f"Background cache refresh failed: {task.exception()}")
+
+
+def cache_tag(kind: str, value: Any) -> str:
+    """Build a cache tag name.
+
+    cache_result tags every key with "tenant:<id>" (when tenant_key is set),
+    "prefix:<key_prefix>" (when key_prefix is set) and "<kwarg>:<value>" for
+    each kwarg listed in tag_kwargs.
+
+    Example:
+        cache_tag("tenant", 123)            # "tenant:123"
+        cache_tag("prefix", "analytics")    # "prefix:analytics"
+        cache_tag("period", "2024-01")      # "period:2024-01"
+    """
+    return f"{kind}:{value}"
+
+
+async def _store(
+    redis: Any, entries: Sequence[tuple[str, bytes, Sequence[str]]], ttl: int
+) -> None:
+    """Write (key, payload, tags) entries and their tag sets in one round-trip."""
+    async with redis.pipeline(transaction=False) as pipe:
+        for cache_key, encoded, tags in entries:
+            pipe.setex(cache_key, ttl, encoded)
+            for tag in tags:
+                tag_key = f"{TAG_PREFIX}:{tag}"
+                pipe.sadd(tag_key, cache_key)
+                # The tag set lives as long as its longest-lived member
+                pipe.expire(tag_key, ttl, nx=True)
+                pipe.expire(tag_key, ttl, gt=True)
+        await pipe.execute()
 
 
 def cache_result(
     ttl: int = 3600,
     key_prefix: str = "",
     tenant_key: str | None = None,
+    local_ttl: float | None = None,
+    local_max_entries: int = 1024,
+    stale_ttl: int = 0,
+    lock_lease: float = 10.0,
+    tag_kwargs: Sequence[str] = (),
+    codec: str | None = None,
+    compression: str | None = None,
+    key_args: Sequence[str] | None = None,
 ) -> Callable:
     """Decorator to cache function results with TTL and tenant isolation.
 
+    Concurrent misses for the same key run the function once: callers in the
+    same process share one in-flight computation, and processes coordinate
+    through a Redis lock so only the lock holder computes while the others
+    wait for its result.
+
     Args:
         ttl: Time-to-live in seconds (default: 3600 = 1 hour)
         key_prefix: Optional prefix for grouping related caches (e.g., "analytics")
         tenant_key: Kwarg name containing tenant_id (default: None for non-tenant data)
+        local_ttl: Enables the in-process L1 tier with this TTL in seconds
+            (default: None = Redis only). Keep it short: it bounds staleness
+            if an invalidation message is lost.
+        local_max_entries: L1 capacity per tenant partition
+        stale_ttl: Stale-while-revalidate window in seconds. For this long
+            after `ttl`, the old value is served while one caller refreshes
+            it in the background (default: 0 = disabled)
+        lock_lease: Seconds the cross-process compute lock is held before it
+            expires, in case the holder dies mid-computation
+        tag_kwargs: Kwarg names whose values become invalidation tags
+            (e.g. ("location_id", "period")); see cache_tag
+        codec: Payload codec override (default: settings.CACHE_CODEC)
+        compression: Compression override for payloads of at least
+            CACHE_COMPRESS_MIN_BYTES (default: settings.CACHE_COMPRESSION)
+        key_args: Parameter names that identify a result (default: None =
+            hash every argument). Declared args must be scalars or tuples of
+            scalars; sessions and mutable containers are rejected when the
+            decorator is applied. Required if the function takes a session.
 
     Returns:
-        Decorated function with caching
+        Decorated function with caching. `func.many(calls, concurrency)`
+        resolves a batch of keyword-argument calls with one MGET.
 
     Example:
-        @cache_result(ttl=3600, key_prefix="analytics", tenant_key="tenant_id")
-        async def get_dashboard_data(tenant_id: int, location_id: int, period: str):
+        @cache_result(
+            ttl=3600,
+            key_prefix="analytics",
+            tenant_key="tenant_id",
+            key_args=("location_id", "period"),
+        )
+        async def get_dashboard_data(
+            session: AsyncSession, tenant_id: int, location_id: int, period: str
+        ):
             # Expensive database query
             return data
+
+        cells = await get_dashboard_data.many(
+            [
+                {"session": session, "tenant_id": 1, "location_id": loc, "period": "2024-01"}
+                for loc in ids
+            ],
+            concurrency=4,
+        )
     """
 
     def decorator(func: Callable) -> Callable:
-        @functools.wraps(func)
-        async def wrapper(*args: Any, **kwargs: Any) -> Any:
-            # Extract tenant_id if specified
-            tenant_id = kwargs.get(tenant_key) if tenant_key else None
-
-            # Generate cache key
-            cache_key = _generate_cache_key(
-                function_name=func.__name__,
-                key_prefix=key_prefix,
-                tenant_id=tenant_id,
-                args=args,
-                kwargs=kwargs,
-            )
-
+        key_builder = CacheKeyBuilder(func, key_prefix, tenant_key, key_args)
+        stats = _cache_stats.setdefault(key_builder.static_prefix, CacheStats())
+
+        local: LocalCache | None = None
+        if local_ttl:
+            local = LocalCache(max_entries=local_max_entries, ttl=local_ttl)
+            InvalidationBus.register(local)
+
+        # Built at decoration time so an unavailable codec fails at import
+        serializer = PayloadSerializer(
+            codec=codec or settings.CACHE_CODEC,
+            compression=compression or settings.CACHE_COMPRESSION,
+            compress_min_bytes=settings.CACHE_COMPRESS_MIN_BYTES,
+        )
+
+        def pack(result: Any) -> bytes:
+            if stale_ttl:
+                envelope = {"value": result, "fresh_until": time.time() + ttl}
+                return serializer.encode(envelope)
+            return serializer.encode(result)
+
+        def unpack(raw: bytes) -> tuple[Any, bool]:
+            """Decode a stored payload into (value, is_fresh)."""
+            data = serializer.decode(raw)
+            if stale_ttl:
+                return data["value"], data["fresh_until"] > time.time()
+            return data, True
+
+        def usable(raw: bytes) -> bool:
+            """Whether a stored payload can be served as a fresh value."""
             try:
-                # Try to get from cache
-                redis = await RedisClient.get_client()
-                cached_value = await redis.get(cache_key)
+                return unpack(raw)[1]
+            except CacheCodecError:
+                return False
+
+        def tags_for(tenant_id: int | None, kwargs: Mapping[str, Any]) -> list[str]:
+            tags = [f"{name}:{kwargs[name]}" for name in tag_kwargs if name in kwargs]
+            if tenant_id is not None:
+                tags.append(cache_tag("tenant", tenant_id))
+            if key_prefix:
+                tags.append(cache_tag("prefix", key_prefix))
+            return tags
+
+        async def load(
+            cache_key: str,
+            tenant_id: int | None,
+            tags: Sequence[str],
+            args: tuple[Any, ...],
+            kwargs: Mapping[str, Any],
+            wait: bool,
+            use_local: bool = False,
+            generation: int = 0,
+        ) -> bytes | None:
+            """Compute and store the value while holding the Redis lock.
+
+            With wait=False (background refresh) give up if another
+            process holds the lock.
+            """
+            redis = await RedisClient.get_binary_client()
+            token = await _acquire_lock(redis, cache_key, lock_lease)
+            while token is None:
+                if not wait:
+                    return None
+                await asyncio.sleep(LOCK_POLL_INTERVAL)
+                raw = await redis.get(cache_key)
+                if raw is not None and usable(raw):
+                    return bytes(raw)
+                # Lease expired without a value (holder died): take over
+                token = await _acquire_lock(redis, cache_key, lock_lease)
 
-                if cached_value is not None:
-                    logger.info(f"Cache hit: {cache_key}")
-                    return json.loads(cached_value)
+            try:
+                # Another process may have stored it before we got the lock
+                raw = await redis.get(cache_key)
+                if raw is not None and usable(raw):
+                    return bytes(raw)
 
-                # Cache miss - execute function
-                logger.info(f"Cache miss: {cache_key}")
                 result = await func(*args, **kwargs)
-
-                # Store in cache with TTL
-                await redis.setex(
-                    cache_key,
-                    ttl,
-                    json.dumps(result, default=str),
+                encoded = pack(result)
+                try:
+                    await _store(redis, [(cache_key, encoded, tags)], ttl + stale_ttl)
+                except Exception as e:
+                    logger.warning(f"Cache write error for {cache_key}: {e}")
+                if local is not None and use_local:
+                    local.set(tenant_id, cache_key, encoded, ttl, generation)
+                return encoded
+            finally:
+                await _release_lock(redis, cache_key, token)
+
+        def refresh(
+            cache_key: str,
+            tenant_id: int | None,
+            tags: Sequence[str],
+            args: tuple[Any, ...],
+            kwargs: Mapping[str, Any],
+        ) -> None:
+            """Recompute a stale entry in the background, once per key."""
+            if _running(_refreshing, cache_key) is None:
+                task = asyncio.create_task(
+                    load(cache_key, tenant_id, tags, args, kwargs, wait=False)
                 )
+                task.add_done_callback(_log_refresh_failure)
+                _track(_refreshing, cache_key, task)
 
-                return result
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            # Generate cache key (with tenant isolation if tenant_key is set)
+            cache_key, tenant_id, named = key_builder.build(args, kwargs)
+            tags = tags_for(tenant_id, named)
+
+            use_local = False
+            generation = 0
+
+            def serve(raw: bytes) -> Any:
+                value, fresh = unpack(raw)
+                if not fresh:
+                    stats.stale_hits += 1
+                    refresh(cache_key, tenant_id, tags, args, kwargs)
+                return value
+
+            if local is not None:
+                local_value = local.get(tenant_id, cache_key)
+                if local_value is not None:
+                    stats.l1_hits += 1
+                    return serve(local_value)
+                # L1 may only hold entries this process will hear invalidations for
+                use_local = await InvalidationBus.ensure_listening()
+                generation = local.generation
 
+            try:
+                # Try to get from cache
+                redis = await RedisClient.get_binary_client()
+                cached_value = await redis.get(cache_key)
             except Exception as e:
                 # On Redis failure, execute function without caching
                 logger.warning(
@@ -118,13 +552,148 @@ def cache_result(
                 )
                 return await func(*args, **kwargs)
 
+            if cached_value is not None:
+                try:
+                    value = serve(cached_value)
+                except CacheCodecError as e:
+                    # e.g. written by a worker with a codec not installed here
+                    logger.warning(f"Unreadable cache payload for {cache_key}: {e}")
+                else:
+                    stats.l2_hits += 1
+                    logger.info(f"Cache hit: {cache_key}")
+                    if local is not None and use_local:
+                        local.set(tenant_id, cache_key, cached_value, ttl, generation)
+                    return value
+
+            # Cache miss - one computation per key in this process
+            stats.misses += 1
+            logger.info(f"Cache miss: {cache_key}")
+            task = _running(_inflight, cache_key)
+            if task is None:
+                task = asyncio.create_task(
+                    load(
+                        cache_key, tenant_id, tags, args, kwargs,
+                        wait=True, use_local=use_local, generation=generation,
+                    )
+                )
+                _track(_inflight, cache_key, task)
+            try:
+                encoded = await asyncio.shield(task)
+            except RedisError as e:
+                logger.warning(
+                    f"Cache error for {cache_key}: {e}. Executing without cache."
+                )
+                return await func(*args, **kwargs)
+            assert encoded is not None, "waiting loads always return a value"
+            # Every caller decodes its own copy of the shared result
+            return unpack(encoded)[0]
+
+        async def many(
+            calls: Sequence[Mapping[str, Any]], concurrency: int = 1
+        ) -> list[Any]:
+            """Resolve many calls with one MGET and one pipelined write-back.
+
+            Keys are generated exactly as for single calls, so entries are
+            shared with the decorated function. Misses are computed with up
+            to `concurrency` calls in flight; they do not take the
+            cross-process compute lock. Stale entries (stale_ttl) are served
+            and refreshed in the background by the same loader as single calls.
+
+            Args:
+                calls: Keyword arguments for each call, e.g.
+                    [{"tenant_id": 1, "location_id": 5, "period": "2024-01"}, ...]
+                concurrency: Max misses computed at the same time
+
+            Returns:
+                list: Results in the same order as `calls`
+            """
+            keys: list[tuple[int | None, str]] = []
+            named_args: list[Mapping[str, Any]] = []
+            for kwargs in calls:
+                cache_key, tenant_id, named = key_builder.build((), kwargs)
+                keys.append((tenant_id, cache_key))
+                named_args.append(named)
+
+            results: list[Any] = [None] * len(calls)
+            pending: list[int] = []
+            for i, (tenant_id, cache_key) in enumerate(keys):
+                local_value = local.get(tenant_id, cache_key) if local else None
+                if local_value is not None and usable(local_value):
+                    stats.l1_hits += 1
+                    results[i] = unpack(local_value)[0]
+                else:
+                    pending.append(i)
+            if not pending:
+                return results
+
+            use_local = local is not None and await InvalidationBus.ensure_listening()
+            generation = local.generation if local is not None else 0
+
+            redis = None
+            try:
+                redis = await RedisClient.get_binary_client()
+                raws = await redis.mget([keys[i][1] for i in pending])
+            except Exception as e:
+                # On Redis failure, compute every pending value
+                logger.warning(f"Cache error for batch of {len(pending)} keys: {e}")
+                raws = [None] * len(pending)
+
+            misses: list[int] = []
+            for i, raw in zip(pending, raws, strict=True):
+                tenant_id, cache_key = keys[i]
+                try:
+                    value, fresh = unpack(raw) if raw is not None else (None, False)
+                except CacheCodecError:
+                    raw = None
+                if raw is None:
+                    misses.append(i)
+                    continue
+                stats.l2_hits += 1
+                results[i] = value
+                if not fresh:
+                    stats.stale_hits += 1
+                    tags = tags_for(tenant_id, named_args[i])
+                    refresh(cache_key, tenant_id, tags, (), calls[i])
+                elif local is not None and use_local:
+                    local.set(tenant_id, cache_key, raw, ttl, generation)
+            if not misses:
+                return results
+
+            stats.misses += len(misses)
+            logger.info(f"Cache batch: {len(calls)} keys, {len(misses)} misses")
+            semaphore = asyncio.Semaphore(max(1, concurrency))
+
+            async def compute(i: int) -> bytes:
+                async with semaphore:
+                    return pack(await func(**calls[i]))
+
+            encoded = await asyncio.gather(*(compute(i) for i in misses))
+            entries = [
+                (keys[i][1], payload, tags_for(keys[i][0], named_args[i]))
+                for i, payload in zip(misses, encoded, strict=True)
+            ]
+            if redis is not None:
+                try:
+                    await _store(redis, entries, ttl + stale_ttl)
+                except Exception as e:
+                    logger.warning(
+                        f"Cache write error for batch of {len(entries)} keys: {e}"
+                    )
+            for i, payload in zip(misses, encoded, strict=True):
+                tenant_id, cache_key = keys[i]
+                if local is not None and use_local:
+                    local.set(tenant_id, cache_key, payload, ttl, generation)
+                results[i] = unpack(payload)[0]
+            return results
+
+        wrapper.many = many  # type: ignore[attr-defined]
         return wrapper
 
     return decorator
 
 
 async def invalidate_cache(cache_key: str) -> None:
-    """Invalidate a specific cache entry.
+    """Invalidate a specific cache entry in Redis and in every worker's L1.
 
     Args:
         cache_key: The cache key to invalidate
@@ -135,12 +704,92 @@ async def invalidate_cache(cache_key: str) -> None:
         logger.info(f"Cache invalidated: {cache_key}")
     except Exception as e:
         logger.warning(f"Failed to invalidate cache {cache_key}: {e}")
+    await InvalidationBus.publish(key=cache_key)
+
+
+async def _unlink_chunk(redis: Any, keys: list[str]) -> None:
+    """UNLINK a chunk of keys and evict them from every worker's L1."""
+    async with redis.pipeline(transaction=False) as pipe:
+        pipe.unlink(*keys)
+        await pipe.execute()
+    await InvalidationBus.publish(keys=keys)
+
+
+async def invalidate_tags(*tags: str, match_all: bool = False) -> int:
+    """Invalidate every cache entry registered under the given tags.
+
+    Cost is proportional to the size of the tag sets, not the keyspace. Keys
+    are read with SSCAN and removed with pipelined UNLINK in chunks of
+    INVALIDATION_CHUNK_SIZE, so Redis is never blocked by one large command.
+
+    Args:
+        tags: Tag names built with cache_tag()
+        match_all: Only invalidate entries carrying ALL tags (e.g. one
+            tenant's analytics caches) instead of ANY of them
+
+    Returns:
+        int: Number of keys unlinked
+
+    Example:
+        # Invalidate all analytics caches for tenant 123
+        await invalidate_tags(
+            cache_tag("tenant", 123), cache_tag("prefix", "analytics"), match_all=True
+        )
+    """
+    total = 0
+    try:
+        redis = await RedisClient.get_client()
+        tag_keys = [f"{TAG_PREFIX}:{tag}" for tag in tags]
+
+        if match_all:
+            # SINTER walks the smallest set, so one tenant's tag bounds the cost
+            keys = list(await redis.sinter(tag_keys))  # type: ignore[misc]
+            for start in range(0, len(keys), INVALIDATION_CHUNK_SIZE):
+                batch = keys[start : start + INVALIDATION_CHUNK_SIZE]
+                await _unlink_chunk(redis, batch)
+                async with redis.pipeline(transaction=False) as pipe:
+                    for tag_key in tag_keys:
+                        pipe.srem(tag_key, *batch)
+                    await pipe.execute()
+                total += len(batch)
+        else:
+            for tag_key in tag_keys:
+                # Snapshot the set so keys tagged during invalidation land in a
+                # fresh set instead of being dropped unseen
+                purge_key = f"{tag_key}:purge:{uuid.uuid4().hex}"
+                try:
+                    await redis.rename(tag_key, purge_key)
+                except ResponseError:
+                    continue  # Tag has no live keys
+
+                chunk: list[str] = []
+                async for key in redis.sscan_iter(
+                    purge_key, count=INVALIDATION_CHUNK_SIZE
+                ):
+                    chunk.append(key)
+                    if len(chunk) >= INVALIDATION_CHUNK_SIZE:
+                        await _unlink_chunk(redis, chunk)
+                        total += len(chunk)
+                        chunk = []
+                if chunk:
+                    await _unlink_chunk(redis, chunk)
+                    total += len(chunk)
+                await redis.unlink(purge_key)
+
+        logger.info(f"Cache invalidated: {total} keys for tags {list(tags)}")
+    except Exception as e:
+        logger.warning(f"Failed to invalidate cache tags {list(tags)}: {e}")
+    return total
 
 
 async def invalidate_pattern(pattern: str) -> None:
     """Invalidate all cache entries matching a pattern.
 
-    Useful for invalidating all caches for a tenant or key prefix.
+    Deprecated: this walks the whole keyspace with SCAN. Use invalidate_tags(),
+    which only touches the keys registered under a tag. Kept as a fallback
+    for keys written before tagging existed. Keys are unlinked in chunks as
+    they are found rather than collected into one large DELETE. Matching L1
+    entries are evicted in every worker.
 
     Args:
         pattern: Redis key pattern (e.g., "analytics:*:tenant_123:*")
@@ -149,20 +798,29 @@ async def invalidate_pattern(pattern: str) -> None:
         # Invalidate all analytics caches for tenant 123
         await invalidate_pattern("analytics:*:tenant_123:*")
     """
+    warnings.warn(
+        "invalidate_pattern scans the whole keyspace; use invalidate_tags",
+        DeprecationWarning,
+        stacklevel=2,
+    )
     try:
         redis = await RedisClient.get_client()
 
-        # Find all matching keys
-        keys = []
-        async for key in redis.scan_iter(match=pattern):
-            keys.append(key)
-
-        # Delete in batches
-        if keys:
-            await redis.delete(*keys)
-            logger.info(
-                f"Cache invalidated: {len(keys)} keys matching pattern '{pattern}'"
-            )
+        total = 0
+        chunk: list[str] = []
+        async for key in redis.scan_iter(match=pattern, count=INVALIDATION_CHUNK_SIZE):
+            chunk.append(key)
+            if len(chunk) >= INVALIDATION_CHUNK_SIZE:
+                await redis.unlink(*chunk)
+                total += len(chunk)
+                chunk = []
+        if chunk:
+            await redis.unlink(*chunk)
+            total += len(chunk)
+
+        if total:
+            logger.info(f"Cache invalidated: {total} keys matching pattern '{pattern}'")
 
     except Exception as e:
         logger.warning(f"Failed to invalidate cache pattern {pattern}: {e}")
+    await InvalidationBus.publish(pattern=pattern)
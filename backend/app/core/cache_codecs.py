@@ -0,0 +1,202 @@
+"""Serialization codecs for cached payloads.
+
+cache_result stores values as bytes with a one-byte header that identifies
+how they were written:
+
+    header = 0x80 | (compression_id << 3) | codec_id
+
+Codecs: json (stdlib, always available), orjson and msgpack. Compression
+(zstd or lz4) is applied only when the encoded payload reaches a size
+threshold. Any payload can be read by any process that has the codec and
+compressor installed, whatever the writer's settings were, so codec settings
+can be changed during a rolling deploy.
+
+Values written before the header existed are plain JSON text. Their first
+byte is ASCII (< 0x80), which is how they are told apart from headed
+payloads.
+
+orjson, msgpack, zstandard and lz4 are optional (`pip install app[cache]`);
+codecs whose library is missing are not registered.
+"""
+import json
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    # orjson and zstandard ship type hints, so unlike the others they are
+    # not Any to mypy
+    orjson = None  # type: ignore[assignment, unused-ignore]
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional dependency
+    msgpack = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None  # type: ignore[assignment, unused-ignore]
+
+try:
+    import lz4.frame as lz4_frame
+except ImportError:  # pragma: no cover - optional dependency
+    lz4_frame = None
+
+HEADER_FLAG = 0x80
+
+
+class CacheCodecError(ValueError):
+    """Raised when a payload cannot be encoded or decoded."""
+
+
+@dataclass(frozen=True)
+class Codec:
+    """Object <-> bytes serializer. `id` must fit in 3 bits (1-7)."""
+
+    id: int
+    name: str
+    dumps: Callable[[Any], bytes]
+    loads: Callable[[bytes], Any]
+
+
+@dataclass(frozen=True)
+class Compressor:
+    """bytes <-> bytes compressor. `id` must fit in 4 bits (1-15)."""
+
+    id: int
+    name: str
+    compress: Callable[[bytes], bytes]
+    decompress: Callable[[bytes], bytes]
+
+
+CODECS: dict[str, Codec] = {}
+COMPRESSORS: dict[str, Compressor] = {}
+_codecs_by_id: dict[int, Codec] = {}
+_compressors_by_id: dict[int, Compressor] = {}
+
+
+def register_codec(codec: Codec) -> None:
+    """Make a codec available for encoding (by name) and decoding (by id)."""
+    if not 1 <= codec.id <= 7:
+        raise ValueError(f"Codec id must be 1-7, got {codec.id}")
+    CODECS[codec.name] = codec
+    _codecs_by_id[codec.id] = codec
+
+
+def register_compressor(compressor: Compressor) -> None:
+    """Make a compressor available for encoding (by name) and decoding (by id)."""
+    if not 1 <= compressor.id <= 15:
+        raise ValueError(f"Compressor id must be 1-15, got {compressor.id}")
+    COMPRESSORS[compressor.name] = compressor
+    _compressors_by_id[compressor.id] = compressor
+
+
+def _json_dumps(value: Any) -> bytes:
+    return json.dumps(value, default=str).encode()
+
+
+register_codec(Codec(1, "json", _json_dumps, json.loads))
+
+if orjson is not None:
+    register_codec(
+        Codec(
+            2,
+            "orjson",
+            lambda value: orjson.dumps(
+                value, default=str, option=orjson.OPT_NON_STR_KEYS
+            ),
+            orjson.loads,
+        )
+    )
+
+if msgpack is not None:
+    register_codec(
+        Codec(
+            3,
+            "msgpack",
+            lambda value: msgpack.packb(value, default=str, use_bin_type=True),
+            lambda raw: msgpack.unpackb(raw, raw=False, strict_map_key=False),
+        )
+    )
+
+if zstandard is not None:
+    register_compressor(
+        Compressor(
+            1,
+            "zstd",
+            zstandard.ZstdCompressor(level=3).compress,
+            zstandard.ZstdDecompressor().decompress,
+        )
+    )
+
+if lz4_frame is not None:
+    register_compressor(
+        Compressor(2, "lz4", lz4_frame.compress, lz4_frame.decompress)
+    )
+
+
+class PayloadSerializer:
+    """Encodes values with one codec and optional compression.
+
+    Decoding accepts every registered codec and compressor plus legacy
+    headerless JSON.
+    """
+
+    def __init__(
+        self,
+        codec: str = "json",
+        compression: str = "none",
+        compress_min_bytes: int = 1024,
+    ) -> None:
+        if codec not in CODECS:
+            raise ValueError(
+                f"Cache codec '{codec}' is not available (installed: {sorted(CODECS)})"
+            )
+        if compression != "none" and compression not in COMPRESSORS:
+            raise ValueError(
+                f"Cache compression '{compression}' is not available "
+                f"(installed: {sorted(COMPRESSORS)})"
+            )
+        self.codec = CODECS[codec]
+        self.compressor = COMPRESSORS.get(compression)
+        self.compress_min_bytes = compress_min_bytes
+
+    def encode(self, value: Any) -> bytes:
+        body = self.codec.dumps(value)
+        compression_id = 0
+        if self.compressor is not None and len(body) >= self.compress_min_bytes:
+            body = self.compressor.compress(body)
+            compression_id = self.compressor.id
+        header = HEADER_FLAG | (compression_id << 3) | self.codec.id
+        return bytes([header]) + body
+
+    def decode(self, raw: bytes | str) -> Any:
+        if isinstance(raw, str):
+            raw = raw.encode()
+        if not raw or not raw[0] & HEADER_FLAG:
+            # Written before codec headers existed
+            try:
+                return json.loads(raw)
+            except ValueError as e:
+                raise CacheCodecError(f"Corrupt legacy JSON cache payload: {e}") from e
+
+        header = raw[0]
+        codec = _codecs_by_id.get(header & 0x07)
+        compression_id = (header >> 3) & 0x0F
+        compressor = _compressors_by_id.get(compression_id)
+        if codec is None or (compression_id and compressor is None):
+            raise CacheCodecError(
+                f"Unsupported cache payload header 0x{header:02x}; "
+                "is the codec library installed?"
+            )
+        body = raw[1:]
+        try:
+            if compressor is not None:
+                body = compressor.decompress(body)
+            return codec.loads(body)
+        except Exception as e:
+            # Each library raises its own error types for corrupt input
+            raise CacheCodecError(f"Corrupt {codec.name} cache payload: {e}") from e
@@ -64,9 +64,86 @@ class Settings(BaseSettings):
     POSTGRES_PASSWORD: str = ""
     POSTGRES_DB: str = ""
 
+    # Database connection pool (see app.core.db_pool)
+    # Profile: "api" (web workers), "celery" (task workers), "script" (one-off
+    # commands); the DB_* values below override the profile when set
+    DB_POOL_PROFILE: Literal["api", "celery", "script"] = "api"
+    DB_POOL_SIZE: int | None = None
+    DB_MAX_OVERFLOW: int | None = None
+    DB_POOL_TIMEOUT: float | None = None
+    DB_POOL_RECYCLE: int | None = None
+    # Ping a connection on checkout only if it sat idle this long
+    DB_POOL_IDLE_CHECK_SECONDS: float = 30.0
+    # POSTGRES_SERVER/POSTGRES_PORT point at PgBouncer in transaction pooling
+    # mode: disables server-side prepared statement reuse
+    DB_PGBOUNCER: bool = False
+
+    # Optional streaming read replica for ReadSessionDep routes (see
+    # app.core.read_replica); same user, password and database as the primary
+    POSTGRES_REPLICA_SERVER: str | None = None
+    POSTGRES_REPLICA_PORT: int | None = None
+    # After a user writes, their reads stay on the primary this long
+    READ_REPLICA_STICKY_SECONDS: float = 5.0
+
     # Redis and Celery configuration
     REDIS_URL: str = "redis://localhost:6379/0"
 
+    # Celery worker/task snapshot for the monitoring endpoints, built from the
+    # Celery event stream in a background thread (see app.workers.event_monitor)
+    CELERY_EVENT_MONITOR_ENABLED: bool = True
+    CELERY_EVENT_MONITOR_INTERVAL_SECONDS: float = 1.0
+    # Per-minute/hour task outcome and runtime buckets written by the workers
+    # (see app.workers.task_stats)
+    TASK_STATS_ENABLED: bool = True
+    # Expired refresh tokens are deleted in chunks of this many rows, one
+    # transaction per chunk (see app.workers.tokens)
+    TOKEN_CLEANUP_BATCH_SIZE: int = 5000
+
+    # Password hashing pool - bcrypt (cost 12, ~250ms) runs off the event loop
+    # "thread" is enough because bcrypt releases the GIL; "process" isolates it fully
+    PASSWORD_HASH_EXECUTOR: Literal["thread", "process"] = "thread"
+    PASSWORD_HASH_WORKERS: int = 4
+    # Max hash/verify calls running or queued per process before returning 503
+    PASSWORD_HASH_MAX_PENDING: int = 64
+
+    # Authenticated user snapshot cache (skips the user SELECT per request)
+    # Local TTL bounds how long other workers may serve a stale snapshot
+    USER_CACHE_TTL_SECONDS: int = 300
+    USER_CACHE_LOCAL_TTL_SECONDS: int = 10
+    USER_CACHE_MAX_ENTRIES: int = 10_000
+
+    # cache_result payload format (see app.core.cache_codecs)
+    # Codec: json | orjson | msgpack; compression: none | zstd | lz4
+    # Non-json options need the optional "cache" extra installed
+    CACHE_CODEC: str = "json"
+    CACHE_COMPRESSION: str = "none"
+    CACHE_COMPRESS_MIN_BYTES: int = 1024
+
+    # API logging pipeline (see app.core.logging_config)
+    # Sampling maps logger name -> fraction of INFO records kept,
+    # e.g. {"ayni.api": 0.1}; WARNING and above are always kept
+    LOG_LEVEL: str = "INFO"
+    LOG_FORMAT: Literal["json", "text"] = "json"
+    LOG_SAMPLING: dict[str, float] = {}
+    LOG_QUEUE_SIZE: int = 10_000
+
+    # Per-route request histograms (see app.core.metrics), exported at /metrics
+    # Each worker adds its counts to Redis this often
+    METRICS_FLUSH_INTERVAL_SECONDS: float = 5.0
+
+    # Query budgets / N+1 detection (see app.core.query_budget)
+    # "raise" fails over-budget requests (tests), "warn" logs them (staging)
+    QUERY_BUDGET_MODE: Literal["off", "warn", "raise"] = "off"
+    # Default max executions of one statement shape per request
+    QUERY_BUDGET_MAX_REPEATS: int = 10
+
+    # Slow-query log (see app.core.slow_query); 0 disables it
+    SLOW_QUERY_THRESHOLD_MS: float = 200
+    SLOW_QUERY_BUFFER_SIZE: int = 100
+    # EXPLAIN (ANALYZE, BUFFERS) a SELECT shape once it has been slow N times
+    SLOW_QUERY_EXPLAIN: bool = False
+    SLOW_QUERY_EXPLAIN_AFTER: int = 3
+
     # Google OAuth 2.0 Configuration (Story 2.5)
     GOOGLE_OAUTH_CLIENT_ID: str | None = None
     GOOGLE_OAUTH_CLIENT_SECRET: str | None = None
@@ -96,6 +173,20 @@ class Settings(BaseSettings):
             path=self.POSTGRES_DB,
         )
 
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def SQLALCHEMY_REPLICA_DATABASE_URI(self) -> PostgresDsn | None:
+        if not self.POSTGRES_REPLICA_SERVER:
+            return None
+        return PostgresDsn.build(
+            scheme="postgresql+asyncpg",
+            username=self.POSTGRES_USER,
+            password=self.POSTGRES_PASSWORD,
+            host=self.POSTGRES_REPLICA_SERVER,
+            port=self.POSTGRES_REPLICA_PORT or self.POSTGRES_PORT,
+            path=self.POSTGRES_DB,
+        )
+
     # Email Configuration - supports both SMTP and Resend API
     # For SMTP (local development):
     SMTP_TLS: bool = True
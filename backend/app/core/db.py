@@ -1,35 +1,112 @@
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
-from sqlmodel import Session, create_engine, select
+from sqlmodel import create_engine
 
 from app import crud
 from app.core.config import settings
-from app.models import User, UserCreate
-
-# Async engine with connection pooling for production scalability
-# Min connections: 5 (reduce cold start latency)
-# Max connections: 20 (prevent connection exhaustion)
-# Pool recycle: 3600s (1 hour) - recycle connections to avoid stale connections
-# Timeout: 30s - max time to wait for connection from pool
-async_engine = create_async_engine(
-    str(settings.SQLALCHEMY_DATABASE_URI),
-    echo=False,
-    pool_pre_ping=True,  # Verify connections before using them
-    pool_size=5,  # Min connections
-    max_overflow=15,  # Max additional connections (total max = 20)
-    pool_recycle=3600,  # Recycle connections after 1 hour
-    pool_timeout=30,  # Wait up to 30s for connection
+from app.core.db_pool import (
+    POOL_METRIC_FAMILIES,
+    PoolMonitor,
+    TimedAsyncQueuePool,
+    TimedQueuePool,
+    driver_connect_args,
+    install_idle_liveness_check,
+    pool_options,
 )
+from app.core.metrics import request_metrics
+from app.core.read_replica import ReadAfterWrite, install_write_tracking
+from app.core.request_timing import install_query_timing
+from app.core.slow_query import SlowQueryLog
+from app.core.tenant_context import TenantAwareConnection
+from app.models import UserCreate
+
+
+def _create_async_engine(url: str, pool_name: str) -> AsyncEngine:
+    """Async engine with the profile pool, liveness check and pool metrics.
+
+    Pool sizes come from the DB_POOL_PROFILE profile (api by default: 5
+    connections, bursts to 20, 30s checkout timeout, 1h recycle). Idle
+    connections are pinged on checkout instead of pre-pinging every one.
+    TenantAwareConnection sends the RLS tenant with each transaction's BEGIN,
+    which is what keeps RLS correct behind PgBouncer (DB_PGBOUNCER).
+    """
+    engine = create_async_engine(
+        url,
+        echo=False,
+        poolclass=TimedAsyncQueuePool,
+        **pool_options(
+            settings.DB_POOL_PROFILE,
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+            pool_recycle=settings.DB_POOL_RECYCLE,
+        ),
+        connect_args={
+            "connection_class": TenantAwareConnection,
+            **driver_connect_args("asyncpg", settings.DB_PGBOUNCER),
+        },
+    )
+    monitor = PoolMonitor(pool_name)
+    engine.pool.monitor = monitor  # type: ignore[attr-defined]
+    install_idle_liveness_check(
+        engine.sync_engine, settings.DB_POOL_IDLE_CHECK_SECONDS
+    )
+    # engine.pool is re-read on each flush: dispose() replaces the pool
+    request_metrics.register_collector(
+        POOL_METRIC_FAMILIES, lambda: monitor.samples(engine.pool)
+    )
+    # Per-request query count and DB time (Server-Timing header, slow request log)
+    install_query_timing(engine.sync_engine)
+    return engine
+
+
+async_engine = _create_async_engine(
+    str(settings.SQLALCHEMY_DATABASE_URI), "primary"
+)
+
+# Optional streaming replica for ReadSessionDep routes (see app.core.read_replica)
+replica_engine: AsyncEngine | None = None
+if settings.SQLALCHEMY_REPLICA_DATABASE_URI is not None:
+    replica_engine = _create_async_engine(
+        str(settings.SQLALCHEMY_REPLICA_DATABASE_URI), "replica"
+    )
+async_engines = [async_engine] + ([replica_engine] if replica_engine else [])
+
+# Slow statements are logged and kept for /monitoring/slow-queries
+slow_query_log = SlowQueryLog(
+    threshold_ms=settings.SLOW_QUERY_THRESHOLD_MS,
+    buffer_size=settings.SLOW_QUERY_BUFFER_SIZE,
+    explain=settings.SLOW_QUERY_EXPLAIN,
+    explain_after=settings.SLOW_QUERY_EXPLAIN_AFTER,
+)
+if settings.SLOW_QUERY_THRESHOLD_MS > 0:
+    slow_query_log.install(async_engine)
 
 # Sync engine for backwards compatibility (migrations, scripts)
+# Always uses the small "script" pool, whatever process it is loaded in
 engine = create_engine(
-    str(settings.SQLALCHEMY_DATABASE_URI).replace("+asyncpg", "+psycopg")
+    str(settings.SQLALCHEMY_DATABASE_URI).replace("+asyncpg", "+psycopg"),
+    poolclass=TimedQueuePool,
+    **pool_options("script"),
+    connect_args=driver_connect_args("psycopg", settings.DB_PGBOUNCER),
 )
+install_idle_liveness_check(engine, settings.DB_POOL_IDLE_CHECK_SECONDS)
 
 # Async session maker
 async_session_maker = sessionmaker(
     async_engine, class_=AsyncSession, expire_on_commit=False
 )
+# Sessions for ReadSessionDep; the primary when no replica is configured
+replica_session_maker = (
+    sessionmaker(replica_engine, class_=AsyncSession, expire_on_commit=False)  # type: ignore[call-overload]
+    if replica_engine is not None
+    else async_session_maker
+)
+install_write_tracking()
+read_after_write = ReadAfterWrite(
+    sticky_seconds=settings.READ_REPLICA_STICKY_SECONDS,
+    enabled=replica_engine is not None,
+)
 
 
 async def get_async_session():
@@ -43,7 +120,7 @@ async def get_async_session():
 # for more details: https://github.com/fastapi/full-stack-fastapi-template/issues/28
 
 
-def init_db(session: Session) -> None:
+async def init_db(session: AsyncSession) -> None:
     # Tables should be created with Alembic migrations
     # But if you don't want to use migrations, create
     # the tables un-commenting the next lines
@@ -52,13 +129,13 @@ def init_db(session: Session) -> None:
     # This works because the models are already imported and registered from app.models
     # SQLModel.metadata.create_all(engine)
 
-    user = session.exec(
-        select(User).where(User.email == settings.FIRST_SUPERUSER)
-    ).first()
+    user = await crud.get_user_by_email(
+        session=session, email=settings.FIRST_SUPERUSER
+    )
     if not user:
         user_in = UserCreate(
             email=settings.FIRST_SUPERUSER,
             password=settings.FIRST_SUPERUSER_PASSWORD,
             is_superuser=True,
         )
-        user = crud.create_user(session=session, user_create=user_in)
+        user = await crud.create_user(session=session, user_create=user_in)
@@ -0,0 +1,213 @@
+"""Connection pool profiles, idle-time liveness checks and pool metrics.
+
+Pool sizes depend on what the process does, so they come from a profile
+selected with DB_POOL_PROFILE, each value overridable in Settings:
+
+- api: uvicorn/gunicorn workers serving many concurrent requests
+- celery: prefork worker children running one task at a time
+- script: prestart, migrations, seeds and other one-off commands
+
+Instead of pool_pre_ping (a round-trip on every checkout), a connection is
+pinged on checkout only when it has been idle in the pool for longer than
+DB_POOL_IDLE_CHECK_SECONDS, which is when a server or proxy may have closed
+it. Connections that fail mid-use are still detected by SQLAlchemy's
+disconnect handling, which invalidates them and every older pooled
+connection, so the next checkout reconnects.
+
+Each pool also reports its size, checked-out and overflow connections and a
+histogram of checkout wait time, exported per worker at /metrics.
+
+With DB_PGBOUNCER, POSTGRES_SERVER/POSTGRES_PORT point at a PgBouncer in
+transaction pooling mode, where consecutive transactions of one client
+connection may run on different server connections. Only state scoped to a
+transaction is then safe: the RLS tenant already is (see
+app.core.tenant_context), and driver_connect_args() stops the drivers from
+reusing server-side prepared statements across transactions.
+"""
+import math
+import time
+import uuid
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import Any, Literal
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import DisconnectionError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry, QueuePool
+
+PoolProfileName = Literal["api", "celery", "script"]
+
+_LAST_CHECKIN = "last_checkin"
+
+# Checkout wait bounds in milliseconds
+WAIT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 5000, 30000)
+
+
+@dataclass(frozen=True)
+class PoolProfile:
+    pool_size: int
+    max_overflow: int
+    pool_timeout: float
+    pool_recycle: int
+
+
+POOL_PROFILES: dict[str, PoolProfile] = {
+    # 5 warm connections per worker, bursts up to 20
+    "api": PoolProfile(pool_size=5, max_overflow=15, pool_timeout=30, pool_recycle=3600),
+    # Each prefork child runs one task at a time; chords/groups may need a second
+    "celery": PoolProfile(pool_size=1, max_overflow=2, pool_timeout=60, pool_recycle=1800),
+    # Short-lived commands: one connection, fail fast
+    "script": PoolProfile(pool_size=1, max_overflow=1, pool_timeout=10, pool_recycle=3600),
+}
+
+
+def pool_options(
+    profile: str,
+    pool_size: int | None = None,
+    max_overflow: int | None = None,
+    pool_timeout: float | None = None,
+    pool_recycle: int | None = None,
+) -> dict[str, Any]:
+    """create_engine() pool keyword arguments for a profile plus overrides."""
+    base = POOL_PROFILES[profile]
+    return {
+        "pool_size": base.pool_size if pool_size is None else pool_size,
+        "max_overflow": base.max_overflow if max_overflow is None else max_overflow,
+        "pool_timeout": base.pool_timeout if pool_timeout is None else pool_timeout,
+        "pool_recycle": base.pool_recycle if pool_recycle is None else pool_recycle,
+    }
+
+
+def _unique_statement_name() -> str:
+    # asyncpg numbers statements per client connection (__asyncpg_stmt_1__, ...),
+    # which collide on a server connection shared through PgBouncer
+    return f"__asyncpg_{uuid.uuid4().hex}__"
+
+
+def driver_connect_args(
+    driver: Literal["asyncpg", "psycopg"], pgbouncer: bool
+) -> dict[str, Any]:
+    """Driver connect() arguments needed behind PgBouncer in transaction mode.
+
+    Args:
+        driver: "asyncpg" (async_engine) or "psycopg" (sync engine, Alembic)
+        pgbouncer: Whether connections go through PgBouncer
+
+    Returns:
+        dict: Arguments to merge into create_engine(connect_args=...)
+    """
+    if not pgbouncer:
+        return {}
+    if driver == "asyncpg":
+        return {
+            # asyncpg's own statement cache and SQLAlchemy's prepared statement cache
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": _unique_statement_name,
+        }
+    # psycopg prepares a statement server-side after 5 executions; never do that
+    return {"prepare_threshold": None}
+
+
+class PoolMonitor:
+    """Checkout wait histogram for one pool (cumulative since start)."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.wait_counts = [0] * (len(WAIT_BUCKETS_MS) + 1)
+        self.wait_sum_ms = 0.0
+
+    def observe_wait(self, wait_ms: float) -> None:
+        self.wait_counts[bisect_left(WAIT_BUCKETS_MS, wait_ms)] += 1
+        self.wait_sum_ms += wait_ms
+
+    def samples(self, pool: Any) -> list[tuple[str, str, dict[str, str], float]]:
+        """Current gauges and wait histogram as (family, name, labels, value)."""
+        labels = {"pool": self.name}
+        samples = [
+            ("db_pool_size", "db_pool_size", labels, float(pool.size())),
+            ("db_pool_checked_out", "db_pool_checked_out", labels, float(pool.checkedout())),
+            ("db_pool_checked_in", "db_pool_checked_in", labels, float(pool.checkedin())),
+            # QueuePool counts overflow from -pool_size; only report extra connections
+            ("db_pool_overflow", "db_pool_overflow", labels, float(max(pool.overflow(), 0))),
+        ]
+        cumulative = 0
+        for bound, count in zip((*WAIT_BUCKETS_MS, math.inf), self.wait_counts, strict=True):
+            cumulative += count
+            le = "+Inf" if math.isinf(bound) else repr(bound / 1000)
+            samples.append(
+                (
+                    "db_pool_wait_seconds",
+                    "db_pool_wait_seconds_bucket",
+                    {**labels, "le": le},
+                    float(cumulative),
+                )
+            )
+        samples.append(
+            ("db_pool_wait_seconds", "db_pool_wait_seconds_sum", labels, self.wait_sum_ms / 1000)
+        )
+        samples.append(
+            ("db_pool_wait_seconds", "db_pool_wait_seconds_count", labels, float(cumulative))
+        )
+        return samples
+
+
+POOL_METRIC_FAMILIES = [
+    ("db_pool_size", "gauge", "Connections kept in the pool"),
+    ("db_pool_checked_out", "gauge", "Connections currently checked out"),
+    ("db_pool_checked_in", "gauge", "Idle connections in the pool"),
+    ("db_pool_overflow", "gauge", "Connections open beyond pool_size"),
+    ("db_pool_wait_seconds", "histogram", "Time waiting to check out a connection"),
+]
+
+
+class _TimedCheckout:
+    """Pool mixin that records how long each checkout waited for a connection."""
+
+    monitor: PoolMonitor | None = None
+
+    def _do_get(self) -> Any:
+        start = time.perf_counter_ns()
+        try:
+            return super()._do_get()  # type: ignore[misc]
+        finally:
+            if self.monitor is not None:
+                self.monitor.observe_wait((time.perf_counter_ns() - start) / 1_000_000)
+
+    def recreate(self) -> Any:
+        # dispose() and invalidation build a new pool; keep reporting to the same monitor
+        pool = super().recreate()  # type: ignore[misc]
+        pool.monitor = self.monitor
+        return pool
+
+
+class TimedAsyncQueuePool(_TimedCheckout, AsyncAdaptedQueuePool):
+    pass
+
+
+class TimedQueuePool(_TimedCheckout, QueuePool):
+    pass
+
+
+def install_idle_liveness_check(engine: Engine, idle_seconds: float) -> None:
+    """Ping connections on checkout only after they sat idle for idle_seconds.
+
+    For an AsyncEngine, pass `async_engine.sync_engine`.
+    """
+
+    def on_checkin(_dbapi_connection: Any, record: ConnectionPoolEntry) -> None:
+        record.info[_LAST_CHECKIN] = time.monotonic()
+
+    def on_checkout(dbapi_connection: Any, record: ConnectionPoolEntry, _proxy: Any) -> None:
+        last_checkin = record.info.get(_LAST_CHECKIN)
+        if last_checkin is None or time.monotonic() - last_checkin < idle_seconds:
+            return
+        try:
+            engine.dialect.do_ping(dbapi_connection)
+        except Exception as e:
+            # The pool discards this connection and retries with a fresh one
+            raise DisconnectionError(f"Idle connection failed liveness check: {e}") from e
+
+    event.listen(engine, "checkin", on_checkin)
+    event.listen(engine, "checkout", on_checkout)
@@ -0,0 +1,220 @@
+"""In-process (L1) tier for app.core.cache with cross-worker invalidation.
+
+Each cache_result decorator can own a LocalCache: a per-tenant partitioned
+LRU with a short TTL that sits in front of Redis. Hot keys are then served
+without a Redis round-trip.
+
+Invalidation must reach every uvicorn worker, so invalidate_cache,
+invalidate_tags and invalidate_pattern publish on a Redis pub/sub channel. Every process that
+holds L1 entries runs one listener that evicts matching entries from all of
+its LocalCache instances. L1 is only populated while the listener is
+subscribed; if the subscription drops, all L1 entries are discarded because
+invalidations may have been missed.
+"""
+import asyncio
+import json
+import logging
+import time
+from collections import OrderedDict
+from fnmatch import fnmatchcase
+from typing import Any
+
+from app.core.redis import RedisClient
+
+logger = logging.getLogger(__name__)
+
+INVALIDATION_CHANNEL = "cache:invalidate"
+
+
+class LocalCache:
+    """Bounded LRU + TTL cache partitioned by tenant.
+
+    Each tenant gets its own partition of up to `max_entries` keys, so a busy
+    tenant cannot evict another tenant's entries. Values are the encoded
+    payloads stored in Redis; callers decode on every hit so a cached object
+    is never shared between requests.
+
+    `generation` changes on every eviction. Callers read it before fetching
+    from Redis and pass it to set(), so a value fetched before a concurrent
+    invalidation is not written back into L1.
+    """
+
+    def __init__(self, max_entries: int, ttl: float) -> None:
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.generation = 0
+        self._partitions: dict[int | None, OrderedDict[str, tuple[float, bytes]]] = {}
+
+    def get(self, tenant_id: int | None, key: str) -> bytes | None:
+        partition = self._partitions.get(tenant_id)
+        if partition is None:
+            return None
+        entry = partition.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del partition[key]
+            return None
+        partition.move_to_end(key)
+        return value
+
+    def set(
+        self,
+        tenant_id: int | None,
+        key: str,
+        value: bytes,
+        ttl: float,
+        generation: int | None = None,
+    ) -> None:
+        if generation is not None and generation != self.generation:
+            return
+        partition = self._partitions.setdefault(tenant_id, OrderedDict())
+        partition[key] = (time.monotonic() + min(self.ttl, ttl), value)
+        partition.move_to_end(key)
+        while len(partition) > self.max_entries:
+            partition.popitem(last=False)
+
+    def evict(self, key: str) -> None:
+        self.generation += 1
+        for partition in self._partitions.values():
+            partition.pop(key, None)
+
+    def evict_pattern(self, pattern: str) -> None:
+        """Evict keys matching a Redis-style glob pattern."""
+        self.generation += 1
+        for partition in self._partitions.values():
+            for key in [k for k in partition if fnmatchcase(k, pattern)]:
+                del partition[key]
+
+    def clear(self) -> None:
+        self.generation += 1
+        self._partitions.clear()
+
+    def __len__(self) -> int:
+        return sum(len(partition) for partition in self._partitions.values())
+
+
+class InvalidationBus:
+    """Per-process registry of LocalCache instances and pub/sub listener."""
+
+    _caches: list[LocalCache] = []
+    _task: asyncio.Task[None] | None = None
+    _lock: asyncio.Lock | None = None
+
+    @classmethod
+    def register(cls, cache: LocalCache) -> None:
+        cls._caches.append(cache)
+
+    @classmethod
+    def is_listening(cls) -> bool:
+        """Whether this process is subscribed on the running event loop."""
+        return (
+            cls._task is not None
+            and not cls._task.done()
+            and cls._task.get_loop() is asyncio.get_running_loop()
+        )
+
+    @classmethod
+    async def ensure_listening(cls) -> bool:
+        """Subscribe to the invalidation channel if not already subscribed.
+
+        Returns:
+            bool: True if the listener is running and L1 may be populated
+        """
+        if cls.is_listening():
+            return True
+        running_loop = asyncio.get_running_loop()
+        if cls._task is not None and cls._task.get_loop() is not running_loop:
+            # Listener belongs to a closed loop (tests, reloads): start over
+            cls._task = None
+            cls._lock = None
+            cls.clear_all()
+        if cls._lock is None:
+            cls._lock = asyncio.Lock()
+        async with cls._lock:
+            if cls.is_listening():
+                return True
+            try:
+                redis = await RedisClient.get_client()
+                pubsub = redis.pubsub()
+                await pubsub.subscribe(INVALIDATION_CHANNEL)
+            except Exception as e:
+                logger.warning(f"Cache invalidation listener unavailable: {e}")
+                return False
+            cls._task = asyncio.create_task(cls._listen(pubsub))
+            return True
+
+    @classmethod
+    async def _listen(cls, pubsub: Any) -> None:
+        try:
+            async for message in pubsub.listen():
+                if message.get("type") == "message":
+                    cls.apply(message["data"])
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Cache invalidation listener stopped: {e}")
+        finally:
+            # Invalidations may have been missed while disconnected
+            cls.clear_all()
+            try:
+                await pubsub.reset()
+            except Exception:
+                pass
+
+    @classmethod
+    def apply(cls, raw: str) -> None:
+        """Apply an invalidation message to every local cache in this process."""
+        try:
+            message = json.loads(raw)
+        except (TypeError, ValueError):
+            logger.warning(f"Ignoring malformed cache invalidation message: {raw!r}")
+            return
+        for cache in cls._caches:
+            if "key" in message:
+                cache.evict(message["key"])
+            elif "keys" in message:
+                for key in message["keys"]:
+                    cache.evict(key)
+            elif "pattern" in message:
+                cache.evict_pattern(message["pattern"])
+
+    @classmethod
+    async def publish(
+        cls,
+        *,
+        key: str | None = None,
+        keys: list[str] | None = None,
+        pattern: str | None = None,
+    ) -> None:
+        """Evict locally and broadcast the invalidation to other workers."""
+        if key is not None:
+            message = json.dumps({"key": key})
+        elif keys is not None:
+            message = json.dumps({"keys": keys})
+        else:
+            message = json.dumps({"pattern": pattern})
+        cls.apply(message)
+        try:
+            redis = await RedisClient.get_client()
+            await redis.publish(INVALIDATION_CHANNEL, message)
+        except Exception as e:
+            logger.warning(f"Failed to publish cache invalidation: {e}")
+
+    @classmethod
+    def clear_all(cls) -> None:
+        for cache in cls._caches:
+            cache.clear()
+
+    @classmethod
+    async def stop(cls) -> None:
+        """Cancel the listener (it restarts on next use)."""
+        if cls._task is not None:
+            cls._task.cancel()
+            try:
+                await cls._task
+            except (asyncio.CancelledError, Exception):
+                pass
+            cls._task = None
+        cls._lock = None
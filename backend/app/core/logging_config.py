@@ -0,0 +1,160 @@
+"""Non-blocking structured logging for the API process.
+
+Log calls on the event loop only build the LogRecord and put it on a queue.
+A QueueListener thread renders records as JSON and writes them to stderr, so
+formatting and I/O never block request handling:
+
+    logger.info(...) -> SamplingFilter -> LogQueueHandler -> queue
+        -> QueueListener thread -> JSONFormatter -> StreamHandler(stderr)
+
+High-volume INFO logs (e.g. "Incoming request" from ayni.api) can be sampled
+per logger with LOG_SAMPLING. WARNING and above are never sampled. When the
+queue is full, records are dropped and counted instead of blocking the loop.
+"""
+import atexit
+import json
+import logging
+import queue
+import random
+import sys
+from collections.abc import Mapping
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, TextIO
+
+# Attributes every LogRecord has; anything else was passed via `extra`
+_RECORD_ATTRS = frozenset(
+    vars(logging.LogRecord("", 0, "", 0, "", None, None))
+) | {"message", "asctime", "taskName"}
+
+_listener: QueueListener | None = None
+
+
+class JSONFormatter(logging.Formatter):
+    """Render a record as one JSON object per line, including `extra` fields."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: dict[str, Any] = {
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRS:
+                entry[key] = value
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+class SamplingFilter(logging.Filter):
+    """Keep only a fraction of sub-WARNING records from selected loggers.
+
+    Rates apply to the named logger and its children; the most specific
+    configured name wins. A rate of 1.0 keeps everything, 0.0 drops all.
+    """
+
+    def __init__(self, rates: Mapping[str, float]) -> None:
+        super().__init__()
+        self.rates = dict(rates)
+
+    def rate_for(self, name: str) -> float:
+        while name:
+            if name in self.rates:
+                return self.rates[name]
+            name = name.rpartition(".")[0]
+        return 1.0
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING or not self.rates:
+            return True
+        rate = self.rate_for(record.name)
+        return rate >= 1.0 or random.random() < rate
+
+
+class LogQueueHandler(QueueHandler):
+    """QueueHandler that defers all formatting to the listener thread.
+
+    The stdlib QueueHandler formats the message on the calling thread; here
+    only the %-style message is resolved (so mutable args are captured now)
+    and JSON rendering happens in the listener. Records are dropped, not
+    waited on, when the queue is full.
+    """
+
+    def __init__(self, log_queue: "queue.Queue[logging.LogRecord]") -> None:
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        if record.args:
+            record.msg = record.getMessage()
+            record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+def configure_logging(
+    level: str = "INFO",
+    log_format: str = "json",
+    sampling: Mapping[str, float] | None = None,
+    queue_size: int = 10_000,
+    stream: TextIO | None = None,
+) -> LogQueueHandler:
+    """Route all logging through a queue drained by a background thread.
+
+    Replaces the root logger's handlers (including any set by
+    logging.basicConfig). Safe to call again; the previous listener is
+    stopped first.
+
+    Args:
+        level: Root log level
+        log_format: "json" for structured output, "text" for plain lines
+        sampling: Logger name -> fraction of INFO/DEBUG records to keep
+        queue_size: Max records waiting to be written before dropping
+        stream: Where the listener writes (default: sys.stderr)
+
+    Returns:
+        LogQueueHandler: The handler installed on the root logger
+    """
+    global _listener
+    shutdown_logging()
+
+    output = logging.StreamHandler(stream or sys.stderr)
+    if log_format == "json":
+        output.setFormatter(JSONFormatter())
+    else:
+        output.setFormatter(
+            logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s")
+        )
+
+    log_queue: queue.Queue[logging.LogRecord] = queue.Queue(maxsize=queue_size)
+    handler = LogQueueHandler(log_queue)
+    if sampling:
+        handler.addFilter(SamplingFilter(sampling))
+
+    root = logging.getLogger()
+    for existing in root.handlers[:]:
+        root.removeHandler(existing)
+    root.addHandler(handler)
+    root.setLevel(level)
+
+    _listener = QueueListener(log_queue, output, respect_handler_level=True)
+    _listener.start()
+    return handler
+
+
+def shutdown_logging() -> None:
+    """Flush queued records and stop the listener thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(shutdown_logging)
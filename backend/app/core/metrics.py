@@ -0,0 +1,276 @@
+"""Per-route HTTP latency histograms and request counters.
+
+Each worker records observations in plain in-memory counters. Requests are
+handled on a single event loop thread, so no locks are needed and an
+observation costs a dict lookup, a bisect and two increments. A background
+task flushes the deltas to one Redis hash every METRICS_FLUSH_INTERVAL_SECONDS
+with HINCRBY/HINCRBYFLOAT, which aggregates all gunicorn/uvicorn workers (and
+hosts) into the same series. /metrics renders that hash in the Prometheus
+text exposition format.
+
+Series are keyed by route template ("/api/v1/users/{user_id}"), method and
+status code. Unmatched paths share the "<unmatched>" route so scanners
+cannot create unbounded series.
+
+Per-worker state that cannot be summed as deltas (e.g. DB pool gauges) is
+registered with register_collector(). Each flush stores the worker's current
+samples under its own field in WORKERS_KEY, and /metrics exports them with
+a `worker` label, skipping workers that stopped flushing.
+"""
+import asyncio
+import json
+import logging
+import math
+import os
+import socket
+import time
+from bisect import bisect_left
+from collections.abc import Callable, Mapping
+
+from app.core.config import settings
+from app.core.redis import RedisClient
+
+logger = logging.getLogger(__name__)
+
+METRICS_KEY = "metrics:http"
+WORKERS_KEY = "metrics:workers"
+UNMATCHED_ROUTE = "<unmatched>"
+
+# Upper bounds in milliseconds; exported in seconds as Prometheus expects
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+_SEP = "\t"
+
+# (family, sample name, labels, value)
+Sample = tuple[str, str, dict[str, str], float]
+
+
+def _worker_id() -> str:
+    # Read on every flush: prefork workers change pid after the fork
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_bound(bound_ms: float) -> str:
+    return "+Inf" if math.isinf(bound_ms) else repr(bound_ms / 1000)
+
+
+def _format_labels(labels: Mapping[str, str]) -> str:
+    return ",".join(f'{name}="{_escape_label(value)}"' for name, value in labels.items())
+
+
+def render_worker_samples(
+    families: Mapping[str, tuple[str, str]],
+    workers: Mapping[str, list[Sample]],
+) -> str:
+    """Render per-worker samples grouped by family, adding a worker label.
+
+    Args:
+        families: Family name -> (type, help), in export order
+        workers: Worker ID -> samples reported by that worker
+
+    Returns:
+        str: Prometheus text for the registered families
+    """
+    lines = []
+    for family, (kind, help_text) in families.items():
+        lines.append(f"# HELP {family} {help_text}")
+        lines.append(f"# TYPE {family} {kind}")
+        for worker, samples in sorted(workers.items()):
+            for sample_family, name, labels, value in samples:
+                if sample_family == family:
+                    labels = {**labels, "worker": worker}
+                    lines.append(f"{name}{{{_format_labels(labels)}}} {value!r}")
+    return "\n".join(lines) + "\n" if lines else ""
+
+
+def render_prometheus(
+    fields: Mapping[str, str | float],
+    buckets_ms: tuple[float, ...] = LATENCY_BUCKETS_MS,
+) -> str:
+    """Render flushed counters in the Prometheus text exposition format.
+
+    Args:
+        fields: Hash fields "method\\troute\\tstatus\\t<bucket index|sum>"
+        buckets_ms: Bucket upper bounds the fields were recorded with
+
+    Returns:
+        str: http_request_duration_seconds histogram and http_requests_total
+    """
+    bounds = (*buckets_ms, math.inf)
+    series: dict[tuple[str, str, str], list[float]] = {}
+    for field, raw in fields.items():
+        method, route, status, slot = field.split(_SEP)
+        values = series.setdefault((method, route, status), [0.0] * (len(bounds) + 1))
+        values[len(bounds) if slot == "sum" else int(slot)] = float(raw)
+
+    histogram = [
+        "# HELP http_request_duration_seconds HTTP request latency by route template",
+        "# TYPE http_request_duration_seconds histogram",
+    ]
+    counter = [
+        "# HELP http_requests_total HTTP requests by route template",
+        "# TYPE http_requests_total counter",
+    ]
+    for (method, route, status), values in sorted(series.items()):
+        labels = (
+            f'method="{method}",route="{_escape_label(route)}",status="{status}"'
+        )
+        cumulative = 0.0
+        # values ends with the sum, which is not a bucket
+        for bound, count in zip(bounds, values, strict=False):
+            cumulative += count
+            histogram.append(
+                f'http_request_duration_seconds_bucket{{{labels},le="{_format_bound(bound)}"}} '
+                f"{cumulative:g}"
+            )
+        histogram.append(
+            f"http_request_duration_seconds_sum{{{labels}}} {values[-1] / 1000!r}"
+        )
+        histogram.append(f"http_request_duration_seconds_count{{{labels}}} {cumulative:g}")
+        counter.append(f"http_requests_total{{{labels}}} {cumulative:g}")
+    return "\n".join(histogram + counter) + "\n"
+
+
+class RequestMetrics:
+    """Per-worker request histograms, flushed to Redis as deltas."""
+
+    def __init__(
+        self,
+        flush_interval: float,
+        buckets_ms: tuple[float, ...] = LATENCY_BUCKETS_MS,
+        key: str = METRICS_KEY,
+    ) -> None:
+        self.flush_interval = flush_interval
+        self.key = key
+        self.buckets_ms = buckets_ms
+        # (method, route, status) -> [count per bucket..., +Inf count, sum ms]
+        self._pending: dict[tuple[str, str, int], list[float]] = {}
+        self._task: asyncio.Task[None] | None = None
+        self._families: dict[str, tuple[str, str]] = {}
+        self._collectors: list[Callable[[], list[Sample]]] = []
+
+    def register_collector(
+        self,
+        families: list[tuple[str, str, str]],
+        collect: Callable[[], list[Sample]],
+    ) -> None:
+        """Export per-worker samples (gauges, cumulative histograms).
+
+        Args:
+            families: (name, type, help) of each metric family collect() reports
+            collect: Returns the worker's current samples; called on each flush
+        """
+        for name, kind, help_text in families:
+            self._families[name] = (kind, help_text)
+        self._collectors.append(collect)
+
+    def observe(self, method: str, route: str, status_code: int, duration_ms: float) -> None:
+        """Record one request. Must be called from the event loop thread."""
+        key = (method, route, status_code)
+        values = self._pending.get(key)
+        if values is None:
+            values = self._pending[key] = [0.0] * (len(self.buckets_ms) + 2)
+        values[bisect_left(self.buckets_ms, duration_ms)] += 1
+        values[-1] += duration_ms
+        self._ensure_flushing()
+
+    def pending_fields(self) -> dict[str, float]:
+        """Unflushed observations as Redis hash field increments."""
+        fields: dict[str, float] = {}
+        for (method, route, status), values in self._pending.items():
+            prefix = f"{method}{_SEP}{route}{_SEP}{status}{_SEP}"
+            for index, count in enumerate(values[:-1]):
+                if count:
+                    fields[f"{prefix}{index}"] = count
+            fields[f"{prefix}sum"] = values[-1]
+        return fields
+
+    async def flush(self) -> None:
+        """Add this worker's observations to the shared Redis hash."""
+        samples = [sample for collect in self._collectors for sample in collect()]
+        if not self._pending and not samples:
+            return
+        fields = self.pending_fields()
+        pending, self._pending = self._pending, {}
+        try:
+            redis = await RedisClient.get_client()
+            async with redis.pipeline(transaction=False) as pipe:
+                if samples:
+                    pipe.hset(
+                        WORKERS_KEY,
+                        _worker_id(),
+                        json.dumps({"updated": time.time(), "samples": samples}),
+                    )
+                for field, value in fields.items():
+                    if field.endswith(f"{_SEP}sum"):
+                        pipe.hincrbyfloat(self.key, field, value)
+                    else:
+                        pipe.hincrby(self.key, field, int(value))
+                await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Failed to flush request metrics: {e}")
+            self._merge(pending)
+
+    async def render(self) -> str:
+        """Prometheus text for all workers, including this one's latest data."""
+        await self.flush()
+        redis = await RedisClient.get_client()
+        fields = await redis.hgetall(self.key)  # type: ignore[misc]
+        text = render_prometheus(fields, self.buckets_ms)
+        if self._families:
+            text += render_worker_samples(self._families, await self._worker_samples())
+        return text
+
+    async def _worker_samples(self) -> dict[str, list[Sample]]:
+        redis = await RedisClient.get_client()
+        raw = await redis.hgetall(WORKERS_KEY)  # type: ignore[misc]
+        cutoff = time.time() - 3 * self.flush_interval
+        workers: dict[str, list[Sample]] = {}
+        stale = []
+        for worker, payload in raw.items():
+            report = json.loads(payload)
+            if report["updated"] < cutoff:
+                stale.append(worker)
+            else:
+                workers[worker] = [
+                    (family, name, labels, value)
+                    for family, name, labels, value in report["samples"]
+                ]
+        if stale:
+            await redis.hdel(WORKERS_KEY, *stale)  # type: ignore[misc]
+        return workers
+
+    def _merge(self, pending: dict[tuple[str, str, int], list[float]]) -> None:
+        # Keep observations from a failed flush for the next attempt
+        for key, values in pending.items():
+            current = self._pending.get(key)
+            if current is None:
+                self._pending[key] = values
+            else:
+                for index, value in enumerate(values):
+                    current[index] += value
+
+    def _ensure_flushing(self) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        if (
+            self._task is not None
+            and not self._task.done()
+            and self._task.get_loop() is loop
+        ):
+            return
+        self._task = loop.create_task(self._flush_loop())
+
+    async def _flush_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+
+
+request_metrics = RequestMetrics(flush_interval=settings.METRICS_FLUSH_INTERVAL_SECONDS)
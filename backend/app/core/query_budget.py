@@ -0,0 +1,213 @@
+"""Opt-in query budgets and N+1 detection per request.
+
+While enabled, a before_cursor_execute listener records the normalized SQL
+of every statement issued during a request (or inside `record_queries()`).
+When the request finishes, RequestLoggingMiddleware checks the statements
+against the route's budget:
+
+- max_queries: total statements for the request
+- max_repeats: times the same statement shape may run; a loop issuing one
+  SELECT per row (N+1) shows up as one shape repeated N times
+
+Budgets are declared on route functions with @query_budget; routes without
+one only get the default max_repeats (QUERY_BUDGET_MAX_REPEATS).
+
+QUERY_BUDGET_MODE selects what a violation does: "raise" fails the request
+(used by the test suite), "warn" logs a warning (staging), "off" (default)
+installs nothing, so production pays one flag check per request.
+"""
+import logging
+import re
+from collections import Counter
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Literal, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine
+
+logger = logging.getLogger("ayni.api.query_budget")
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+BUDGET_ATTR = "__query_budget__"
+
+_WHITESPACE = re.compile(r"\s+")
+_PLACEHOLDER = re.compile(r"\$\d+|%\(\w+\)s|%s|(?<!:):(?!:)\w+|\?")
+_PLACEHOLDER_LIST = re.compile(r"\?(?:\s*,\s*\?)+")
+_NUMBER = re.compile(r"\b\d+\b")
+_STRING = re.compile(r"'(?:[^']|'')*'")
+
+
+def normalize_sql(statement: str) -> str:
+    """Statement shape: literals and bind parameters replaced by "?".
+
+    Expanded IN lists collapse to "?, ..." so the same query with a
+    different number of IDs has one shape.
+    """
+    shape = _STRING.sub("?", statement)
+    shape = _PLACEHOLDER.sub("?", shape)
+    shape = _NUMBER.sub("?", shape)
+    shape = _PLACEHOLDER_LIST.sub("?, ...", shape)
+    return _WHITESPACE.sub(" ", shape).strip()
+
+
+class QueryBudgetExceeded(Exception):
+    """Raised in "raise" mode when a request exceeds its query budget."""
+
+
+@dataclass(frozen=True)
+class QueryBudget:
+    """Limits for one route. None means unlimited."""
+
+    max_queries: int | None = None
+    max_repeats: int | None = None
+
+
+def query_budget(
+    max_queries: int | None = None, max_repeats: int | None = None
+) -> Callable[[F], F]:
+    """Declare the query budget of a route.
+
+    Apply below the router decorator so FastAPI registers the annotated
+    function:
+
+        @router.get("/")
+        @query_budget(max_queries=4, max_repeats=1)
+        async def read_users(session: SessionDep) -> Any: ...
+
+    Args:
+        max_queries: Max statements per request
+        max_repeats: Max executions of the same statement shape
+
+    Returns:
+        The route function, unchanged apart from the budget attribute
+    """
+
+    def decorator(func: F) -> F:
+        setattr(func, BUDGET_ATTR, QueryBudget(max_queries, max_repeats))
+        return func
+
+    return decorator
+
+
+@dataclass
+class QueryRecorder:
+    """Normalized statements issued during one request or test."""
+
+    statements: list[str] = field(default_factory=list)
+
+    def violations(self, budget: QueryBudget) -> list[str]:
+        problems = []
+        if budget.max_queries is not None and len(self.statements) > budget.max_queries:
+            problems.append(
+                f"{len(self.statements)} queries (budget {budget.max_queries})"
+            )
+        if budget.max_repeats is not None and self.statements:
+            shape, count = Counter(self.statements).most_common(1)[0]
+            if count > budget.max_repeats:
+                problems.append(
+                    f"statement repeated {count} times (budget "
+                    f"{budget.max_repeats}), possible N+1: {shape}"
+                )
+        return problems
+
+
+_recorder: ContextVar[QueryRecorder | None] = ContextVar(
+    "query_recorder", default=None
+)
+
+
+def _before_cursor_execute(
+    _conn: Connection, _cursor: Any, statement: str, *_args: Any
+) -> None:
+    recorder = _recorder.get()
+    if recorder is not None:
+        recorder.statements.append(normalize_sql(statement))
+
+
+class QueryBudgetGuard:
+    """Process-wide switch and default budget for query budget checks."""
+
+    def __init__(self) -> None:
+        self.mode: Literal["off", "warn", "raise"] = "off"
+        self.default_max_repeats: int | None = None
+        self._engines: list[Engine] = []
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode != "off"
+
+    def enable(
+        self,
+        engines: list[Engine],
+        mode: Literal["off", "warn", "raise"],
+        default_max_repeats: int | None = None,
+    ) -> None:
+        """Start recording statements on the given engines.
+
+        For an AsyncEngine, pass `async_engine.sync_engine`.
+        """
+        for engine in engines:
+            if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+                event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+                self._engines.append(engine)
+        self.mode = mode
+        self.default_max_repeats = default_max_repeats
+
+    def disable(self) -> None:
+        for engine in self._engines:
+            event.remove(engine, "before_cursor_execute", _before_cursor_execute)
+        self._engines.clear()
+        self.mode = "off"
+
+    def start(self) -> tuple[QueryRecorder, Any]:
+        """Begin recording for the current request.
+
+        Returns:
+            tuple: (recorder, token to pass to stop())
+        """
+        recorder = QueryRecorder()
+        return recorder, _recorder.set(recorder)
+
+    def stop(self, token: Any) -> None:
+        _recorder.reset(token)
+
+    def budget_for(self, endpoint: Callable[..., Any] | None) -> QueryBudget:
+        declared: QueryBudget | None = getattr(endpoint, BUDGET_ATTR, None)
+        if declared is None:
+            return QueryBudget(max_repeats=self.default_max_repeats)
+        if declared.max_repeats is None and self.default_max_repeats is not None:
+            return QueryBudget(declared.max_queries, self.default_max_repeats)
+        return declared
+
+    def check(self, recorder: QueryRecorder, budget: QueryBudget, where: str) -> None:
+        """Warn or raise (per mode) if the recorded statements exceed the budget."""
+        problems = recorder.violations(budget)
+        if not problems:
+            return
+        message = f"Query budget exceeded for {where}: " + "; ".join(problems)
+        if self.mode == "raise":
+            raise QueryBudgetExceeded(message)
+        logger.warning(
+            message,
+            extra={"route": where, "queries": len(recorder.statements)},
+        )
+
+
+query_budget_guard = QueryBudgetGuard()
+
+
+@contextmanager
+def record_queries() -> Iterator[QueryRecorder]:
+    """Record the statements issued inside the block (tests, scripts).
+
+    The engine must have been passed to query_budget_guard.enable().
+    """
+    recorder, token = query_budget_guard.start()
+    try:
+        yield recorder
+    finally:
+        query_budget_guard.stop(token)
@@ -0,0 +1,90 @@
+"""Read-replica routing with read-your-writes stickiness.
+
+With POSTGRES_REPLICA_SERVER set, app.core.db creates replica_engine next to
+async_engine, and routes that take ReadSessionDep (app.api.deps) read from
+it. Replica connections are TenantAwareConnection too, so the RLS tenant is
+sent with each BEGIN exactly as on the primary.
+
+Replication is asynchronous: right after a write, the replica may still
+return the old rows. Sessions record whether they wrote (an ORM flush or an
+insert()/update()/delete() statement). When a primary session that wrote for an
+authenticated user is closed at the end of a request, the user is marked in
+Redis for READ_REPLICA_STICKY_SECONDS, and that user's ReadSessionDep
+sessions use the primary until the mark expires. The mark is shared by all
+workers. If Redis is unavailable, reads go to the primary.
+
+Without a replica configured, ReadSessionDep is the primary session and
+nothing is written to Redis.
+"""
+import logging
+import uuid
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.orm import ORMExecuteState, Session
+
+from app.core.redis import RedisClient
+
+logger = logging.getLogger("ayni.db.read_replica")
+
+STICKY_KEY_PREFIX = "db:primary_sticky:"
+# session.info keys
+WROTE_KEY = "read_replica_wrote"
+USER_KEY = "read_replica_user_id"
+
+
+def _after_flush(session: Session, _flush_context: Any) -> None:
+    session.info[WROTE_KEY] = True
+
+
+def _do_orm_execute(state: ORMExecuteState) -> None:
+    if state.is_insert or state.is_update or state.is_delete:
+        state.session.info[WROTE_KEY] = True
+
+
+def install_write_tracking() -> None:
+    """Flag sessions (session.info[WROTE_KEY]) that write to the database.
+
+    Listens on the Session class, which also backs every AsyncSession.
+    """
+    if not event.contains(Session, "after_flush", _after_flush):
+        event.listen(Session, "after_flush", _after_flush)
+        event.listen(Session, "do_orm_execute", _do_orm_execute)
+
+
+class ReadAfterWrite:
+    """Keeps a user's reads on the primary for a while after they write."""
+
+    def __init__(self, sticky_seconds: float, enabled: bool) -> None:
+        self.sticky_seconds = sticky_seconds
+        self.enabled = enabled
+
+    def _key(self, user_id: uuid.UUID) -> str:
+        return f"{STICKY_KEY_PREFIX}{user_id}"
+
+    async def mark_write(self, user_id: uuid.UUID) -> None:
+        """Route the user's reads to the primary for sticky_seconds."""
+        try:
+            client = await RedisClient.get_client()
+            await client.set(
+                self._key(user_id), "1", px=int(self.sticky_seconds * 1000)
+            )
+        except Exception as e:
+            logger.warning(f"Failed to mark write for user {user_id}: {e}")
+
+    async def session_closed(self, session: Any) -> None:
+        """Mark the session's user if the session wrote anything."""
+        user_id = session.info.get(USER_KEY)
+        if self.enabled and user_id is not None and session.info.get(WROTE_KEY):
+            await self.mark_write(user_id)
+
+    async def use_primary(self, user_id: uuid.UUID | None) -> bool:
+        """Whether reads for this user must go to the primary."""
+        if not self.enabled or user_id is None:
+            return False
+        try:
+            client = await RedisClient.get_client()
+            return bool(await client.exists(self._key(user_id)))
+        except Exception as e:
+            logger.warning(f"Sticky read check failed, using primary: {e}")
+            return True
@@ -1,13 +1,62 @@
 """Redis client singleton with connection pooling."""
+import os
+import time
+from typing import Any
+
+from redis import Redis as SyncRedis
 from redis.asyncio import Redis
+from redis.asyncio.client import Pipeline
 
 from app.core.config import settings
+from app.core.request_timing import request_timing
+
+
+class TimedPipeline(Pipeline):
+    """Pipeline that adds its commands and round-trip to the request timing."""
+
+    async def execute(self, raise_on_error: bool = True) -> list[Any]:
+        timing = request_timing.get()
+        if timing is None:
+            return await super().execute(raise_on_error)  # type: ignore[no-any-return]
+        commands = len(self.command_stack)
+        start = time.perf_counter_ns()
+        try:
+            return await super().execute(raise_on_error)  # type: ignore[no-any-return]
+        finally:
+            timing.add_redis(commands, time.perf_counter_ns() - start)
+
+
+class TimedRedis(Redis):
+    """Redis client that records command count and time per request.
+
+    See app.core.request_timing; outside a request this is a plain client.
+    """
+
+    async def execute_command(self, *args: Any, **options: Any) -> Any:
+        timing = request_timing.get()
+        if timing is None:
+            return await super().execute_command(*args, **options)  # type: ignore[no-untyped-call]
+        start = time.perf_counter_ns()
+        try:
+            return await super().execute_command(*args, **options)  # type: ignore[no-untyped-call]
+        finally:
+            timing.add_redis(1, time.perf_counter_ns() - start)
+
+    def pipeline(
+        self, transaction: bool = True, shard_hint: str | None = None
+    ) -> TimedPipeline:
+        return TimedPipeline(
+            self.connection_pool, self.response_callbacks, transaction, shard_hint
+        )
 
 
 class RedisClient:
     """Singleton Redis client with connection pooling."""
 
     _instance: Redis | None = None
+    _binary_instance: Redis | None = None
+    _sync_instance: SyncRedis | None = None
+    _sync_pid: int | None = None
 
     @classmethod
     async def get_client(cls) -> Redis:
@@ -17,7 +66,7 @@ class RedisClient:
             Redis: Shared Redis client instance with connection pooling.
         """
         if cls._instance is None:
-            cls._instance = Redis.from_url(
+            cls._instance = TimedRedis.from_url(
                 settings.REDIS_URL,
                 encoding="utf-8",
                 decode_responses=True,
@@ -25,9 +74,46 @@ class RedisClient:
             )
         return cls._instance
 
+    @classmethod
+    async def get_binary_client(cls) -> Redis:
+        """Get or create a Redis client that returns raw bytes.
+
+        Used for cached payloads, which are binary (see app.core.cache_codecs).
+
+        Returns:
+            Redis: Shared Redis client instance without response decoding.
+        """
+        if cls._binary_instance is None:
+            cls._binary_instance = TimedRedis.from_url(
+                settings.REDIS_URL,
+                decode_responses=False,
+                max_connections=50,
+            )
+        return cls._binary_instance
+
+    @classmethod
+    def get_sync_client(cls) -> SyncRedis:
+        """Get or create a blocking Redis client, for Celery worker code.
+
+        Recreated after a fork, so prefork children never share the parent's
+        connections.
+
+        Returns:
+            SyncRedis: Per-process Redis client with decoded responses.
+        """
+        if cls._sync_instance is None or cls._sync_pid != os.getpid():
+            cls._sync_instance = SyncRedis.from_url(
+                settings.REDIS_URL, decode_responses=True, socket_timeout=5.0
+            )
+            cls._sync_pid = os.getpid()
+        return cls._sync_instance
+
     @classmethod
     async def close(cls) -> None:
-        """Close Redis connection pool."""
+        """Close Redis connection pools."""
         if cls._instance:
             await cls._instance.close()
             cls._instance = None
+        if cls._binary_instance:
+            await cls._binary_instance.close()
+            cls._binary_instance = None
@@ -0,0 +1,103 @@
+"""Per-request breakdown of time spent in the database and Redis.
+
+RequestLoggingMiddleware puts a RequestTiming in a contextvar for each
+request. SQLAlchemy cursor events on the async engine and the Redis client
+(app.core.redis.TimedRedis) add to it, so every query and command made while
+handling the request is counted, including from tasks the handler spawns
+(they inherit the context). Outside a request (Celery, scripts) the contextvar
+is unset and the hooks do nothing.
+
+The totals are sent in the Server-Timing response header, which browser dev
+tools display, and in the slow request log entry. Many queries for one
+request usually means an N+1 pattern.
+"""
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine, ExceptionContext
+
+_QUERY_START = "request_timing_query_start"
+
+
+@dataclass
+class RequestTiming:
+    """Mutable totals for one request."""
+
+    db_queries: int = 0
+    db_ns: int = 0
+    redis_commands: int = 0
+    redis_ns: int = 0
+
+    def add_query(self, elapsed_ns: int) -> None:
+        self.db_queries += 1
+        self.db_ns += elapsed_ns
+
+    def add_redis(self, commands: int, elapsed_ns: int) -> None:
+        self.redis_commands += commands
+        self.redis_ns += elapsed_ns
+
+    @property
+    def db_ms(self) -> float:
+        return self.db_ns / 1_000_000
+
+    @property
+    def redis_ms(self) -> float:
+        return self.redis_ns / 1_000_000
+
+    def server_timing(self, total_ms: float | None = None) -> str:
+        """Value for the Server-Timing response header."""
+        metrics = [
+            f'db;dur={self.db_ms:.2f};desc="{self.db_queries} queries"',
+            f'redis;dur={self.redis_ms:.2f};desc="{self.redis_commands} commands"',
+        ]
+        if total_ms is not None:
+            metrics.append(f"total;dur={total_ms:.2f}")
+        return ", ".join(metrics)
+
+    def log_fields(self) -> dict[str, Any]:
+        """Fields added to request log entries."""
+        return {
+            "db_queries": self.db_queries,
+            "db_ms": round(self.db_ms, 2),
+            "redis_commands": self.redis_commands,
+            "redis_ms": round(self.redis_ms, 2),
+        }
+
+
+request_timing: ContextVar[RequestTiming | None] = ContextVar(
+    "request_timing", default=None
+)
+
+
+def _before_cursor_execute(conn: Connection, *_args: Any) -> None:
+    if request_timing.get() is not None:
+        conn.info.setdefault(_QUERY_START, []).append(time.perf_counter_ns())
+
+
+def _after_cursor_execute(conn: Connection, *_args: Any) -> None:
+    timing = request_timing.get()
+    starts = conn.info.get(_QUERY_START)
+    if timing is not None and starts:
+        timing.add_query(time.perf_counter_ns() - starts.pop())
+
+
+def _handle_error(context: ExceptionContext) -> None:
+    # after_cursor_execute is not called for failed statements
+    conn = context.connection
+    starts = conn.info.get(_QUERY_START) if conn is not None else None
+    timing = request_timing.get()
+    if timing is not None and starts:
+        timing.add_query(time.perf_counter_ns() - starts.pop())
+
+
+def install_query_timing(engine: Engine) -> None:
+    """Count queries and DB time per request on an engine.
+
+    For an AsyncEngine, pass `async_engine.sync_engine`.
+    """
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
@@ -1,4 +1,6 @@
 import base64
+import hashlib
+import hmac
 from datetime import datetime, timedelta
 from typing import Any
 
@@ -58,6 +60,7 @@ def create_access_token(
 def create_refresh_token(
     subject: str | Any,
     expires_delta: timedelta,
+    jti: str | None = None,
 ) -> str:
     """
     Create JWT refresh token.
@@ -68,6 +71,7 @@ def create_refresh_token(
     Args:
         subject: User ID (UUID as string)
         expires_delta: Token expiration time (typically 30 days)
+        jti: Unique token identifier used to look up the stored token row
 
     Returns:
         Encoded JWT refresh token
@@ -79,6 +83,8 @@ def create_refresh_token(
         "sub": str(subject),
         "type": "refresh",
     }
+    if jti:
+        to_encode["jti"] = jti
 
     encoded_jwt = jwt.encode(to_encode, settings.JWT_SECRET, algorithm=ALGORITHM)
     return encoded_jwt
@@ -234,6 +240,39 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+def hash_refresh_token(token: str) -> str:
+    """
+    Compute keyed digest of a refresh token for database storage.
+
+    Refresh tokens are high-entropy signed JWTs, so a slow password hash adds
+    no protection. HMAC-SHA256 keyed with JWT_SECRET keeps stored digests
+    useless without the app secret while costing microseconds per check.
+
+    Args:
+        token: Raw refresh token string
+
+    Returns:
+        Hex-encoded HMAC-SHA256 digest (64 characters)
+    """
+    return hmac.new(
+        settings.JWT_SECRET.encode(), token.encode(), hashlib.sha256
+    ).hexdigest()
+
+
+def verify_refresh_token_hash(token: str, token_hash: str) -> bool:
+    """
+    Compare a raw refresh token against its stored keyed digest in constant time.
+
+    Args:
+        token: Raw refresh token string
+        token_hash: Stored digest from hash_refresh_token()
+
+    Returns:
+        True if the token matches the digest
+    """
+    return hmac.compare_digest(hash_refresh_token(token), token_hash)
+
+
 def _get_encryption_key() -> bytes:
     """
     Derive Fernet encryption key from JWT secret.
@@ -244,8 +283,6 @@ def _get_encryption_key() -> bytes:
     Returns:
         32-byte Fernet-compatible encryption key
     """
-    import hashlib
-
     # Create SHA256 hash of JWT_SECRET
     key_hash = hashlib.sha256(settings.JWT_SECRET.encode()).digest()
     # Fernet requires base64-encoded 32-byte key
@@ -0,0 +1,205 @@
+"""Slow-query log with optional EXPLAIN capture for the async engine.
+
+Statements on async_engine that take longer than SLOW_QUERY_THRESHOLD_MS are
+logged (logger "ayni.db.slow_query") with their normalized SQL, the types of
+their bound parameters (never the values), the RLS tenant and the duration,
+and kept in a bounded ring buffer served by GET /monitoring/slow-queries.
+
+With SLOW_QUERY_EXPLAIN enabled, once a statement shape has been slow
+SLOW_QUERY_EXPLAIN_AFTER times, `EXPLAIN (ANALYZE, BUFFERS)` is run for it in
+a background task on a separate connection, inside a transaction that is
+rolled back and with the same tenant applied. Only SELECT statements are
+explained, since ANALYZE executes the statement. Each shape is explained at
+most once per process.
+"""
+import asyncio
+import contextvars
+import logging
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from typing import Any
+
+from sqlalchemy import event, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.engine.interfaces import ExecutionContext
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.query_budget import normalize_sql
+from app.core.tenant_context import current_tenant
+
+logger = logging.getLogger("ayni.db.slow_query")
+
+# Execution option marking the EXPLAIN itself, so it is not logged again
+SKIP_OPTION = "slow_query_skip"
+_START_ATTR = "_slow_query_start"
+# Bound on the EXPLAIN statement itself (ANALYZE runs the query)
+EXPLAIN_TIMEOUT_MS = 30_000
+# Repeat counters are reset past this many distinct shapes
+MAX_TRACKED_SHAPES = 1000
+
+
+@dataclass
+class SlowQuery:
+    """One slow execution, as kept in the ring buffer."""
+
+    timestamp: str
+    duration_ms: float
+    statement: str
+    parameter_types: list[str]
+    tenant_id: int | None
+    occurrences: int
+    plan: str | None = None
+
+
+def parameter_shape(parameters: Any, executemany: bool) -> list[str]:
+    """Type names of bound parameters, e.g. ["int", "UUID"].
+
+    For executemany, the shape of the first row prefixed with the row count.
+    """
+    if executemany and isinstance(parameters, list | tuple) and parameters:
+        rows = len(parameters)
+        return [f"{rows} rows", *parameter_shape(parameters[0], False)]
+    if isinstance(parameters, dict):
+        return [f"{key}:{type(value).__name__}" for key, value in parameters.items()]
+    if isinstance(parameters, list | tuple):
+        return [type(value).__name__ for value in parameters]
+    return []
+
+
+class SlowQueryLog:
+    """Engine listeners, repeat counters and ring buffer of slow queries."""
+
+    def __init__(
+        self,
+        threshold_ms: float,
+        buffer_size: int,
+        explain: bool,
+        explain_after: int,
+    ) -> None:
+        self.threshold_ms = threshold_ms
+        self.explain = explain
+        self.explain_after = explain_after
+        self.recent: deque[SlowQuery] = deque(maxlen=buffer_size)
+        self._occurrences: dict[str, int] = {}
+        self._explained: set[str] = set()
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._engine: AsyncEngine | None = None
+
+    def install(self, engine: AsyncEngine) -> None:
+        """Listen for slow statements on an async engine."""
+        self._engine = engine
+        event.listen(engine.sync_engine, "before_cursor_execute", self._before)
+        event.listen(engine.sync_engine, "after_cursor_execute", self._after)
+
+    def uninstall(self) -> None:
+        if self._engine is not None:
+            event.remove(self._engine.sync_engine, "before_cursor_execute", self._before)
+            event.remove(self._engine.sync_engine, "after_cursor_execute", self._after)
+            self._engine = None
+
+    def entries(self) -> list[dict[str, Any]]:
+        """Buffered slow queries, newest first."""
+        return [asdict(entry) for entry in reversed(self.recent)]
+
+    def _before(
+        self,
+        conn: Connection,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: ExecutionContext,
+        executemany: bool,
+    ) -> None:
+        setattr(context, _START_ATTR, time.perf_counter_ns())
+
+    def _after(
+        self,
+        conn: Connection,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: ExecutionContext,
+        executemany: bool,
+    ) -> None:
+        start = getattr(context, _START_ATTR, None)
+        if start is None:
+            return
+        duration_ms = (time.perf_counter_ns() - start) / 1_000_000
+        if duration_ms < self.threshold_ms or context.execution_options.get(SKIP_OPTION):
+            return
+        self.record(statement, parameters, executemany, duration_ms)
+
+    def record(
+        self, statement: str, parameters: Any, executemany: bool, duration_ms: float
+    ) -> SlowQuery:
+        """Log and buffer a slow execution; schedule EXPLAIN if it is a repeat."""
+        shape = normalize_sql(statement)
+        if shape not in self._occurrences and len(self._occurrences) >= MAX_TRACKED_SHAPES:
+            self._occurrences.clear()
+        occurrences = self._occurrences.get(shape, 0) + 1
+        self._occurrences[shape] = occurrences
+
+        entry = SlowQuery(
+            timestamp=datetime.now(timezone.utc).isoformat(),
+            duration_ms=round(duration_ms, 2),
+            statement=shape,
+            parameter_types=parameter_shape(parameters, executemany),
+            tenant_id=current_tenant.get(),
+            occurrences=occurrences,
+        )
+        self.recent.append(entry)
+        logger.warning(
+            f"Slow query ({entry.duration_ms}ms): {shape}",
+            extra={
+                "duration_ms": entry.duration_ms,
+                "statement": shape,
+                "parameter_types": entry.parameter_types,
+                "tenant_id": entry.tenant_id,
+                "occurrences": occurrences,
+            },
+        )
+
+        if (
+            self.explain
+            and not executemany
+            and occurrences >= self.explain_after
+            and shape not in self._explained
+            and shape.upper().startswith("SELECT")
+        ):
+            self._schedule_explain(entry, statement, parameters)
+        return entry
+
+    def _schedule_explain(self, entry: SlowQuery, statement: str, parameters: Any) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._explained.add(entry.statement)
+        # Empty context: the EXPLAIN is not part of the request's timing or budget
+        task = contextvars.Context().run(
+            loop.create_task, self._explain(entry, statement, parameters)
+        )
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _explain(self, entry: SlowQuery, statement: str, parameters: Any) -> None:
+        if self._engine is None:
+            return
+        # A separate connection from the pool; the tenant is sent with BEGIN
+        current_tenant.set(entry.tenant_id)
+        try:
+            async with self._engine.connect() as conn:
+                conn = await conn.execution_options(**{SKIP_OPTION: True})
+                async with conn.begin() as transaction:
+                    await conn.execute(
+                        text(f"SET LOCAL statement_timeout = {EXPLAIN_TIMEOUT_MS}")
+                    )
+                    result = await conn.exec_driver_sql(
+                        f"EXPLAIN (ANALYZE, BUFFERS) {statement}", parameters
+                    )
+                    entry.plan = "\n".join(row[0] for row in result)
+                    await transaction.rollback()
+        except Exception as e:
+            logger.warning(f"EXPLAIN failed for slow query {entry.statement}: {e}")
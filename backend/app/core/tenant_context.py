@@ -0,0 +1,108 @@
+"""RLS tenant context applied without an extra database round-trip.
+
+RLS policies read `app.current_tenant`. Setting it with a standalone
+`SELECT set_config(...)` costs one network round-trip per request before any
+real query runs. Instead, the tenant for the current request is kept in a
+context variable and asyncpg connections are created with
+TenantAwareConnection, which appends a transaction-local set_config to the
+`BEGIN` that asyncpg already sends with the first statement of every
+transaction. Both run in one simple-query message, so applying the tenant is
+free.
+
+Because the setting is transaction-local (`is_local = true`), it is cleared
+by the COMMIT or ROLLBACK that ends the transaction, including the rollback
+the pool issues when a connection is returned. A pooled connection can never
+carry one tenant's context into another request.
+
+Connections with AUTOCOMMIT isolation never send BEGIN and therefore never
+get a tenant; RLS-protected queries must run inside a transaction.
+"""
+
+from contextvars import ContextVar, Token
+from typing import Any
+
+import asyncpg
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Tenant of the current request. Each asyncio task (one per request) gets its
+# own copy, so concurrent requests cannot see each other's tenant.
+current_tenant: ContextVar[int | None] = ContextVar("current_tenant", default=None)
+
+SET_TENANT_SQL = "SELECT set_config('app.current_tenant', '{tenant_id}', true)"
+
+# session.info key holding the token to restore the tenant set by apply_tenant
+_TENANT_TOKEN_KEY = "tenant_context_token"
+
+
+def with_tenant(query: str, tenant_id: int | None) -> str:
+    """Append the tenant set_config to a BEGIN statement.
+
+    Args:
+        query: Transaction start statement generated by asyncpg
+        tenant_id: Tenant to apply, or None to leave the query unchanged
+
+    Returns:
+        str: Query to send to PostgreSQL
+    """
+    if tenant_id is None or not query.startswith("BEGIN"):
+        return query
+    # int() guards the inlined literal; simple-query messages take no parameters
+    statement = SET_TENANT_SQL.format(tenant_id=int(tenant_id))
+    return f"{query.rstrip().rstrip(';')}; {statement};"
+
+
+class TenantAwareConnection(asyncpg.Connection):  # type: ignore[misc]
+    """asyncpg connection that applies the current tenant when a transaction starts."""
+
+    async def execute(
+        self, query: str, *args: Any, timeout: float | None = None
+    ) -> str:
+        if not args:
+            query = with_tenant(query, current_tenant.get())
+        result: str = await super().execute(query, *args, timeout=timeout)
+        return result
+
+
+async def apply_tenant(session: AsyncSession, tenant_id: int) -> None:
+    """Make `tenant_id` the RLS tenant for the session's current and future transactions.
+
+    Usually this only updates the context variable and the next BEGIN carries
+    the setting. If the session's connection is already inside a transaction
+    (for example the user was just loaded from the database), the setting is
+    applied to that transaction directly.
+
+    The previous tenant is restored by reset_tenant() when the session's
+    dependency closes, so the tenant does not outlive the request in work
+    spawned later from the same context.
+
+    Args:
+        session: AsyncSession - The database session
+        tenant_id: int - The tenant ID from the authenticated user
+    """
+    token = current_tenant.set(tenant_id)
+    # Keep the first token: resetting it restores the value from before the request
+    session.info.setdefault(_TENANT_TOKEN_KEY, token)
+    if not session.in_transaction():
+        return
+
+    connection = await session.connection()
+    raw_connection = await connection.get_raw_connection()
+    driver_connection = raw_connection.driver_connection
+    if driver_connection is not None and driver_connection.is_in_transaction():
+        await session.execute(
+            text("SELECT set_config('app.current_tenant', :tenant_id, true)"),
+            {"tenant_id": str(tenant_id)},
+        )
+
+
+def reset_tenant(session: AsyncSession) -> None:
+    """Restore the tenant that was current before apply_tenant() on this session."""
+    token: Token[int | None] | None = session.info.pop(_TENANT_TOKEN_KEY, None)
+    if token is None:
+        return
+    try:
+        current_tenant.reset(token)
+    except ValueError:
+        # Closed from another context (token is bound to the one it was set in)
+        current_tenant.set(None)
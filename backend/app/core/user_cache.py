@@ -0,0 +1,183 @@
+"""Short-TTL cache of authenticated user snapshots.
+
+Authenticated requests only need a handful of user fields (id, tenant, role,
+flags) to authorize and set RLS tenant context. This module caches those
+fields so the common path skips the `SELECT user WHERE id=...` round-trip:
+
+- L1: per-process LRU with a short TTL (bounded staleness across workers)
+- L2: Redis with a longer TTL, shared by all workers
+- Explicit invalidation on user updates, deletes and password changes
+
+Redis failures degrade to a database lookup, mirroring app.core.cache.
+"""
+import json
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select
+
+from app.core.config import settings
+from app.core.redis import RedisClient
+from app.models import User
+
+logger = logging.getLogger(__name__)
+
+REDIS_KEY_PREFIX = "user_snapshot"
+
+
+@dataclass(frozen=True)
+class UserSnapshot:
+    """Compact, immutable view of a user for authorization checks."""
+
+    id: uuid.UUID
+    tenant_id: int | None
+    role: str | None
+    is_active: bool
+    is_superuser: bool
+    is_verified: bool
+
+    @classmethod
+    def from_user(cls, user: User) -> "UserSnapshot":
+        return cls(
+            id=user.id,
+            tenant_id=user.tenant_id,
+            role=user.role,
+            is_active=user.is_active,
+            is_superuser=user.is_superuser,
+            is_verified=user.is_verified,
+        )
+
+    def to_json(self) -> str:
+        data = asdict(self)
+        data["id"] = str(self.id)
+        return json.dumps(data)
+
+    @classmethod
+    def from_json(cls, raw: str) -> "UserSnapshot":
+        data = json.loads(raw)
+        data["id"] = uuid.UUID(data["id"])
+        return cls(**data)
+
+
+class UserSnapshotCache:
+    """Two-level (process LRU + Redis) cache of UserSnapshot objects."""
+
+    def __init__(self, max_entries: int, local_ttl: float, redis_ttl: int) -> None:
+        self.max_entries = max_entries
+        self.local_ttl = local_ttl
+        self.redis_ttl = redis_ttl
+        self._entries: OrderedDict[uuid.UUID, tuple[float, UserSnapshot]] = (
+            OrderedDict()
+        )
+        self.local_hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _redis_key(user_id: uuid.UUID) -> str:
+        return f"{REDIS_KEY_PREFIX}:{user_id}"
+
+    def _get_local(self, user_id: uuid.UUID) -> UserSnapshot | None:
+        entry = self._entries.get(user_id)
+        if entry is None:
+            return None
+        expires_at, snapshot = entry
+        if expires_at < time.monotonic():
+            del self._entries[user_id]
+            return None
+        self._entries.move_to_end(user_id)
+        return snapshot
+
+    def _set_local(self, snapshot: UserSnapshot) -> None:
+        self._entries[snapshot.id] = (time.monotonic() + self.local_ttl, snapshot)
+        self._entries.move_to_end(snapshot.id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def get(
+        self, user_id: uuid.UUID, session: AsyncSession
+    ) -> UserSnapshot | None:
+        """Return the user's snapshot, loading it from the database on a miss.
+
+        Args:
+            user_id: User UUID from the JWT subject
+            session: Database session used only on a cache miss
+
+        Returns:
+            UserSnapshot, or None if the user does not exist
+        """
+        snapshot = self._get_local(user_id)
+        if snapshot is not None:
+            self.local_hits += 1
+            return snapshot
+
+        try:
+            redis = await RedisClient.get_client()
+            raw = await redis.get(self._redis_key(user_id))
+            if raw is not None:
+                snapshot = UserSnapshot.from_json(raw)
+                self.redis_hits += 1
+                self._set_local(snapshot)
+                return snapshot
+        except Exception as e:
+            logger.warning(f"User cache read error for {user_id}: {e}")
+
+        self.misses += 1
+        result = await session.execute(select(User).where(User.id == user_id))
+        user = result.scalar_one_or_none()
+        if user is None:
+            return None
+
+        snapshot = UserSnapshot.from_user(user)
+        await self.set(snapshot)
+        return snapshot
+
+    async def set(self, snapshot: UserSnapshot) -> None:
+        """Store a snapshot in both cache levels."""
+        self._set_local(snapshot)
+        try:
+            redis = await RedisClient.get_client()
+            await redis.setex(
+                self._redis_key(snapshot.id), self.redis_ttl, snapshot.to_json()
+            )
+        except Exception as e:
+            logger.warning(f"User cache write error for {snapshot.id}: {e}")
+
+    async def invalidate(self, user_id: uuid.UUID) -> None:
+        """Drop a user's snapshot after it changes.
+
+        Other workers' L1 entries expire within USER_CACHE_LOCAL_TTL_SECONDS.
+        """
+        self._entries.pop(user_id, None)
+        try:
+            redis = await RedisClient.get_client()
+            await redis.delete(self._redis_key(user_id))
+        except Exception as e:
+            logger.warning(f"User cache invalidation error for {user_id}: {e}")
+
+    def clear_local(self) -> None:
+        """Drop all L1 entries (e.g. between tests)."""
+        self._entries.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """Hit/miss counters for monitoring."""
+        lookups = self.local_hits + self.redis_hits + self.misses
+        return {
+            "local_hits": self.local_hits,
+            "redis_hits": self.redis_hits,
+            "misses": self.misses,
+            "hit_ratio": round((lookups - self.misses) / lookups, 4) if lookups else 0.0,
+            "local_entries": len(self._entries),
+        }
+
+
+user_snapshot_cache = UserSnapshotCache(
+    max_entries=settings.USER_CACHE_MAX_ENTRIES,
+    local_ttl=settings.USER_CACHE_LOCAL_TTL_SECONDS,
+    redis_ttl=settings.USER_CACHE_TTL_SECONDS,
+)
@@ -1,21 +1,21 @@
+import asyncio
 import logging
 
-from sqlmodel import Session
-
-from app.core.db import engine, init_db
+from app.core.db import async_engine, async_session_maker, init_db
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-def init() -> None:
-    with Session(engine) as session:
-        init_db(session)
+async def init() -> None:
+    async with async_session_maker() as session:
+        await init_db(session)
+    await async_engine.dispose()
 
 
 def main() -> None:
     logger.info("Creating initial data")
-    init()
+    asyncio.run(init())
     logger.info("Initial data created")
 
 
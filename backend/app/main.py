@@ -1,7 +1,11 @@
+import asyncio
 import os
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 
 import sentry_sdk
 from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
 from fastapi.routing import APIRoute
 from sentry_sdk.integrations.celery import CeleryIntegration
 from sentry_sdk.integrations.fastapi import FastApiIntegration
@@ -10,13 +14,17 @@ from sentry_sdk.integrations.sqlalchemy import SqlalchemyIntegration
 from starlette.middleware.cors import CORSMiddleware
 
 from app.api.main import api_router
-from app.api.middleware.performance import performance_middleware
 from app.core.config import settings
+from app.core.db import async_engines
+from app.core.logging_config import configure_logging
+from app.core.metrics import request_metrics
+from app.core.query_budget import query_budget_guard
 from app.middleware.error_handlers import register_exception_handlers
 from app.middleware.logging import RequestLoggingMiddleware
 
 # Import Celery app for task autodiscovery
 from app.workers.celery_app import celery_app  # noqa: F401
+from app.workers.event_monitor import celery_event_monitor
 
 
 def custom_generate_unique_id(route: APIRoute) -> str:
@@ -46,6 +54,20 @@ def scrub_sensitive_data(event: dict, hint: dict) -> dict | None:  # noqa: ARG00
     return event
 
 
+configure_logging(
+    level=settings.LOG_LEVEL,
+    log_format=settings.LOG_FORMAT,
+    sampling=settings.LOG_SAMPLING,
+    queue_size=settings.LOG_QUEUE_SIZE,
+)
+
+if settings.QUERY_BUDGET_MODE != "off":
+    query_budget_guard.enable(
+        [engine.sync_engine for engine in async_engines],
+        mode=settings.QUERY_BUDGET_MODE,
+        default_max_repeats=settings.QUERY_BUDGET_MAX_REPEATS,
+    )
+
 if settings.SENTRY_DSN:
     sentry_sdk.init(
         dsn=str(settings.SENTRY_DSN),
@@ -65,10 +87,21 @@ if settings.SENTRY_DSN:
         profiles_sample_rate=0.1,
     )
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:  # noqa: ARG001
+    # Celery worker/task snapshot for /monitoring (see app.workers.event_monitor)
+    if settings.CELERY_EVENT_MONITOR_ENABLED:
+        celery_event_monitor.start()
+    yield
+    await asyncio.to_thread(celery_event_monitor.stop)
+
+
 app = FastAPI(
     title=settings.PROJECT_NAME,
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
     generate_unique_id_function=custom_generate_unique_id,
+    lifespan=lifespan,
 )
 
 # Middleware Stack (order matters!)
@@ -82,13 +115,10 @@ if settings.all_cors_origins:
         allow_headers=["*"],
     )
 
-# 2. Performance Monitoring Middleware
-app.middleware("http")(performance_middleware)
-
-# 3. Request Logging Middleware
+# 2. Request Logging + Performance Monitoring Middleware (pure ASGI)
 app.add_middleware(RequestLoggingMiddleware)
 
-# 4. Exception Handlers (register after middleware)
+# 3. Exception Handlers (register after middleware)
 register_exception_handlers(app)
 
 app.include_router(api_router, prefix=settings.API_V1_STR)
@@ -102,3 +132,12 @@ async def health():
     if the application is running. Use /api/v1/health for detailed checks.
     """
     return {"status": "healthy"}
+
+
+@app.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+async def metrics() -> str:
+    """Per-route request latency histograms in Prometheus text format.
+
+    Aggregated across all workers through Redis (see app.core.metrics).
+    """
+    return await request_metrics.render()
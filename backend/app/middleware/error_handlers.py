@@ -18,6 +18,8 @@ from fastapi import FastAPI, HTTPException, Request, status
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
 
+from app.services.password_service import PasswordHasherBusyError
+
 logger = logging.getLogger("ayni.api")
 
 
@@ -105,6 +107,27 @@ def register_exception_handlers(app: FastAPI) -> None:
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         )
 
+    @app.exception_handler(PasswordHasherBusyError)
+    async def password_hasher_busy_handler(
+        request: Request, exc: PasswordHasherBusyError
+    ) -> JSONResponse:
+        """Apply backpressure when the password hashing pool is saturated."""
+        request_id = getattr(request.state, "request_id", None)
+
+        logger.warning(
+            f"Password hashing overloaded: {exc}",
+            extra={"request_id": request_id, "path": request.url.path},
+        )
+
+        response = format_error_response(
+            error_type="Service Unavailable",
+            detail="Server is busy. Please retry shortly.",
+            request_id=request_id,
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        )
+        response.headers["Retry-After"] = "1"
+        return response
+
     @app.exception_handler(Exception)
     async def generic_exception_handler(
         request: Request, exc: Exception
@@ -6,63 +6,125 @@ This middleware:
 2. Logs incoming requests with method, path, request_id, timestamp
 3. Logs outgoing responses with status_code, duration_ms, request_id
 4. Adds request_id to request.state for access by exception handlers
+5. Adds X-Request-ID and X-Response-Time headers and flags slow requests
+6. Collects DB/Redis time for the request (app.core.request_timing) and
+   reports it in a Server-Timing header and the response log
+7. When query budgets are enabled, checks the route's budget
+   (app.core.query_budget) after the request completes
+
+It is a pure ASGI middleware rather than a BaseHTTPMiddleware: the request
+runs in the server's task and the response is passed through untouched, so
+there is no extra task or body stream wrapper per request and streaming
+responses are not buffered.
 """
 
 import logging
 import time
 import uuid
-from collections.abc import Callable
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.api.middleware.performance import (
+    format_response_time,
+    record_request,
+    route_template,
+)
+from app.core.query_budget import query_budget_guard
+from app.core.request_timing import RequestTiming, request_timing
 
 # Configure structured JSON-like logging
 logger = logging.getLogger("ayni.api")
 
 
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
-    """Middleware for logging requests and responses with unique request IDs."""
+class RequestLoggingMiddleware:
+    """Middleware for logging, timing and tagging requests with unique IDs."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        """Process request, log details, and measure response time."""
         # Generate unique request ID
         request_id = str(uuid.uuid4())
 
         # Store request_id in request state for access by handlers
-        request.state.request_id = request_id
+        scope.setdefault("state", {})["request_id"] = request_id
+
+        method = scope["method"]
+        path = scope["path"]
+        client = scope.get("client")
 
         # Log incoming request
         logger.info(
             "Incoming request",
             extra={
                 "request_id": request_id,
-                "method": request.method,
-                "path": request.url.path,
-                "query_params": str(request.query_params),
-                "client_host": request.client.host if request.client else None,
+                "method": method,
+                "path": path,
+                "query_params": scope.get("query_string", b"").decode("latin-1"),
+                "client_host": client[0] if client else None,
             },
         )
 
-        # Measure request duration
-        start_time = time.time()
-
-        # Process request
-        response = await call_next(request)
+        timing = RequestTiming()
+        timing_token = request_timing.set(timing)
+        if query_budget_guard.enabled:
+            queries, queries_token = query_budget_guard.start()
+        else:
+            queries = None
+        start_ns = time.perf_counter_ns()
+        status_code = 500
 
-        # Calculate duration
-        duration_ms = round((time.time() - start_time) * 1000, 2)
+        async def send_with_headers(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                # Time to first byte, as measured by the previous middleware
+                duration_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+                headers = MutableHeaders(scope=message)
+                headers.append("X-Request-ID", request_id)
+                headers.append("X-Response-Time", format_response_time(duration_ms))
+                headers.append("Server-Timing", timing.server_timing(duration_ms))
+            await send(message)
 
-        # Log outgoing response
-        logger.info(
-            "Outgoing response",
-            extra={
-                "request_id": request_id,
-                "status_code": response.status_code,
-                "duration_ms": duration_ms,
-            },
-        )
+        try:
+            await self.app(scope, receive, send_with_headers)
+        finally:
+            # Full duration, including streamed response bodies
+            duration_ms = round((time.perf_counter_ns() - start_ns) / 1_000_000, 2)
+            # Work from here on (log queue, metrics flush) is not the request's
+            request_timing.reset(timing_token)
+            if queries is not None:
+                query_budget_guard.stop(queries_token)
 
-        # Add request_id to response headers
-        response.headers["X-Request-ID"] = request_id
+            # Log outgoing response
+            logger.info(
+                "Outgoing response",
+                extra={
+                    "request_id": request_id,
+                    "status_code": status_code,
+                    "duration_ms": duration_ms,
+                    **timing.log_fields(),
+                },
+            )
+            record_request(
+                method,
+                path,
+                route_template(scope),
+                status_code,
+                duration_ms,
+                request_id,
+                timing,
+            )
 
-        return response
+        if queries is not None:
+            route = scope.get("route")
+            query_budget_guard.check(
+                queries,
+                query_budget_guard.budget_for(getattr(route, "endpoint", None)),
+                f"{method} {route_template(scope)}",
+            )
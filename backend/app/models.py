@@ -154,8 +154,11 @@ class RefreshToken(SQLModel, table=True):
     user_id: uuid.UUID = Field(
         foreign_key="user.id", nullable=False, ondelete="CASCADE", index=True
     )
+    # Unique JWT ID (jti claim) for O(1) lookup; NULL for legacy bcrypt-hashed rows
+    jti: str | None = Field(default=None, max_length=36, unique=True, index=True)
     token_hash: str = Field(max_length=255, nullable=False, index=True)
-    expires_at: datetime = Field(nullable=False)
+    # Indexed for the chunked expired-token cleanup
+    expires_at: datetime = Field(nullable=False, index=True)
     created_at: datetime = Field(default_factory=datetime.utcnow)
     used_at: datetime | None = Field(default=None)
     revoked_at: datetime | None = Field(default=None)
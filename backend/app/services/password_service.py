@@ -0,0 +1,102 @@
+"""
+Async password hashing service.
+
+bcrypt (cost factor 12) takes ~250ms per call, so hashing or verifying a
+password directly inside an async handler blocks the event loop for every
+other request. This service runs the work on a bounded worker pool and
+rejects new work with a 503 once too many calls are queued.
+"""
+
+import asyncio
+import logging
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any
+
+from app.core import security
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class PasswordHasherBusyError(Exception):
+    """Raised when the password hashing queue is full (mapped to HTTP 503)."""
+
+
+class PasswordHasher:
+    """Singleton worker pool for bcrypt hashing and verification."""
+
+    _executor: Executor | None = None
+    _pending: int = 0
+
+    @classmethod
+    def get_executor(cls) -> Executor:
+        """Get or create the worker pool configured in settings.
+
+        Returns:
+            Executor: Shared thread or process pool.
+        """
+        if cls._executor is None:
+            if settings.PASSWORD_HASH_EXECUTOR == "process":
+                cls._executor = ProcessPoolExecutor(
+                    max_workers=settings.PASSWORD_HASH_WORKERS
+                )
+            else:
+                cls._executor = ThreadPoolExecutor(
+                    max_workers=settings.PASSWORD_HASH_WORKERS,
+                    thread_name_prefix="password-hash",
+                )
+        return cls._executor
+
+    @classmethod
+    def pending(cls) -> int:
+        """Number of hash/verify calls currently running or queued."""
+        return cls._pending
+
+    @classmethod
+    async def _run(cls, func: Any, *args: Any) -> Any:
+        # Only touched from the event loop thread, so a plain counter is safe
+        if cls._pending >= settings.PASSWORD_HASH_MAX_PENDING:
+            logger.warning(
+                "Password hashing queue full",
+                extra={"pending": cls._pending},
+            )
+            raise PasswordHasherBusyError("Password hashing queue is full")
+
+        cls._pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(cls.get_executor(), func, *args)
+        finally:
+            cls._pending -= 1
+
+    @classmethod
+    async def hash(cls, password: str) -> str:
+        """Hash a password with bcrypt on the worker pool.
+
+        Raises:
+            PasswordHasherBusyError: If the queue is full
+        """
+        result: str = await cls._run(security.get_password_hash, password)
+        return result
+
+    @classmethod
+    async def verify(cls, plain_password: str, hashed_password: str | None) -> bool:
+        """Verify a password against a bcrypt hash on the worker pool.
+
+        A None hash (OAuth-only users) returns False after a dummy verify,
+        matching passlib's timing-safe behaviour.
+
+        Raises:
+            PasswordHasherBusyError: If the queue is full
+        """
+        result: bool = await cls._run(
+            security.verify_password, plain_password, hashed_password
+        )
+        return result
+
+    @classmethod
+    def shutdown(cls) -> None:
+        """Shut down the worker pool (it is recreated on next use)."""
+        if cls._executor is not None:
+            cls._executor.shutdown(wait=False, cancel_futures=True)
+            cls._executor = None
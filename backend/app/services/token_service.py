@@ -4,22 +4,37 @@ Token service for refresh token management.
 Handles refresh token creation, validation, rotation, and revocation.
 """
 
+import logging
+import time
 import uuid
 from datetime import datetime, timedelta
+from typing import Any, cast
 
-from sqlmodel import select
+from sqlalchemy import CursorResult, delete
+from sqlmodel import col, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.core.config import settings
-from app.core.security import create_refresh_token, decode_token, get_password_hash
+from app.core.security import (
+    create_refresh_token,
+    decode_token,
+    hash_refresh_token,
+    verify_refresh_token_hash,
+)
 from app.models import RefreshToken, User
+from app.services.password_service import PasswordHasher, PasswordHasherBusyError
+
+logger = logging.getLogger("ayni.services.token")
 
 
 async def create_and_store_refresh_token(
     user_id: uuid.UUID, session: AsyncSession
 ) -> str:
     """
-    Create a refresh token and store its hash in the database.
+    Create a refresh token and store its keyed digest in the database.
+
+    Each token carries a unique jti claim so it can later be found with a
+    single indexed lookup instead of hashing against every stored row.
 
     Args:
         user_id: User UUID
@@ -30,17 +45,16 @@ async def create_and_store_refresh_token(
     """
     # Generate refresh token with 30-day expiration
     expires_delta = timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+    jti = str(uuid.uuid4())
     refresh_token = create_refresh_token(
-        subject=str(user_id), expires_delta=expires_delta
+        subject=str(user_id), expires_delta=expires_delta, jti=jti
     )
 
-    # Hash the token for secure storage (same bcrypt cost as passwords: 12)
-    token_hash = get_password_hash(refresh_token)
-
-    # Store in database
+    # Store HMAC digest (token is a signed high-entropy JWT, no need for bcrypt)
     db_refresh_token = RefreshToken(
         user_id=user_id,
-        token_hash=token_hash,
+        jti=jti,
+        token_hash=hash_refresh_token(refresh_token),
         expires_at=datetime.utcnow() + expires_delta,
     )
     session.add(db_refresh_token)
@@ -49,6 +63,57 @@ async def create_and_store_refresh_token(
     return refresh_token
 
 
+async def _find_refresh_token(
+    token: str,
+    payload: dict[str, Any],
+    user_id: uuid.UUID,
+    session: AsyncSession,
+    *,
+    check_expiry: bool,
+) -> RefreshToken | None:
+    """
+    Find the active database row matching a raw refresh token.
+
+    Tokens with a jti claim are resolved with one indexed lookup. Tokens
+    issued before jti support fall back to a bcrypt scan over the user's
+    legacy rows; those rows age out after REFRESH_TOKEN_EXPIRE_DAYS.
+
+    Args:
+        token: Raw refresh token string
+        payload: Decoded token payload
+        user_id: User UUID from the token subject
+        session: Database session
+        check_expiry: Whether to exclude rows past expires_at
+
+    Returns:
+        Matching RefreshToken row, or None if not found or no longer active
+    """
+    statement = (
+        select(RefreshToken)
+        .where(RefreshToken.user_id == user_id)
+        .where(RefreshToken.used_at.is_(None))
+        .where(RefreshToken.revoked_at.is_(None))
+    )
+    if check_expiry:
+        statement = statement.where(RefreshToken.expires_at > datetime.utcnow())
+
+    jti = payload.get("jti")
+    if jti:
+        result = await session.execute(statement.where(RefreshToken.jti == jti))
+        db_token: RefreshToken | None = result.scalar_one_or_none()
+        if db_token and verify_refresh_token_hash(token, db_token.token_hash):
+            return db_token
+        return None
+
+    # Legacy path: rows created before jti support store a bcrypt hash
+    result = await session.execute(statement.where(col(RefreshToken.jti).is_(None)))
+    for db_token in result.scalars().all():
+        if await PasswordHasher.verify(token, db_token.token_hash):
+            return db_token
+
+    return None
+
+
 async def verify_refresh_token(token: str, session: AsyncSession) -> User | None:
     """
     Verify refresh token and return associated user.
@@ -90,30 +155,17 @@ async def verify_refresh_token(token: str, session: AsyncSession) -> User | None
         if not user or not user.is_active:
             return None
 
-        # Hash token to compare with stored hash
-        # Note: We can't use verify_password directly because we need to find the token first
-        # Instead, we'll fetch all user's refresh tokens and check each one
-        # This is acceptable because users typically have few refresh tokens (1-3)
-
-        result = await session.execute(
-            select(RefreshToken)
-            .where(RefreshToken.user_id == user_id)
-            .where(RefreshToken.used_at.is_(None))
-            .where(RefreshToken.revoked_at.is_(None))
-            .where(RefreshToken.expires_at > datetime.utcnow())
+        db_token = await _find_refresh_token(
+            token, payload, user_id, session, check_expiry=True
         )
-        valid_tokens = result.scalars().all()
-
-        # Find matching token by comparing hash
-        # Import verify_password here to avoid circular import
-        from app.core.security import verify_password
-
-        for db_token in valid_tokens:
-            if verify_password(token, db_token.token_hash):
-                return user
+        if db_token is None:
+            return None
 
-        return None
+        return user
 
+    except PasswordHasherBusyError:
+        # Overload, not an invalid token: let the handler answer 503
+        raise
     except Exception:
         return None
 
@@ -141,32 +193,24 @@ async def invalidate_refresh_token(
 
         user_id = uuid.UUID(user_id_str)
 
-        # Find all valid tokens for this user
-        result = await session.execute(
-            select(RefreshToken)
-            .where(RefreshToken.user_id == user_id)
-            .where(RefreshToken.used_at.is_(None))
-            .where(RefreshToken.revoked_at.is_(None))
+        db_token = await _find_refresh_token(
+            token, payload, user_id, session, check_expiry=False
         )
-        valid_tokens = result.scalars().all()
-
-        # Find matching token
-        from app.core.security import verify_password
-
-        for db_token in valid_tokens:
-            if verify_password(token, db_token.token_hash):
-                # Mark as used or revoked
-                if mark_as == "used":
-                    db_token.used_at = datetime.utcnow()
-                elif mark_as == "revoked":
-                    db_token.revoked_at = datetime.utcnow()
+        if db_token is None:
+            return False
 
-                session.add(db_token)
-                await session.commit()
-                return True
+        # Mark as used or revoked
+        if mark_as == "used":
+            db_token.used_at = datetime.utcnow()
+        elif mark_as == "revoked":
+            db_token.revoked_at = datetime.utcnow()
 
-        return False
+        session.add(db_token)
+        await session.commit()
+        return True
 
+    except PasswordHasherBusyError:
+        raise
     except Exception:
         return False
 
@@ -199,27 +243,56 @@ async def revoke_all_user_tokens(user_id: uuid.UUID, session: AsyncSession) -> i
     return count
 
 
-async def cleanup_expired_tokens(session: AsyncSession) -> int:
+async def cleanup_expired_tokens(
+    session: AsyncSession,
+    batch_size: int | None = None,
+    max_seconds: float | None = None,
+) -> int:
     """
     Delete expired refresh tokens from database (housekeeping task).
 
-    Should be run periodically via Celery task.
+    Run periodically by the app.workers.tokens.cleanup_expired_tokens beat
+    job. Rows are deleted in the database, `batch_size` at a time, with a
+    commit after each chunk so locks and WAL per transaction stay small and
+    an interrupted run keeps the chunks already deleted.
 
     Args:
         session: Database session
+        batch_size: Rows per DELETE, defaults to TOKEN_CLEANUP_BATCH_SIZE
+        max_seconds: Stop starting new chunks after this long (the next run
+            continues where this one stopped)
 
     Returns:
         Number of tokens deleted
     """
-    result = await session.execute(
-        select(RefreshToken).where(RefreshToken.expires_at < datetime.utcnow())
+    batch_size = batch_size or settings.TOKEN_CLEANUP_BATCH_SIZE
+    cutoff = datetime.utcnow()
+    # PostgreSQL has no DELETE ... LIMIT: pick the chunk's ids in a subquery,
+    # skipping rows a concurrent refresh is updating
+    chunk = (
+        select(RefreshToken.id)
+        .where(RefreshToken.expires_at < cutoff)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+        .scalar_subquery()
     )
-    expired_tokens = result.scalars().all()
+    statement = delete(RefreshToken).where(col(RefreshToken.id).in_(chunk))
 
+    start = time.perf_counter()
     count = 0
-    for token in expired_tokens:
-        await session.delete(token)
-        count += 1
-
-    await session.commit()
+    while True:
+        result = cast(CursorResult[Any], await session.execute(statement))
+        await session.commit()
+        count += result.rowcount
+        elapsed = time.perf_counter() - start
+        if result.rowcount < batch_size:
+            break
+        if max_seconds is not None and elapsed >= max_seconds:
+            logger.info("Expired token cleanup stopped at its time budget")
+            break
+
+    rate = count / elapsed if elapsed > 0 else 0.0
+    logger.info(
+        f"Deleted {count} expired refresh tokens in {elapsed:.2f}s ({rate:.0f} rows/s)"
+    )
     return count
@@ -0,0 +1,20 @@
+"""Celery beat schedule for periodic maintenance jobs.
+
+Run a beat process next to the workers (`celery -A app.workers.celery_app
+beat`, the celery-beat service in docker-compose). Each job's task decides
+its queue through TASK_ROUTES and takes a periodic_lock
+(app.workers.locks), so a duplicate enqueue, from a slow previous run or a
+second beat, is skipped instead of run twice.
+"""
+from typing import Any
+
+from celery.schedules import crontab
+
+BEAT_SCHEDULE: dict[str, dict[str, Any]] = {
+    "cleanup-expired-tokens": {
+        "task": "app.workers.tokens.cleanup_expired_tokens",
+        "schedule": crontab(minute=15),  # hourly
+        # A missed run is redone by the next one, no need to queue it up
+        "options": {"expires": 3600},
+    },
+}
@@ -5,10 +5,121 @@ This module initializes the Celery app with:
 - Redis as result backend (database 1)
 - Task routing and retry policies
 - JSON serialization for security
+- Task outcome/runtime statistics (app.workers.task_stats)
+
+Tasks are routed by name (TASK_ROUTES) to queues with their own workers
+(QUEUES), so a long CSV import or rollup never sits in front of an email:
+
+- fast: email sends, token cleanup; short tasks, prefetched in batches
+- ingest: CSV parsing; minutes long, one task at a time per child
+- aggregate: rollups over ingested data
+- scheduled: nightly and other long periodic jobs (see beat_schedule)
+- default: everything not routed above
+
+A worker started for a single queue (`worker -Q ingest`) takes that queue's
+prefetch, concurrency and time limits in celeryd_init; command-line options
+still win. Priorities (0 = highest with the Redis broker) order tasks inside
+a queue: each route sets its queue's default, and apply_async(priority=...)
+can override it.
 """
+from dataclasses import dataclass
+from typing import Any
+
 from celery import Celery
+from celery.signals import (
+    celeryd_init,
+    task_failure,
+    task_prerun,
+    task_retry,
+    task_success,
+)
+from kombu import Queue
 
 from app.core.config import settings
+from app.workers.beat_schedule import BEAT_SCHEDULE
+from app.workers.task_stats import task_stats
+
+
+@dataclass(frozen=True)
+class QueueConfig:
+    prefetch_multiplier: int
+    concurrency: int
+    # Seconds; the soft limit raises SoftTimeLimitExceeded inside the task so
+    # it can clean up, the hard limit kills the child process
+    soft_time_limit: float | None
+    time_limit: float | None
+    # Default priority of tasks routed here, 0 (highest) to 9
+    priority: int
+
+
+DEFAULT_QUEUE = "default"
+
+QUEUES: dict[str, QueueConfig] = {
+    DEFAULT_QUEUE: QueueConfig(
+        prefetch_multiplier=4,
+        concurrency=4,
+        soft_time_limit=None,
+        time_limit=None,
+        priority=5,
+    ),
+    "fast": QueueConfig(
+        prefetch_multiplier=8,
+        concurrency=8,
+        soft_time_limit=30,
+        time_limit=60,
+        priority=0,
+    ),
+    "ingest": QueueConfig(
+        prefetch_multiplier=1,
+        concurrency=2,
+        soft_time_limit=600,
+        time_limit=660,
+        priority=3,
+    ),
+    "aggregate": QueueConfig(
+        prefetch_multiplier=1,
+        concurrency=2,
+        soft_time_limit=300,
+        time_limit=360,
+        priority=3,
+    ),
+    "scheduled": QueueConfig(
+        prefetch_multiplier=1,
+        concurrency=1,
+        soft_time_limit=3600,
+        time_limit=3720,
+        priority=7,
+    ),
+}
+
+# Task name glob -> queue; the first match wins
+TASK_ROUTES: dict[str, str] = {
+    "app.workers.email.*": "fast",
+    "app.workers.tokens.*": "fast",
+    "app.workers.ingest.*": "ingest",
+    "app.workers.aggregate.*": "aggregate",
+    "app.workers.scheduled.*": "scheduled",
+}
+
+
+def task_routes() -> dict[str, dict[str, Any]]:
+    """TASK_ROUTES in the task_routes format, with each queue's priority."""
+    return {
+        pattern: {"queue": queue, "priority": QUEUES[queue].priority}
+        for pattern, queue in TASK_ROUTES.items()
+    }
+
+
+def worker_settings(queue: str) -> dict[str, Any]:
+    """Celery settings for a worker consuming only `queue`."""
+    config = QUEUES[queue]
+    return {
+        "worker_prefetch_multiplier": config.prefetch_multiplier,
+        "worker_concurrency": config.concurrency,
+        "task_soft_time_limit": config.soft_time_limit,
+        "task_time_limit": config.time_limit,
+    }
+
 
 # Initialize Celery with broker and result backend
 celery_app = Celery(
@@ -26,23 +137,72 @@ celery_app.conf.update(
     # Timezone
     timezone="UTC",
     enable_utc=True,
-    # Task routing (default queue for MVP, can add fast/slow queues later)
-    task_default_queue="default",
-    task_default_exchange="default",
-    task_default_routing_key="default",
+    # Task routing (see QUEUES and TASK_ROUTES)
+    task_queues=[Queue(name, routing_key=name) for name in QUEUES],
+    task_routes=task_routes(),
+    task_default_queue=DEFAULT_QUEUE,
+    task_default_exchange=DEFAULT_QUEUE,
+    task_default_routing_key=DEFAULT_QUEUE,
+    task_default_priority=QUEUES[DEFAULT_QUEUE].priority,
+    broker_transport_options={
+        # One Redis list per priority level, consumed highest first
+        "priority_steps": list(range(10)),
+        "sep": ":",
+        "queue_order_strategy": "priority",
+    },
     # Result expiration
     result_expires=3600,  # 1 hour
     # Task retry settings (exponential backoff)
     task_acks_late=True,
     task_reject_on_worker_lost=True,
-    # Worker settings
-    worker_prefetch_multiplier=4,
+    # Worker settings (overridden per queue in _configure_queue_worker)
+    worker_prefetch_multiplier=QUEUES[DEFAULT_QUEUE].prefetch_multiplier,
     worker_max_tasks_per_child=1000,
     # Monitoring and events (enable for Flower and task tracking)
     worker_send_task_events=True,
     task_send_sent_event=True,
     task_track_started=True,
+    # Periodic jobs (see app.workers.beat_schedule)
+    beat_schedule=BEAT_SCHEDULE,
+    # Task modules autodiscovery does not find (it only imports *.tasks)
+    imports=("app.workers.tokens", "app.workers.pipeline"),
 )
 
+
+@celeryd_init.connect  # type: ignore[untyped-decorator]
+def _configure_queue_worker(
+    conf: Any = None, options: dict[str, Any] | None = None, **_kwargs: Any
+) -> None:
+    queues = (options or {}).get("queues") or []
+    if isinstance(queues, str):
+        queues = queues.split(",")
+    if len(queues) == 1 and queues[0] in QUEUES:
+        conf.update(worker_settings(queues[0]))
+
+
+@task_prerun.connect  # type: ignore[untyped-decorator]
+def _record_task_start(task_id: str | None = None, **_kwargs: Any) -> None:
+    task_stats.task_started(task_id)
+
+
+@task_success.connect  # type: ignore[untyped-decorator]
+def _record_task_success(sender: Any = None, **_kwargs: Any) -> None:
+    task_stats.task_finished(sender.request.id, sender.name, "completed")
+
+
+@task_failure.connect  # type: ignore[untyped-decorator]
+def _record_task_failure(
+    sender: Any = None, task_id: str | None = None, **_kwargs: Any
+) -> None:
+    task_stats.task_finished(task_id, sender.name, "failed")
+
+
+@task_retry.connect  # type: ignore[untyped-decorator]
+def _record_task_retry(
+    sender: Any = None, request: Any = None, **_kwargs: Any
+) -> None:
+    task_stats.task_finished(getattr(request, "id", None), sender.name, "retried")
+
+
 # Auto-discover tasks from workers.tasks module
 celery_app.autodiscover_tasks(["app.workers"])
@@ -0,0 +1,273 @@
+"""Live Celery worker and task state from the Celery event stream.
+
+control.inspect() broadcasts to every worker and blocks until the reply
+timeout (1s by default, for each of active/scheduled/reserved/stats), so
+calling it from a request stalls the event loop, for the full timeout when
+workers are slow or missing.
+
+Workers already publish events (worker_send_task_events, task_send_sent_event),
+so instead a daemon thread consumes the event stream and tracks:
+
+- workers, from worker-online/heartbeat/offline events; a worker that misses
+  three heartbeats is dropped, with its tasks
+- tasks that have not finished: reserved (task-received), scheduled (received
+  with an ETA/countdown) and active (task-started); finished tasks are
+  forgotten
+
+After events arrive, and at least every `publish_interval` seconds, the
+thread publishes an immutable snapshot. Monitoring endpoints read
+`celery_event_monitor.snapshot()`, an attribute read.
+
+On (re)connect the thread seeds the state with a single inspect() call, run
+in the thread, so tasks that were already running before the API started
+are visible.
+"""
+import logging
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+from celery import Celery
+
+from app.core.config import settings
+from app.workers.celery_app import celery_app
+
+logger = logging.getLogger("ayni.workers.event_monitor")
+
+# Worker heartbeat interval assumed until a worker reports its own (freq)
+DEFAULT_HEARTBEAT_SECONDS = 2.0
+# A worker is gone after missing this many heartbeats
+HEARTBEAT_MISSES = 3
+# Bound on unfinished tasks kept (oldest are dropped first)
+MAX_TRACKED_TASKS = 10_000
+RECONNECT_DELAY_SECONDS = 5.0
+
+_FINISHED_EVENTS = {
+    "task-succeeded",
+    "task-failed",
+    "task-revoked",
+    "task-rejected",
+    # A retried task is received again under the same ID
+    "task-retried",
+}
+
+
+@dataclass
+class TaskInfo:
+    id: str
+    name: str | None
+    worker: str
+    state: str  # "reserved", "scheduled" or "active"
+    received: float | None = None
+    started: float | None = None
+    eta: str | None = None
+    args: str | None = None
+    kwargs: str | None = None
+
+
+@dataclass
+class WorkerInfo:
+    hostname: str
+    last_heartbeat: float
+    freq: float = DEFAULT_HEARTBEAT_SECONDS
+    active: int = 0
+    processed: int = 0
+    loadavg: list[float] = field(default_factory=list)
+    sw_ver: str | None = None
+
+    def alive(self, now: float) -> bool:
+        return now - self.last_heartbeat < self.freq * HEARTBEAT_MISSES
+
+
+def _empty_snapshot() -> dict[str, Any]:
+    return {
+        "connected": False,
+        "updated_at": None,
+        "workers": {},
+        "active": {},
+        "scheduled": {},
+        "reserved": {},
+    }
+
+
+class CeleryEventMonitor:
+    """Consumes Celery events in a daemon thread and publishes snapshots."""
+
+    def __init__(self, app: Celery, publish_interval: float = 1.0) -> None:
+        self.app = app
+        self.publish_interval = publish_interval
+        self.workers: dict[str, WorkerInfo] = {}
+        self.tasks: dict[str, TaskInfo] = {}
+        self._snapshot: dict[str, Any] = _empty_snapshot()
+        self._connected = False
+        self._last_publish = 0.0
+        self._thread: threading.Thread | None = None
+        self._stop = threading.Event()
+        self._receiver: Any = None
+
+    def snapshot(self) -> dict[str, Any]:
+        """Latest published state (do not mutate)."""
+        return self._snapshot
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="celery-event-monitor", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop.set()
+        if self._receiver is not None:
+            self._receiver.should_stop = True
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    # -- event handling (receiver thread) ---------------------------------
+
+    def handle(self, event: dict[str, Any]) -> None:
+        """Apply one event to the tracked state."""
+        kind = event.get("type", "")
+        hostname = event.get("hostname", "")
+        timestamp = event.get("timestamp") or time.time()
+
+        if kind.startswith("worker-"):
+            if kind == "worker-offline":
+                self._drop_worker(hostname)
+            else:
+                # Local clock: expiry must not depend on worker clock skew
+                now = time.time()
+                worker = self.workers.get(hostname) or WorkerInfo(hostname, now)
+                worker.last_heartbeat = now
+                worker.freq = event.get("freq") or worker.freq
+                worker.active = event.get("active", worker.active)
+                worker.processed = event.get("processed", worker.processed)
+                worker.loadavg = event.get("loadavg") or worker.loadavg
+                worker.sw_ver = event.get("sw_ver") or worker.sw_ver
+                self.workers[hostname] = worker
+        elif kind == "task-received":
+            self._track(
+                TaskInfo(
+                    id=event["uuid"],
+                    name=event.get("name"),
+                    worker=hostname,
+                    state="scheduled" if event.get("eta") else "reserved",
+                    received=timestamp,
+                    eta=event.get("eta"),
+                    args=event.get("args"),
+                    kwargs=event.get("kwargs"),
+                )
+            )
+        elif kind == "task-started":
+            task = self.tasks.get(event["uuid"])
+            if task is None:
+                task = TaskInfo(
+                    id=event["uuid"], name=None, worker=hostname, state="active"
+                )
+                self._track(task)
+            task.state = "active"
+            task.worker = hostname
+            task.started = timestamp
+        elif kind in _FINISHED_EVENTS:
+            self.tasks.pop(event.get("uuid", ""), None)
+
+        if time.monotonic() - self._last_publish >= self.publish_interval:
+            self._publish()
+
+    def _track(self, task: TaskInfo) -> None:
+        if task.id not in self.tasks and len(self.tasks) >= MAX_TRACKED_TASKS:
+            self.tasks.pop(next(iter(self.tasks)))
+        self.tasks[task.id] = task
+
+    def _drop_worker(self, hostname: str) -> None:
+        self.workers.pop(hostname, None)
+        for task_id in [t.id for t in self.tasks.values() if t.worker == hostname]:
+            del self.tasks[task_id]
+
+    def _publish(self) -> None:
+        now = time.time()
+        for worker in [w for w in self.workers.values() if not w.alive(now)]:
+            self._drop_worker(worker.hostname)
+
+        by_state: dict[str, dict[str, list[dict[str, Any]]]] = {
+            "active": {},
+            "scheduled": {},
+            "reserved": {},
+        }
+        for task in self.tasks.values():
+            by_state[task.state].setdefault(task.worker, []).append(asdict(task))
+        self._snapshot = {
+            "connected": self._connected,
+            "updated_at": now,
+            "workers": {name: asdict(w) for name, w in self.workers.items()},
+            **by_state,
+        }
+        self._last_publish = time.monotonic()
+
+    def _seed(self) -> None:
+        """Load the tasks that are already running or queued on workers."""
+        try:
+            inspect = self.app.control.inspect(timeout=1.0)
+            replies = {
+                "active": inspect.active() or {},
+                "reserved": inspect.reserved() or {},
+                "scheduled": inspect.scheduled() or {},
+            }
+        except Exception as e:
+            logger.warning(f"Celery inspect seed failed: {e}")
+            return
+        now = time.time()
+        for state, per_worker in replies.items():
+            for hostname, tasks in per_worker.items():
+                self.workers.setdefault(hostname, WorkerInfo(hostname, now))
+                for entry in tasks:
+                    # scheduled() wraps each task request with its ETA
+                    request = entry.get("request", entry)
+                    self._track(
+                        TaskInfo(
+                            id=request["id"],
+                            name=request.get("name"),
+                            worker=hostname,
+                            state=state,
+                            started=request.get("time_start"),
+                            eta=entry.get("eta"),
+                            args=str(request.get("args")),
+                            kwargs=str(request.get("kwargs")),
+                        )
+                    )
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                with self.app.connection_for_read() as connection:
+                    self._receiver = self.app.events.Receiver(
+                        connection, handlers={"*": self.handle}
+                    )
+                    self._connected = True
+                    self._seed()
+                    self._publish()
+                    # Ask workers for a heartbeat once, so they show up at once
+                    wakeup = True
+                    while not self._stop.is_set():
+                        try:
+                            # Raises timeout after publish_interval without events
+                            self._receiver.capture(
+                                limit=None, timeout=self.publish_interval, wakeup=wakeup
+                            )
+                        except TimeoutError:
+                            self._publish()
+                        wakeup = False
+            except Exception as e:
+                logger.warning(f"Celery event stream disconnected: {e}")
+            self._connected = False
+            self._publish()
+            self._stop.wait(RECONNECT_DELAY_SECONDS)
+
+
+celery_event_monitor = CeleryEventMonitor(
+    celery_app, publish_interval=settings.CELERY_EVENT_MONITOR_INTERVAL_SECONDS
+)
@@ -0,0 +1,49 @@
+"""Redis locks that keep periodic jobs from running concurrently.
+
+Beat may enqueue a job again while the previous run is still going (slow
+run, beat restarted, a second beat started by mistake), and several workers
+consume each queue. A job wrapped in `periodic_lock` runs only where it
+acquires the lock; anywhere else it returns at once.
+
+The lock is a redis-py Lock: SET NX PX with a random token, released only by
+its owner (compare-and-delete in Lua). Its TTL should be at least the job's
+hard time limit, so a worker killed mid-run cannot hold it for longer than
+the run could have lasted.
+"""
+import logging
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from app.core.redis import RedisClient
+
+logger = logging.getLogger("ayni.workers.locks")
+
+LOCK_KEY_PREFIX = "lock:periodic:"
+
+
+@contextmanager
+def periodic_lock(name: str, ttl_seconds: float) -> Iterator[bool]:
+    """Hold the job's lock for the duration of the block, if free.
+
+    Args:
+        name: Job name, shared by every scheduler and worker
+        ttl_seconds: Lock expiry, at least the job's hard time limit
+
+    Yields:
+        bool: True if this process holds the lock and should run the job
+    """
+    lock = RedisClient.get_sync_client().lock(
+        f"{LOCK_KEY_PREFIX}{name}", timeout=ttl_seconds, blocking=False
+    )
+    acquired = lock.acquire()
+    if not acquired:
+        logger.info(f"Skipping {name}: already running elsewhere")
+    try:
+        yield acquired
+    finally:
+        if acquired:
+            try:
+                lock.release()
+            except Exception as e:
+                # Expired (run outlived the TTL) or Redis unavailable
+                logger.warning(f"Failed to release lock for {name}: {e}")
@@ -0,0 +1,353 @@
+"""Staged data pipelines on Celery canvas, checkpointed in Redis.
+
+A Pipeline is a list of Stages run in order. Each stage fans out into one
+task per shard (a location, a month, ...) and fans back in once every shard
+is done, which is a chord; the stages are chained:
+
+    chain(
+        chord(group(run_shard(stage 1, shard) ...), finish_stage(stage 1)),
+        chord(group(run_shard(stage 2, shard) ...), finish_stage(stage 2)),
+        finish_pipeline(),
+    )
+
+Define and register a pipeline at import time of a task module (so workers
+know it), then start it:
+
+    sales_rollup = register_pipeline(
+        Pipeline(
+            "sales_rollup",
+            [
+                Stage("per_location", by_param("location_ids"), load_location),
+                Stage("per_month", by_month(), rollup_month, reduce=total),
+            ],
+        )
+    )
+    run_id = start_pipeline("sales_rollup", {"location_ids": [...], ...})
+
+Stage functions take (params, shard, inputs), where inputs holds the output
+of each finished earlier stage, and return a JSON-serializable result.
+`reduce(params, {shard: result})` makes the stage output; without it the
+output is the shard -> result mapping.
+
+Checkpoints: each shard result is stored in Redis as soon as the shard
+finishes, and each stage output when its fan-in runs. A shard that already
+has a checkpoint returns it without running again, and a finished stage is
+left out of the canvas. With task_acks_late, a shard whose worker died is
+redelivered and rerun; if the run itself failed, resume_pipeline() starts
+it again from the completed shards. Checkpoints expire after
+CHECKPOINT_TTL_SECONDS.
+
+Progress events (shard_done, stage_done, pipeline_done, pipeline_failed)
+are published as JSON on the EVENTS_CHANNEL pub/sub channel and counted in
+the run's meta hash, read by pipeline_progress().
+"""
+import json
+import logging
+import time
+import uuid
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Any, cast
+
+from celery import chain, chord, group
+from celery.canvas import Signature
+from redis import Redis
+
+from app.core.redis import RedisClient
+from app.workers.celery_app import celery_app
+
+logger = logging.getLogger("ayni.workers.pipeline")
+
+KEY_PREFIX = "pipeline:"
+EVENTS_CHANNEL = "pipeline:events"
+CHECKPOINT_TTL_SECONDS = 7 * 86400
+
+# (params, shard, inputs) -> shard result
+StageRunner = Callable[[dict[str, Any], str, dict[str, Any]], Any]
+# (params, {shard: result}) -> stage output
+StageReducer = Callable[[dict[str, Any], dict[str, Any]], Any]
+# params -> shard keys
+Sharder = Callable[[dict[str, Any]], list[str]]
+
+
+@dataclass(frozen=True)
+class Stage:
+    name: str
+    shards: Sharder
+    run: StageRunner
+    reduce: StageReducer | None = None
+    # Queue of the stage's shard and fan-in tasks (see celery_app.QUEUES)
+    queue: str = "aggregate"
+
+
+@dataclass(frozen=True)
+class Pipeline:
+    name: str
+    stages: list[Stage] = field(default_factory=list)
+
+    def stage(self, name: str) -> Stage:
+        return next(stage for stage in self.stages if stage.name == name)
+
+
+PIPELINES: dict[str, Pipeline] = {}
+
+
+def register_pipeline(pipeline: Pipeline) -> Pipeline:
+    """Make the pipeline known to start_pipeline() and the workers."""
+    names = [stage.name for stage in pipeline.stages]
+    if len(set(names)) != len(names):
+        raise ValueError(f"Duplicate stage names in pipeline {pipeline.name}")
+    PIPELINES[pipeline.name] = pipeline
+    return pipeline
+
+
+def by_param(key: str) -> Sharder:
+    """One shard per item of params[key], e.g. location IDs."""
+    return lambda params: [str(item) for item in params[key]]
+
+
+def by_month(start_key: str = "start", end_key: str = "end") -> Sharder:
+    """One "YYYY-MM" shard per month from params[start_key] to params[end_key].
+
+    Both params are ISO dates ("2026-01-01"); the end month is included.
+    """
+
+    def shards(params: dict[str, Any]) -> list[str]:
+        start = date.fromisoformat(params[start_key])
+        end = date.fromisoformat(params[end_key])
+        months = []
+        year, month = start.year, start.month
+        while (year, month) <= (end.year, end.month):
+            months.append(f"{year:04d}-{month:02d}")
+            year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+        return months
+
+    return shards
+
+
+# -- Redis state -------------------------------------------------------------
+
+
+def _key(pipeline_name: str, run_id: str, suffix: str) -> str:
+    return f"{KEY_PREFIX}{pipeline_name}:{run_id}:{suffix}"
+
+
+def _meta_key(pipeline_name: str, run_id: str) -> str:
+    return _key(pipeline_name, run_id, "meta")
+
+
+def _shards_key(pipeline_name: str, run_id: str, stage: str) -> str:
+    return _key(pipeline_name, run_id, f"shards:{stage}")
+
+
+def _outputs_key(pipeline_name: str, run_id: str) -> str:
+    return _key(pipeline_name, run_id, "outputs")
+
+
+def _hset(redis: Redis, key: str, mapping: dict[str, Any]) -> None:
+    with redis.pipeline(transaction=False) as pipe:
+        pipe.hset(key, mapping=mapping)
+        pipe.expire(key, CHECKPOINT_TTL_SECONDS)
+        pipe.execute()  # type: ignore[no-untyped-call]
+
+
+def _publish(redis: Redis, pipeline_name: str, run_id: str, event: str, **data: Any) -> None:
+    payload = {
+        "pipeline": pipeline_name,
+        "run_id": run_id,
+        "event": event,
+        "timestamp": time.time(),
+        **data,
+    }
+    try:
+        redis.publish(EVENTS_CHANNEL, json.dumps(payload))
+    except Exception as e:
+        # Events are informational; the checkpoints are what matters
+        logger.warning(f"Failed to publish {event} for {pipeline_name}/{run_id}: {e}")
+
+
+def _params(redis: Redis, pipeline_name: str, run_id: str) -> dict[str, Any]:
+    raw = cast(str | None, redis.hget(_meta_key(pipeline_name, run_id), "params"))
+    if raw is None:
+        raise LookupError(f"Unknown or expired pipeline run {pipeline_name}/{run_id}")
+    params: dict[str, Any] = json.loads(raw)
+    return params
+
+
+def _outputs(redis: Redis, pipeline_name: str, run_id: str) -> dict[str, Any]:
+    raw = cast(dict[str, str], redis.hgetall(_outputs_key(pipeline_name, run_id)))
+    return {stage: json.loads(value) for stage, value in raw.items()}
+
+
+# -- Tasks -------------------------------------------------------------------
+
+
+@celery_app.task(name="app.workers.pipeline.run_shard")  # type: ignore[untyped-decorator]
+def run_shard(pipeline_name: str, run_id: str, stage_name: str, shard: str) -> Any:
+    """Run one shard of a stage, or return its checkpoint."""
+    redis = RedisClient.get_sync_client()
+    shards_key = _shards_key(pipeline_name, run_id, stage_name)
+    checkpoint = cast(str | None, redis.hget(shards_key, shard))
+    if checkpoint is not None:
+        return json.loads(checkpoint)
+
+    stage = PIPELINES[pipeline_name].stage(stage_name)
+    params = _params(redis, pipeline_name, run_id)
+    result = stage.run(params, shard, _outputs(redis, pipeline_name, run_id))
+
+    _hset(redis, shards_key, {shard: json.dumps(result)})
+    _publish(
+        redis,
+        pipeline_name,
+        run_id,
+        "shard_done",
+        stage=stage_name,
+        shard=shard,
+        done=redis.hlen(shards_key),
+        total=int(
+            cast(str | None, redis.hget(_meta_key(pipeline_name, run_id), f"total:{stage_name}"))
+            or 0
+        ),
+    )
+    return result
+
+
+@celery_app.task(name="app.workers.pipeline.finish_stage")  # type: ignore[untyped-decorator]
+def finish_stage(
+    _shard_results: list[Any], pipeline_name: str, run_id: str, stage_name: str
+) -> None:
+    """Fan-in: combine the stage's shard checkpoints into its output."""
+    redis = RedisClient.get_sync_client()
+    stage = PIPELINES[pipeline_name].stage(stage_name)
+    raw = cast(dict[str, str], redis.hgetall(_shards_key(pipeline_name, run_id, stage_name)))
+    # Keyed by shard, unlike the chord's positional results
+    results = {shard: json.loads(value) for shard, value in raw.items()}
+    params = _params(redis, pipeline_name, run_id)
+    output = stage.reduce(params, results) if stage.reduce else results
+
+    _hset(redis, _outputs_key(pipeline_name, run_id), {stage_name: json.dumps(output)})
+    _hset(redis, _meta_key(pipeline_name, run_id), {"updated_at": time.time()})
+    _publish(redis, pipeline_name, run_id, "stage_done", stage=stage_name)
+
+
+@celery_app.task(name="app.workers.pipeline.finish_pipeline")  # type: ignore[untyped-decorator]
+def finish_pipeline(pipeline_name: str, run_id: str) -> None:
+    redis = RedisClient.get_sync_client()
+    _hset(
+        redis,
+        _meta_key(pipeline_name, run_id),
+        {"status": "completed", "updated_at": time.time()},
+    )
+    _publish(redis, pipeline_name, run_id, "pipeline_done")
+
+
+@celery_app.task(name="app.workers.pipeline.fail_pipeline")  # type: ignore[untyped-decorator]
+def fail_pipeline(pipeline_name: str, run_id: str) -> None:
+    redis = RedisClient.get_sync_client()
+    _hset(
+        redis,
+        _meta_key(pipeline_name, run_id),
+        {"status": "failed", "updated_at": time.time()},
+    )
+    _publish(redis, pipeline_name, run_id, "pipeline_failed")
+
+
+# -- Orchestration -----------------------------------------------------------
+
+
+def _canvas(pipeline: Pipeline, run_id: str, params: dict[str, Any]) -> Signature:
+    """Chain of one chord per unfinished stage, then finish_pipeline."""
+    redis = RedisClient.get_sync_client()
+    done = set(cast(list[str], redis.hkeys(_outputs_key(pipeline.name, run_id))))
+    steps: list[Signature] = []
+    totals: dict[str, Any] = {}
+    for stage in pipeline.stages:
+        if stage.name in done:
+            continue
+        shards = stage.shards(params)
+        totals[f"total:{stage.name}"] = len(shards)
+        if not shards:
+            steps.append(
+                finish_stage.si([], pipeline.name, run_id, stage.name).set(queue=stage.queue)
+            )
+            continue
+        fan_in = finish_stage.s(pipeline.name, run_id, stage.name).set(queue=stage.queue)
+        # Immutable: shards must not receive the previous stage's result
+        # A list, not a generator: group() evaluates generators lazily, after
+        # `stage` has moved on to the last stage
+        fan_out = group(
+            [
+                run_shard.si(pipeline.name, run_id, stage.name, shard).set(queue=stage.queue)
+                for shard in shards
+            ]
+        )
+        steps.append(chord(fan_out, fan_in))
+    steps.append(finish_pipeline.si(pipeline.name, run_id))
+    _hset(
+        redis,
+        _meta_key(pipeline.name, run_id),
+        {"status": "running", "updated_at": time.time(), **totals},
+    )
+    return chain(*steps).on_error(fail_pipeline.si(pipeline.name, run_id))
+
+
+def start_pipeline(
+    pipeline_name: str, params: dict[str, Any], run_id: str | None = None
+) -> str:
+    """Start a run of a registered pipeline.
+
+    Args:
+        pipeline_name: Name given to register_pipeline()
+        params: JSON-serializable parameters, passed to every stage function
+        run_id: Run ID, generated if omitted
+
+    Returns:
+        str: Run ID, for resume_pipeline() and pipeline_progress()
+    """
+    pipeline = PIPELINES[pipeline_name]
+    run_id = run_id or uuid.uuid4().hex
+    redis = RedisClient.get_sync_client()
+    _hset(
+        redis,
+        _meta_key(pipeline_name, run_id),
+        {"params": json.dumps(params), "started_at": time.time()},
+    )
+    _canvas(pipeline, run_id, params).apply_async()
+    logger.info(f"Started pipeline {pipeline_name} run {run_id}")
+    return run_id
+
+
+def resume_pipeline(pipeline_name: str, run_id: str) -> str:
+    """Run a failed or interrupted run again from its checkpoints."""
+    pipeline = PIPELINES[pipeline_name]
+    params = _params(RedisClient.get_sync_client(), pipeline_name, run_id)
+    _canvas(pipeline, run_id, params).apply_async()
+    logger.info(f"Resumed pipeline {pipeline_name} run {run_id}")
+    return run_id
+
+
+def pipeline_outputs(pipeline_name: str, run_id: str) -> dict[str, Any]:
+    """Outputs of the run's finished stages, by stage name."""
+    return _outputs(RedisClient.get_sync_client(), pipeline_name, run_id)
+
+
+def pipeline_progress(pipeline_name: str, run_id: str) -> dict[str, Any]:
+    """Status of a run and, per stage, shards done out of total.
+
+    Returns:
+        dict: status ("running", "completed" or "failed") and stages, each
+        with done, total and completed (its fan-in has run)
+    """
+    pipeline = PIPELINES[pipeline_name]
+    redis = RedisClient.get_sync_client()
+    meta = cast(dict[str, str], redis.hgetall(_meta_key(pipeline_name, run_id)))
+    finished = set(cast(list[str], redis.hkeys(_outputs_key(pipeline_name, run_id))))
+    stages = {}
+    for stage in pipeline.stages:
+        stages[stage.name] = {
+            "done": redis.hlen(_shards_key(pipeline_name, run_id, stage.name)),
+            "total": int(meta.get(f"total:{stage.name}", 0)),
+            "completed": stage.name in finished,
+        }
+    return {"status": meta.get("status"), "stages": stages}
@@ -0,0 +1,206 @@
+"""Time series of Celery task outcomes and runtimes in Redis.
+
+Signal handlers in app.workers.celery_app record every finished task attempt
+(completed, failed or retried) with its runtime. Each attempt is added, in a
+single pipeline, to two Redis hashes:
+
+- the minute bucket  `tasks:stats:m:<epoch minute>`, kept MINUTE_RETENTION
+- the hour bucket    `tasks:stats:h:<epoch hour>`, kept HOUR_RETENTION
+
+Writing the hour rollup together with the minute bucket means it is always
+complete and no job has to compact minutes into hours; both expire on their
+own through EXPIRE.
+
+Hash fields are "task\\toutcome" counters and a runtime histogram per task
+("task\\trt\\t<bucket index>" and "task\\trt\\tsum", in ms). Histograms
+from different buckets add up, so a window is read with one HGETALL per
+bucket (O(buckets)): 60 minute buckets for 1h, 24 or 168 hour buckets for
+24h and 7d. Hour windows are aligned to the hour: they cover the current
+hour and the ones before it. Percentiles are interpolated within the
+histogram buckets.
+
+Recording never raises: a failing Redis only loses statistics.
+"""
+import logging
+import time
+from bisect import bisect_left
+from collections.abc import Iterable, Mapping
+from typing import Any, Literal
+
+from app.core.config import settings
+from app.core.redis import RedisClient
+
+logger = logging.getLogger("ayni.workers.task_stats")
+
+KEY_PREFIX = "tasks:stats:"
+OUTCOMES = ("completed", "failed", "retried")
+# Runtime histogram upper bounds in milliseconds
+RUNTIME_BUCKETS_MS = (
+    10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000, 300000, 900000,
+)
+PERCENTILES = (50, 95, 99)
+
+MINUTE_RETENTION = 2 * 3600
+HOUR_RETENTION = 8 * 86400
+
+Window = Literal["1h", "24h", "7d"]
+# window -> (resolution, bucket seconds, bucket count)
+WINDOWS: dict[str, tuple[str, int, int]] = {
+    "1h": ("m", 60, 60),
+    "24h": ("h", 3600, 24),
+    "7d": ("h", 3600, 168),
+}
+
+_SEP = "\t"
+
+
+def bucket_key(resolution: str, timestamp: float) -> str:
+    seconds = 60 if resolution == "m" else 3600
+    return f"{KEY_PREFIX}{resolution}:{int(timestamp // seconds)}"
+
+
+def window_keys(window: str, now: float) -> list[str]:
+    """Keys of the buckets covering `window`, newest first."""
+    resolution, seconds, count = WINDOWS[window]
+    return [bucket_key(resolution, now - i * seconds) for i in range(count)]
+
+
+def outcome_fields(
+    task_name: str, outcome: str, runtime_ms: float | None
+) -> dict[str, float]:
+    """Hash field increments for one finished task attempt."""
+    fields: dict[str, float] = {f"{task_name}{_SEP}{outcome}": 1}
+    if runtime_ms is not None:
+        index = bisect_left(RUNTIME_BUCKETS_MS, runtime_ms)
+        fields[f"{task_name}{_SEP}rt{_SEP}{index}"] = 1
+        fields[f"{task_name}{_SEP}rt{_SEP}sum"] = runtime_ms
+    return fields
+
+
+def percentile(counts: list[float], q: float) -> float | None:
+    """Estimate the q-th percentile (ms) from histogram bucket counts.
+
+    Interpolates linearly within the bucket; the overflow bucket reports
+    the highest bound.
+    """
+    total = sum(counts)
+    if not total:
+        return None
+    rank = total * q / 100
+    cumulative = 0.0
+    for index, count in enumerate(counts):
+        if count and cumulative + count >= rank:
+            if index >= len(RUNTIME_BUCKETS_MS):
+                return float(RUNTIME_BUCKETS_MS[-1])
+            lower = RUNTIME_BUCKETS_MS[index - 1] if index else 0
+            upper = RUNTIME_BUCKETS_MS[index]
+            return lower + (upper - lower) * (rank - cumulative) / count
+        cumulative += count
+    return float(RUNTIME_BUCKETS_MS[-1])
+
+
+def summarize_buckets(buckets: Iterable[Mapping[str, str | float]]) -> dict[str, Any]:
+    """Merge bucket hashes into totals and per-task counts and percentiles.
+
+    Args:
+        buckets: HGETALL results of the window's buckets
+
+    Returns:
+        dict: completed/failed/retried totals and a `tasks` mapping with each
+        task's counts and runtime_ms (mean and p50/p95/p99)
+    """
+    tasks: dict[str, dict[str, Any]] = {}
+    for fields in buckets:
+        for field, raw in fields.items():
+            task_name, _, slot = field.partition(_SEP)
+            stats = tasks.get(task_name)
+            if stats is None:
+                stats = tasks[task_name] = {
+                    **dict.fromkeys(OUTCOMES, 0),
+                    "histogram": [0.0] * (len(RUNTIME_BUCKETS_MS) + 1),
+                    "runtime_sum": 0.0,
+                }
+            if slot in OUTCOMES:
+                stats[slot] += int(float(raw))
+            elif slot == f"rt{_SEP}sum":
+                stats["runtime_sum"] += float(raw)
+            elif slot.startswith(f"rt{_SEP}"):
+                stats["histogram"][int(slot.rpartition(_SEP)[2])] += float(raw)
+
+    result: dict[str, Any] = dict.fromkeys(OUTCOMES, 0)
+    result["tasks"] = {}
+    for task_name, stats in sorted(tasks.items()):
+        histogram = stats.pop("histogram")
+        runtime_sum = stats.pop("runtime_sum")
+        timed = sum(histogram)
+        stats["runtime_ms"] = {
+            "mean": runtime_sum / timed if timed else None,
+            **{f"p{q}": percentile(histogram, q) for q in PERCENTILES},
+        }
+        for outcome in OUTCOMES:
+            result[outcome] += stats[outcome]
+        result["tasks"][task_name] = stats
+    return result
+
+
+async def read_task_stats(window: Window, now: float | None = None) -> dict[str, Any]:
+    """Task counts and runtime percentiles over a window.
+
+    Args:
+        window: "1h" (minute buckets), "24h" or "7d" (hour buckets)
+        now: Reference time, defaults to the current time
+
+    Returns:
+        dict: summarize_buckets() of the window, with `window` and `buckets`
+    """
+    keys = window_keys(window, time.time() if now is None else now)
+    redis = await RedisClient.get_client()
+    async with redis.pipeline(transaction=False) as pipe:
+        for key in keys:
+            pipe.hgetall(key)
+        buckets = await pipe.execute()
+    return {"window": window, "buckets": len(keys), **summarize_buckets(buckets)}
+
+
+class TaskStatsRecorder:
+    """Records task outcomes from Celery worker processes (synchronous)."""
+
+    def __init__(self, enabled: bool = True) -> None:
+        self.enabled = enabled
+        # task id -> monotonic start, set by task_prerun
+        self._started: dict[str, float] = {}
+
+    def task_started(self, task_id: str | None) -> None:
+        if self.enabled and task_id:
+            self._started[task_id] = time.monotonic()
+
+    def task_finished(
+        self,
+        task_id: str | None,
+        task_name: str | None,
+        outcome: str,
+        now: float | None = None,
+    ) -> None:
+        """Add one finished attempt to its minute and hour buckets."""
+        start = self._started.pop(task_id, None) if task_id else None
+        if not self.enabled or not task_name:
+            return
+        runtime_ms = (time.monotonic() - start) * 1000 if start is not None else None
+        fields = outcome_fields(task_name, outcome, runtime_ms)
+        now = time.time() if now is None else now
+        try:
+            with RedisClient.get_sync_client().pipeline(transaction=False) as pipe:
+                for resolution, ttl in (("m", MINUTE_RETENTION), ("h", HOUR_RETENTION)):
+                    key = bucket_key(resolution, now)
+                    for field, amount in fields.items():
+                        if field.endswith(f"{_SEP}sum"):
+                            pipe.hincrbyfloat(key, field, amount)
+                        else:
+                            pipe.hincrby(key, field, int(amount))
+                    pipe.expire(key, ttl)
+                pipe.execute()  # type: ignore[no-untyped-call]
+        except Exception as e:
+            logger.warning(f"Failed to record {outcome} for task {task_name}: {e}")
+
+
+task_stats = TaskStatsRecorder(enabled=settings.TASK_STATS_ENABLED)
@@ -0,0 +1,47 @@
+"""Refresh token housekeeping tasks (routed to the fast queue)."""
+import asyncio
+import time
+from typing import Any
+
+from app.core.db import async_engine, async_session_maker
+from app.services import token_service
+from app.workers.celery_app import QUEUES, celery_app
+from app.workers.locks import periodic_lock
+
+FAST = QUEUES["fast"]
+
+
+async def _cleanup(max_seconds: float | None) -> int:
+    try:
+        async with async_session_maker() as session:
+            return await token_service.cleanup_expired_tokens(
+                session, max_seconds=max_seconds
+            )
+    finally:
+        # The pool's connections belong to this asyncio.run() loop
+        await async_engine.dispose()
+
+
+@celery_app.task(name="app.workers.tokens.cleanup_expired_tokens")  # type: ignore[untyped-decorator]
+def cleanup_expired_tokens() -> dict[str, Any]:
+    """Delete expired refresh tokens, unless another run holds the lock.
+
+    Stops starting new chunks well before the fast queue's soft time limit;
+    rows left over are deleted by the next run.
+
+    Returns:
+        dict: Rows deleted, duration and rows per second, or skipped=True
+    """
+    budget = FAST.soft_time_limit / 2 if FAST.soft_time_limit else None
+    with periodic_lock("cleanup_expired_tokens", FAST.time_limit or 3600) as acquired:
+        if not acquired:
+            return {"skipped": True}
+        start = time.perf_counter()
+        deleted = asyncio.run(_cleanup(budget))
+        seconds = time.perf_counter() - start
+    return {
+        "skipped": False,
+        "deleted": deleted,
+        "seconds": round(seconds, 3),
+        "rows_per_second": round(deleted / seconds) if seconds > 0 else 0,
+    }
@@ -0,0 +1,7 @@
+"""Performance benchmarks for the Ayni backend.
+
+Benchmarks are standalone scripts run against the local docker-compose
+services (PostgreSQL, Redis), e.g.:
+
+    uv run python -m benchmarks.refresh_token_latency
+"""
@@ -0,0 +1,21 @@
+"""Shared latency statistics helpers for benchmark scripts."""
+
+import statistics
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    """Return the pct-th percentile (nearest-rank) of samples."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+def summarize(samples_ms: list[float]) -> dict[str, float]:
+    """Summarize latency samples (milliseconds) as p50/p99/mean."""
+    return {
+        "p50": percentile(samples_ms, 50),
+        "p99": percentile(samples_ms, 99),
+        "mean": statistics.fmean(samples_ms) if samples_ms else 0.0,
+    }
@@ -0,0 +1,87 @@
+"""Micro-benchmark cache payload codecs on dashboard-shaped data.
+
+For every installed codec, with and without each installed compressor,
+reports encode and decode time per payload and the bytes stored in Redis.
+Payloads mimic dashboard responses: per-location x per-month metric cells.
+
+Usage (no services needed; install the optional codecs first with
+`uv pip install ".[cache]"`):
+
+    uv run python -m benchmarks.cache_codecs
+    uv run python -m benchmarks.cache_codecs --locations 50 --months 24 --iterations 500
+"""
+
+import argparse
+import json
+import random
+import time
+from datetime import date
+from typing import Any
+
+from app.core.cache_codecs import CODECS, COMPRESSORS, PayloadSerializer
+from benchmarks._stats import summarize
+
+
+def dashboard_payload(locations: int, months: int) -> dict[str, Any]:
+    rng = random.Random(42)
+    return {
+        "tenant_id": 1,
+        "generated_at": date(2024, 12, 31).isoformat(),
+        "cells": [
+            {
+                "location_id": location,
+                "location_name": f"Location {location}",
+                "period": f"{2023 + month // 12}-{month % 12 + 1:02d}",
+                "revenue": round(rng.uniform(1_000, 50_000), 2),
+                "transactions": rng.randint(10, 2_000),
+                "avg_ticket": round(rng.uniform(5, 80), 2),
+                "growth_pct": round(rng.uniform(-20, 30), 1),
+            }
+            for location in range(locations)
+            for month in range(months)
+        ],
+    }
+
+
+def _time_us(func: Any, arg: Any, iterations: int) -> list[float]:
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func(arg)
+        samples.append((time.perf_counter() - start) * 1_000_000)
+    return samples
+
+
+def main(locations: int, months: int, iterations: int) -> None:
+    payload = dashboard_payload(locations, months)
+    legacy_bytes = len(json.dumps(payload, default=str).encode())
+    print(  # noqa: T201
+        f"Payload: {locations} locations x {months} months "
+        f"({legacy_bytes} bytes as legacy JSON), {iterations} iterations"
+    )
+    print(  # noqa: T201
+        f"{'codec':<10}{'compression':<13}{'bytes':>9}{'encode p50 us':>15}"
+        f"{'decode p50 us':>15}{'encode p99 us':>15}{'decode p99 us':>15}"
+    )
+    for codec in sorted(CODECS):
+        for compression in ["none", *sorted(COMPRESSORS)]:
+            serializer = PayloadSerializer(
+                codec=codec, compression=compression, compress_min_bytes=0
+            )
+            encoded = serializer.encode(payload)
+            encode = summarize(_time_us(serializer.encode, payload, iterations))
+            decode = summarize(_time_us(serializer.decode, encoded, iterations))
+            print(  # noqa: T201
+                f"{codec:<10}{compression:<13}{len(encoded):>9}"
+                f"{encode['p50']:>15.1f}{decode['p50']:>15.1f}"
+                f"{encode['p99']:>15.1f}{decode['p99']:>15.1f}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--locations", type=int, default=20)
+    parser.add_argument("--months", type=int, default=12)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+    main(args.locations, args.months, args.iterations)
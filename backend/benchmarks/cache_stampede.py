@@ -0,0 +1,114 @@
+"""Benchmark cache_result under a stampede on a cold key.
+
+Fires N concurrent calls for the same uncached key, optionally split across
+several processes (like uvicorn workers), and counts how many times the
+wrapped function actually ran. The function sleeps to simulate a slow
+dashboard aggregation query and counts executions in Redis so runs in every
+process are included.
+
+Usage (requires the docker-compose Redis service):
+
+    uv run python -m benchmarks.cache_stampede
+    uv run python -m benchmarks.cache_stampede --requests 500 --processes 4 --work-ms 200
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import time
+import uuid
+
+from app.core.cache import cache_result, cache_tag, invalidate_tags
+from app.core.redis import RedisClient
+from benchmarks._stats import summarize
+
+COUNTER_KEY = "bench:cache_stampede:executions"
+
+
+@cache_result(ttl=60, key_prefix="bench_stampede")
+async def dashboard_query(run_id: str, work_ms: int) -> dict:
+    redis = await RedisClient.get_client()
+    await redis.incr(COUNTER_KEY)
+    await asyncio.sleep(work_ms / 1000)
+    return {"run_id": run_id, "rows": list(range(100))}
+
+
+async def _fire(
+    run_id: str, requests: int, work_ms: int, start_at: float
+) -> list[float]:
+    await asyncio.sleep(max(0.0, start_at - time.time()))
+
+    async def call() -> float:
+        start = time.perf_counter()
+        await dashboard_query(run_id, work_ms)
+        return (time.perf_counter() - start) * 1000
+
+    return list(await asyncio.gather(*(call() for _ in range(requests))))
+
+
+def _worker(
+    run_id: str,
+    requests: int,
+    work_ms: int,
+    start_at: float,
+    out: "multiprocessing.Queue[list[float]]",
+) -> None:
+    out.put(asyncio.run(_fire(run_id, requests, work_ms, start_at)))
+
+
+async def _reset() -> None:
+    redis = await RedisClient.get_client()
+    await redis.delete(COUNTER_KEY)
+    await invalidate_tags(cache_tag("prefix", "bench_stampede"))
+    # Each asyncio.run() uses a new loop; drop the client bound to this one
+    await RedisClient.close()
+
+
+async def _executions() -> int:
+    redis = await RedisClient.get_client()
+    executions = int(await redis.get(COUNTER_KEY) or 0)
+    await RedisClient.close()
+    return executions
+
+
+def main(requests: int, processes: int, work_ms: int) -> None:
+    asyncio.run(_reset())
+    run_id = uuid.uuid4().hex
+    # Give every process time to start so the calls really overlap
+    start_at = time.time() + 2.0
+    per_process = [requests // processes] * processes
+    per_process[0] += requests - sum(per_process)
+
+    ctx = multiprocessing.get_context("spawn")
+    out: multiprocessing.Queue[list[float]] = ctx.Queue()
+    workers = [
+        ctx.Process(target=_worker, args=(run_id, n, work_ms, start_at, out))
+        for n in per_process
+    ]
+    for worker in workers:
+        worker.start()
+    samples = [sample for _ in workers for sample in out.get()]
+    for worker in workers:
+        worker.join()
+
+    executions = asyncio.run(_executions())
+    stats = summarize(samples)
+    print(  # noqa: T201
+        f"Cold-key stampede: {requests} requests over {processes} process(es), "
+        f"{work_ms} ms per execution"
+    )
+    print(f"function executions: {executions}")  # noqa: T201
+    print(  # noqa: T201
+        f"latency p50 {stats['p50']:.1f} ms, p99 {stats['p99']:.1f} ms, "
+        f"mean {stats['mean']:.1f} ms"
+    )
+    asyncio.run(_reset())
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--processes", type=int, default=1)
+    parser.add_argument("--work-ms", type=int, default=200)
+    args = parser.parse_args()
+    main(args.requests, args.processes, args.work_ms)
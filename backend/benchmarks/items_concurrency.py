@@ -0,0 +1,142 @@
+"""Benchmark the items endpoints under concurrent load.
+
+Each scenario runs a fixed number of requests at increasing concurrency
+against the real app (httpx ASGI transport, no server), with the user's items
+in PostgreSQL. With the handlers fully async, throughput should grow with
+concurrency until the database pool (DB_POOL_PROFILE) saturates, instead of
+being capped by the 40 threadpool workers that sync `def` handlers use.
+
+A probe hits /health while each scenario runs; its p99 shows whether the
+event loop stays responsive.
+
+Usage (requires the docker-compose PostgreSQL and Redis services):
+
+    uv run python -m benchmarks.items_concurrency
+    uv run python -m benchmarks.items_concurrency --requests 2000 --concurrency 1 8 32 64
+"""
+
+import argparse
+import asyncio
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+from datetime import timedelta
+
+import httpx
+
+from app.core.config import settings
+from app.core.db import async_session_maker
+from app.core.security import create_access_token, get_password_hash
+from app.main import app
+from app.models import Item, Tenant, User
+from benchmarks._stats import summarize
+
+ITEMS = f"{settings.API_V1_STR}/items/"
+
+
+async def _create_user(items: int) -> tuple[dict[str, str], list[uuid.UUID]]:
+    """A user owning `items` items, and an auth header for them."""
+    async with async_session_maker() as session:
+        tenant = Tenant()
+        session.add(tenant)
+        await session.flush()
+        user = User(
+            email=f"bench-items-{uuid.uuid4().hex[:12]}@example.com",
+            hashed_password=get_password_hash(uuid.uuid4().hex),
+            tenant_id=tenant.id,
+            is_verified=True,
+        )
+        session.add(user)
+        await session.flush()
+        rows = [
+            Item(title=f"bench item {i}", description="benchmark", owner_id=user.id)
+            for i in range(items)
+        ]
+        session.add_all(rows)
+        await session.commit()
+        token = create_access_token(
+            str(user.id), timedelta(hours=1), tenant_id=tenant.id
+        )
+    return {"Authorization": f"Bearer {token}"}, [row.id for row in rows]
+
+
+async def _run(
+    request: Callable[[int], Awaitable[httpx.Response]],
+    client: httpx.AsyncClient,
+    requests: int,
+    concurrency: int,
+) -> tuple[float, dict[str, float], dict[str, float]]:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies_ms: list[float] = []
+    probe_ms: list[float] = []
+    done = asyncio.Event()
+
+    async def call(i: int) -> None:
+        async with semaphore:
+            start = time.perf_counter()
+            response = await request(i)
+            latencies_ms.append((time.perf_counter() - start) * 1000)
+            response.raise_for_status()
+
+    async def probe() -> None:
+        while not done.is_set():
+            start = time.perf_counter()
+            await client.get("/health")
+            probe_ms.append((time.perf_counter() - start) * 1000)
+            await asyncio.sleep(0.02)
+
+    probe_task = asyncio.create_task(probe())
+    start = time.perf_counter()
+    await asyncio.gather(*(call(i) for i in range(requests)))
+    elapsed = time.perf_counter() - start
+    done.set()
+    await probe_task
+    return requests / elapsed, summarize(latencies_ms), summarize(probe_ms)
+
+
+async def main(requests: int, levels: list[int], items: int) -> None:
+    headers, item_ids = await _create_user(items)
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench", headers=headers
+    ) as client:
+        scenarios: dict[str, Callable[[int], Awaitable[httpx.Response]]] = {
+            "list": lambda i: client.get(ITEMS, params={"limit": 20}),
+            "read": lambda i: client.get(f"{ITEMS}{item_ids[i % len(item_ids)]}"),
+            "create": lambda i: client.post(
+                ITEMS, json={"title": f"bench {i}", "description": "benchmark"}
+            ),
+        }
+        # Warm up the pool, the user cache and routing
+        for i in range(20):
+            await scenarios["read"](i)
+
+        print(  # noqa: T201
+            f"Items endpoints: {requests} requests per run, {items} items, "
+            f"{settings.DB_POOL_PROFILE} pool profile"
+        )
+        print(  # noqa: T201
+            f"{'scenario':<10}{'conc':>6}{'req/s':>10}{'p50 ms':>10}"
+            f"{'p99 ms':>10}{'health p99 ms':>15}"
+        )
+        for name, request in scenarios.items():
+            for concurrency in levels:
+                throughput, stats, probe = await _run(
+                    request, client, requests, concurrency
+                )
+                print(  # noqa: T201
+                    f"{name:<10}{concurrency:>6}{throughput:>10.0f}"
+                    f"{stats['p50']:>10.2f}{stats['p99']:>10.2f}{probe['p99']:>15.2f}"
+                )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument(
+        "--concurrency", type=int, nargs="+", default=[1, 8, 32, 64]
+    )
+    parser.add_argument("--items", type=int, default=100)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.concurrency, args.items))
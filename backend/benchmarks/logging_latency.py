@@ -0,0 +1,104 @@
+"""Benchmark request latency with INFO logging enabled under load.
+
+Drives /health through RequestLoggingMiddleware (two INFO records per
+request) with logging at INFO, writing JSON lines to a file:
+
+- "sync": JSONFormatter + StreamHandler on the root logger, so rendering
+  and writes happen on the event loop (what basicConfig-style setups do)
+- "queue": configure_logging(); the loop only enqueues records
+- "sampled": configure_logging() keeping 10% of ayni.api INFO records
+
+Usage (no services needed):
+
+    uv run python -m benchmarks.logging_latency
+    uv run python -m benchmarks.logging_latency --requests 20000 --concurrency 64
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import tempfile
+import time
+from typing import TextIO
+
+import httpx
+
+from app.core.logging_config import JSONFormatter, configure_logging, shutdown_logging
+from benchmarks._stats import summarize
+from benchmarks.middleware_throughput import build_app
+
+
+def _setup(mode: str, output: TextIO) -> None:
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    if mode == "sync":
+        handler = logging.StreamHandler(output)
+        handler.setFormatter(JSONFormatter())
+        root.addHandler(handler)
+        root.setLevel(logging.INFO)
+    else:
+        sampling = {"ayni.api": 0.1} if mode == "sampled" else None
+        configure_logging(level="INFO", sampling=sampling, stream=output)
+
+
+async def _run(requests: int, concurrency: int) -> tuple[list[float], float]:
+    transport = httpx.ASGITransport(app=build_app("asgi"))
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+        for _ in range(100):
+            await client.get("/health")
+
+        semaphore = asyncio.Semaphore(concurrency)
+        latencies_ms: list[float] = []
+
+        async def call() -> None:
+            async with semaphore:
+                start = time.perf_counter()
+                await client.get("/health")
+                latencies_ms.append((time.perf_counter() - start) * 1000)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(call() for _ in range(requests)))
+        return latencies_ms, time.perf_counter() - start
+
+
+def main(requests: int, concurrency: int, modes: list[str]) -> None:
+    print(  # noqa: T201
+        f"GET /health x {requests}, concurrency {concurrency}, logging at INFO"
+    )
+    print(  # noqa: T201
+        f"{'mode':<9}{'req/s':>10}{'p50 ms':>10}{'p99 ms':>10}{'lines':>9}"
+    )
+    for mode in modes:
+        fd, path = tempfile.mkstemp(suffix=".log")
+        with os.fdopen(fd, "w") as output:
+            _setup(mode, output)
+            latencies_ms, elapsed = asyncio.run(_run(requests, concurrency))
+            # Drain the queue so every mode writes the same work to disk
+            shutdown_logging()
+            logging.getLogger().handlers.clear()
+        with open(path) as written:
+            lines = sum(1 for _ in written)
+        os.unlink(path)
+        stats = summarize(latencies_ms)
+        print(  # noqa: T201
+            f"{mode:<9}{requests / elapsed:>10.0f}{stats['p50']:>10.3f}"
+            f"{stats['p99']:>10.3f}{lines:>9}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument(
+        "--modes",
+        nargs="+",
+        choices=["sync", "queue", "sampled"],
+        default=["sync", "queue", "sampled"],
+    )
+    args = parser.parse_args()
+    main(args.requests, args.concurrency, args.modes)
@@ -0,0 +1,125 @@
+"""Benchmark /auth/login throughput and tail latency with and without the hash pool.
+
+"inline" reproduces the previous behaviour (bcrypt called directly on the
+event loop); "pool" uses PasswordHasher's worker pool. While logins run, a
+probe hits /health to show how long unrelated requests wait on the loop.
+
+Usage (requires the docker-compose PostgreSQL and Redis services; run on a
+multi-core box for a meaningful comparison):
+
+    uv run python -m benchmarks.login_throughput
+    uv run python -m benchmarks.login_throughput --requests 200 --concurrency 32
+"""
+
+import argparse
+import asyncio
+import os
+import time
+import uuid
+
+import httpx
+
+from app.core.config import settings
+from app.core.db import async_session_maker
+from app.core.security import get_password_hash
+from app.main import app
+from app.models import Tenant, User
+from app.services.password_service import PasswordHasher
+from benchmarks._stats import summarize
+
+PASSWORD = "benchmark-password-123"
+
+
+async def _create_user() -> str:
+    async with async_session_maker() as session:
+        tenant = Tenant()
+        session.add(tenant)
+        await session.flush()
+        email = f"bench-login-{uuid.uuid4().hex[:12]}@example.com"
+        session.add(
+            User(
+                email=email,
+                hashed_password=get_password_hash(PASSWORD),
+                tenant_id=tenant.id,
+                is_verified=True,
+            )
+        )
+        await session.commit()
+    return email
+
+
+async def _run_inline(func, *args):  # type: ignore[no-untyped-def]
+    """Previous behaviour: run bcrypt directly on the event loop."""
+    return func(*args)
+
+
+async def _run(
+    client: httpx.AsyncClient, email: str, requests: int, concurrency: int
+) -> tuple[list[float], list[float], float]:
+    semaphore = asyncio.Semaphore(concurrency)
+    login_ms: list[float] = []
+    probe_ms: list[float] = []
+    done = asyncio.Event()
+
+    async def login() -> None:
+        async with semaphore:
+            start = time.perf_counter()
+            response = await client.post(
+                f"{settings.API_V1_STR}/auth/login",
+                data={"username": email, "password": PASSWORD},
+            )
+            login_ms.append((time.perf_counter() - start) * 1000)
+            response.raise_for_status()
+
+    async def probe() -> None:
+        while not done.is_set():
+            start = time.perf_counter()
+            await client.get("/health")
+            probe_ms.append((time.perf_counter() - start) * 1000)
+            await asyncio.sleep(0.05)
+
+    probe_task = asyncio.create_task(probe())
+    start = time.perf_counter()
+    await asyncio.gather(*(login() for _ in range(requests)))
+    elapsed = time.perf_counter() - start
+    done.set()
+    await probe_task
+    return login_ms, probe_ms, requests / elapsed
+
+
+async def main(requests: int, concurrency: int) -> None:
+    email = await _create_user()
+    transport = httpx.ASGITransport(app=app)
+    original_run = PasswordHasher.__dict__["_run"]
+
+    print(  # noqa: T201
+        f"Login benchmark: {requests} requests, concurrency {concurrency}, "
+        f"{os.cpu_count()} CPUs, {settings.PASSWORD_HASH_WORKERS} "
+        f"{settings.PASSWORD_HASH_EXECUTOR} workers"
+    )
+    print(  # noqa: T201
+        f"{'mode':<8}{'req/s':>8}{'p50 ms':>10}{'p99 ms':>10}{'health p99 ms':>15}"
+    )
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for mode in ("inline", "pool"):
+            PasswordHasher._run = (  # type: ignore[method-assign]
+                _run_inline if mode == "inline" else original_run
+            )
+            login_ms, probe_ms, throughput = await _run(
+                client, email, requests, concurrency
+            )
+            login_stats = summarize(login_ms)
+            probe_stats = summarize(probe_ms)
+            print(  # noqa: T201
+                f"{mode:<8}{throughput:>8.1f}{login_stats['p50']:>10.1f}"
+                f"{login_stats['p99']:>10.1f}{probe_stats['p99']:>15.1f}"
+            )
+    PasswordHasher._run = original_run  # type: ignore[method-assign]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=16)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.concurrency))
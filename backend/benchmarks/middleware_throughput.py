@@ -0,0 +1,152 @@
+"""Benchmark /health throughput through the request middleware stack.
+
+"legacy" reproduces the previous stack: RequestLoggingMiddleware as a
+BaseHTTPMiddleware plus performance_middleware registered with
+@app.middleware("http"). "asgi" is the current single pure-ASGI
+RequestLoggingMiddleware. "none" has no middleware and shows the floor.
+
+Requests go through httpx's ASGI transport, so the numbers are middleware and
+framework overhead only (no sockets, no server). Logging is left
+unconfigured, as the INFO records are dropped by the default WARNING level;
+the logging pipeline is measured separately.
+
+Usage (no services needed):
+
+    uv run python -m benchmarks.middleware_throughput
+    uv run python -m benchmarks.middleware_throughput --requests 20000 --concurrency 64
+"""
+
+import argparse
+import asyncio
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+
+import httpx
+from fastapi import FastAPI, Request, Response
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from app.api.middleware.performance import record_request, route_template
+from app.middleware.logging import RequestLoggingMiddleware, logger
+from benchmarks._stats import summarize
+
+
+class _LegacyLoggingMiddleware(BaseHTTPMiddleware):
+    """Previous RequestLoggingMiddleware."""
+
+    async def dispatch(
+        self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
+    ) -> Response:
+        request_id = str(uuid.uuid4())
+        request.state.request_id = request_id
+        logger.info(
+            "Incoming request",
+            extra={
+                "request_id": request_id,
+                "method": request.method,
+                "path": request.url.path,
+                "query_params": str(request.query_params),
+                "client_host": request.client.host if request.client else None,
+            },
+        )
+        start_time = time.time()
+        response = await call_next(request)
+        duration_ms = round((time.time() - start_time) * 1000, 2)
+        logger.info(
+            "Outgoing response",
+            extra={
+                "request_id": request_id,
+                "status_code": response.status_code,
+                "duration_ms": duration_ms,
+            },
+        )
+        response.headers["X-Request-ID"] = request_id
+        return response
+
+
+async def _legacy_performance_middleware(
+    request: Request, call_next: Callable[[Request], Awaitable[Response]]
+) -> Response:
+    """Previous performance_middleware."""
+    start_time = time.time()
+    response = await call_next(request)
+    duration_ms = (time.time() - start_time) * 1000
+    record_request(
+        request.method,
+        request.url.path,
+        route_template(request.scope),
+        response.status_code,
+        duration_ms,
+    )
+    response.headers["X-Response-Time"] = f"{duration_ms:.2f}ms"
+    return response
+
+
+def build_app(stack: str) -> FastAPI:
+    app = FastAPI()
+    if stack == "legacy":
+        app.middleware("http")(_legacy_performance_middleware)
+        app.add_middleware(_LegacyLoggingMiddleware)
+    elif stack == "asgi":
+        app.add_middleware(RequestLoggingMiddleware)
+
+    @app.get("/health")
+    async def health() -> dict[str, str]:
+        return {"status": "healthy"}
+
+    return app
+
+
+async def _run(stack: str, requests: int, concurrency: int) -> None:
+    transport = httpx.ASGITransport(app=build_app(stack))
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+        # Warm up routing and pydantic serialization
+        for _ in range(100):
+            await client.get("/health")
+
+        semaphore = asyncio.Semaphore(concurrency)
+        latencies_ms: list[float] = []
+
+        async def call() -> None:
+            async with semaphore:
+                start = time.perf_counter()
+                response = await client.get("/health")
+                latencies_ms.append((time.perf_counter() - start) * 1000)
+                response.raise_for_status()
+
+        start = time.perf_counter()
+        await asyncio.gather(*(call() for _ in range(requests)))
+        elapsed = time.perf_counter() - start
+
+    stats = summarize(latencies_ms)
+    print(  # noqa: T201
+        f"{stack:<8}{requests / elapsed:>12.0f}{stats['p50']:>10.3f}"
+        f"{stats['p99']:>10.3f}{stats['mean']:>10.3f}"
+    )
+
+
+def main(requests: int, concurrency: int, stacks: list[str]) -> None:
+    print(  # noqa: T201
+        f"GET /health x {requests}, concurrency {concurrency} (in-process ASGI)"
+    )
+    print(  # noqa: T201
+        f"{'stack':<8}{'req/s':>12}{'p50 ms':>10}{'p99 ms':>10}{'mean ms':>10}"
+    )
+    for stack in stacks:
+        asyncio.run(_run(stack, requests, concurrency))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument(
+        "--stacks",
+        nargs="+",
+        choices=["none", "legacy", "asgi"],
+        default=["none", "legacy", "asgi"],
+    )
+    args = parser.parse_args()
+    main(args.requests, args.concurrency, args.stacks)
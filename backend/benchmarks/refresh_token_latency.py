@@ -0,0 +1,144 @@
+"""Benchmark /auth/refresh cost for users with 1, 5 and 50 live sessions.
+
+Compares the jti + HMAC digest lookup against the legacy bcrypt scan (tokens
+without a jti claim), timing the same work /auth/refresh does: verify the
+token, then mark it as used.
+
+Usage (requires the docker-compose PostgreSQL service and applied migrations):
+
+    uv run python -m benchmarks.refresh_token_latency
+    uv run python -m benchmarks.refresh_token_latency --sessions 1 5 50 --iterations 200
+"""
+
+import argparse
+import asyncio
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import delete
+
+from app.core.config import settings
+from app.core.db import async_session_maker
+from app.core.security import create_refresh_token, get_password_hash
+from app.models import RefreshToken, Tenant, User
+from app.services.token_service import (
+    create_and_store_refresh_token,
+    invalidate_refresh_token,
+    verify_refresh_token,
+)
+from benchmarks._stats import summarize
+
+
+async def _create_user(session: AsyncSession) -> User:
+    tenant = Tenant()
+    session.add(tenant)
+    await session.flush()
+    user = User(
+        email=f"bench-{uuid.uuid4().hex[:12]}@example.com",
+        tenant_id=tenant.id,
+        is_verified=True,
+    )
+    session.add(user)
+    await session.commit()
+    return user
+
+
+async def _add_legacy_token(session: AsyncSession, user_id: uuid.UUID) -> str:
+    """Insert a row the way the pre-jti implementation did (bcrypt, no jti)."""
+    token = create_refresh_token(
+        subject=str(user_id), expires_delta=timedelta(days=1), jti=None
+    )
+    # Salted bcrypt makes rows distinct even when JWTs collide within a second
+    session.add(
+        RefreshToken(
+            user_id=user_id,
+            token_hash=get_password_hash(token),
+            expires_at=datetime.utcnow() + timedelta(days=1),
+        )
+    )
+    await session.commit()
+    return token
+
+
+async def _time_refresh(token: str, session: AsyncSession) -> float:
+    start = time.perf_counter()
+    user = await verify_refresh_token(token, session)
+    ok = await invalidate_refresh_token(token, session, mark_as="used")
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    if user is None or not ok:
+        raise RuntimeError("refresh failed during benchmark")
+    return elapsed_ms
+
+
+async def bench_jti(sessions: int, iterations: int) -> list[float]:
+    samples: list[float] = []
+    async with async_session_maker() as session:
+        user = await _create_user(session)
+        try:
+            tokens = [
+                await create_and_store_refresh_token(user.id, session)
+                for _ in range(sessions)
+            ]
+            for i in range(iterations):
+                token = tokens[i % sessions]
+                samples.append(await _time_refresh(token, session))
+                # Rotate like /auth/refresh so the live session count is stable
+                tokens[i % sessions] = await create_and_store_refresh_token(
+                    user.id, session
+                )
+        finally:
+            await _cleanup(session, user)
+    return samples
+
+
+async def bench_legacy(sessions: int, iterations: int) -> list[float]:
+    samples: list[float] = []
+    async with async_session_maker() as session:
+        user = await _create_user(session)
+        try:
+            tokens = [await _add_legacy_token(session, user.id) for _ in range(sessions)]
+            for _ in range(iterations):
+                token = tokens.pop()
+                samples.append(await _time_refresh(token, session))
+                tokens.append(await _add_legacy_token(session, user.id))
+        finally:
+            await _cleanup(session, user)
+    return samples
+
+
+async def _cleanup(session: AsyncSession, user: User) -> None:
+    await session.execute(delete(RefreshToken).where(RefreshToken.user_id == user.id))
+    await session.delete(user)
+    await session.commit()
+
+
+async def main(session_counts: list[int], iterations: int, legacy_iterations: int) -> None:
+    print(f"Refresh latency ({settings.POSTGRES_SERVER}/{settings.POSTGRES_DB})")  # noqa: T201
+    print(f"{'mode':<8}{'sessions':>10}{'n':>6}{'p50 ms':>10}{'p99 ms':>10}")  # noqa: T201
+    for sessions in session_counts:
+        for mode, runner, n in (
+            ("jti", bench_jti, iterations),
+            ("legacy", bench_legacy, legacy_iterations),
+        ):
+            if n <= 0:
+                continue
+            stats = summarize(await runner(sessions, n))
+            print(  # noqa: T201
+                f"{mode:<8}{sessions:>10}{n:>6}{stats['p50']:>10.2f}{stats['p99']:>10.2f}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1, 5, 50])
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument(
+        "--legacy-iterations",
+        type=int,
+        default=10,
+        help="Iterations for the bcrypt scan (slow: ~0.5s per live session)",
+    )
+    args = parser.parse_args()
+    asyncio.run(main(args.sessions, args.iterations, args.legacy_iterations))
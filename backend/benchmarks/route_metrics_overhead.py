@@ -0,0 +1,67 @@
+"""Micro-benchmark the per-request cost of recording route metrics.
+
+Times RequestMetrics.observe() (what the middleware calls once per request)
+over a realistic spread of routes, statuses and latencies, and the Redis
+flush each worker does every METRICS_FLUSH_INTERVAL_SECONDS.
+
+Usage (the flush step requires the docker-compose Redis service):
+
+    uv run python -m benchmarks.route_metrics_overhead
+    uv run python -m benchmarks.route_metrics_overhead --observations 1000000 --no-flush
+"""
+
+import argparse
+import asyncio
+import random
+import time
+
+from app.core.metrics import RequestMetrics
+from app.core.redis import RedisClient
+
+ROUTES = [
+    ("GET", "/api/v1/users/me"),
+    ("GET", "/api/v1/users/{user_id}"),
+    ("GET", "/api/v1/items/"),
+    ("POST", "/api/v1/auth/login"),
+    ("GET", "/api/v1/monitoring/metrics"),
+    ("GET", "/health"),
+]
+BENCH_KEY = "bench:metrics:http"
+
+
+async def _run(observations: int, flush: bool) -> None:
+    rng = random.Random(42)
+    calls = [
+        (
+            *rng.choice(ROUTES),
+            rng.choice((200, 200, 200, 201, 404, 500)),
+            rng.expovariate(1 / 40),
+        )
+        for _ in range(10_000)
+    ]
+    metrics = RequestMetrics(flush_interval=3600, key=BENCH_KEY)
+
+    start = time.perf_counter_ns()
+    for i in range(observations):
+        method, route, status, duration_ms = calls[i % len(calls)]
+        metrics.observe(method, route, status, duration_ms)
+    per_call_ns = (time.perf_counter_ns() - start) / observations
+    print(f"observe(): {per_call_ns:.0f} ns per request")  # noqa: T201
+
+    if flush:
+        fields = len(metrics.pending_fields())
+        start = time.perf_counter_ns()
+        await metrics.flush()
+        flush_ms = (time.perf_counter_ns() - start) / 1_000_000
+        print(f"flush(): {flush_ms:.2f} ms for {fields} hash fields")  # noqa: T201
+        redis = await RedisClient.get_client()
+        await redis.delete(BENCH_KEY)
+        await RedisClient.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--observations", type=int, default=200_000)
+    parser.add_argument("--no-flush", action="store_true")
+    args = parser.parse_args()
+    asyncio.run(_run(args.observations, not args.no_flush))
@@ -0,0 +1,84 @@
+"""Benchmark the cost of setting RLS tenant context per request.
+
+"set_config" reproduces the previous behaviour (a standalone
+`SELECT set_config(...)` before the first query); "begin" uses
+set_tenant_context, which sends the tenant with the transaction's BEGIN.
+Each sample is one request-shaped unit of work: check out a session, set the
+tenant, run one tenant-scoped query, release the connection.
+
+Usage (requires the docker-compose PostgreSQL service and applied migrations;
+the gap grows with network latency to the database):
+
+    uv run python -m benchmarks.tenant_context_latency
+    uv run python -m benchmarks.tenant_context_latency --iterations 2000
+"""
+
+import argparse
+import asyncio
+import time
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select
+
+from app.api.deps import set_tenant_context
+from app.core.config import settings
+from app.core.db import async_session_maker
+from app.core.tenant_context import current_tenant
+from app.models import Company, Tenant
+from benchmarks._stats import summarize
+
+
+async def _create_tenant() -> int:
+    async with async_session_maker() as session:
+        tenant = Tenant()
+        session.add(tenant)
+        await session.commit()
+        await session.refresh(tenant)
+        assert tenant.id is not None
+        return tenant.id
+
+
+async def _set_config(session: AsyncSession, tenant_id: int) -> None:
+    """Previous behaviour: a separate round-trip before the first query."""
+    await session.execute(
+        text("SELECT set_config('app.current_tenant', :tenant_id, false)"),
+        {"tenant_id": str(tenant_id)},
+    )
+
+
+async def _run(mode: str, tenant_id: int, iterations: int) -> list[float]:
+    apply = _set_config if mode == "set_config" else set_tenant_context
+    samples: list[float] = []
+    for _ in range(iterations):
+        token = current_tenant.set(None)
+        start = time.perf_counter()
+        async with async_session_maker() as session:
+            await apply(session, tenant_id)
+            await session.execute(select(Company).limit(1))
+        samples.append((time.perf_counter() - start) * 1000)
+        current_tenant.reset(token)
+    return samples
+
+
+async def main(iterations: int) -> None:
+    tenant_id = await _create_tenant()
+    # Warm the pool and prepared statement caches
+    await _run("begin", tenant_id, 20)
+    await _run("set_config", tenant_id, 20)
+
+    print(f"Tenant context latency ({settings.POSTGRES_SERVER}/{settings.POSTGRES_DB})")  # noqa: T201
+    print(f"{'mode':<12}{'n':>6}{'p50 ms':>10}{'p99 ms':>10}{'mean ms':>10}")  # noqa: T201
+    for mode in ("set_config", "begin"):
+        stats = summarize(await _run(mode, tenant_id, iterations))
+        print(  # noqa: T201
+            f"{mode:<12}{iterations:>6}{stats['p50']:>10.3f}"
+            f"{stats['p99']:>10.3f}{stats['mean']:>10.3f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=1000)
+    args = parser.parse_args()
+    asyncio.run(main(args.iterations))
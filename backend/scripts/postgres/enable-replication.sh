@@ -0,0 +1,10 @@
+#!/usr/bin/env bash
+# Allow streaming replication connections for the local read replica
+# (docker compose --profile replica). Runs from /docker-entrypoint-initdb.d,
+# i.e. only when the primary's data volume is first created; for an existing
+# volume run it once with `docker compose exec db bash <this file>` and
+# reload PostgreSQL.
+
+set -e
+
+echo "host replication ${POSTGRES_USER} all scram-sha-256" >> "${PGDATA}/pg_hba.conf"
@@ -0,0 +1,20 @@
+#!/usr/bin/env bash
+# Local streaming read replica of the "db" service (docker compose --profile
+# replica). On first start it clones the primary with pg_basebackup, which
+# also writes the standby configuration; then it runs as a hot standby.
+
+set -e
+
+if [ ! -s "${PGDATA}/PG_VERSION" ]; then
+    mkdir -p "${PGDATA}"
+    until pg_basebackup --host=db --username="${POSTGRES_USER}" \
+        --pgdata="${PGDATA}" --wal-method=stream --write-recovery-conf \
+        --checkpoint=fast; do
+        echo "Waiting for the primary to accept replication connections..."
+        rm -rf "${PGDATA:?}"/*
+        sleep 2
+    done
+    chmod 0700 "${PGDATA}"
+fi
+
+exec postgres -c hot_standby=on
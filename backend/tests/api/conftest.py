@@ -0,0 +1,25 @@
+from collections.abc import Generator
+
+import pytest
+
+from app.core.config import settings
+from app.core.db import async_engines
+from app.core.query_budget import query_budget_guard
+
+
+@pytest.fixture(autouse=True)
+def enforce_query_budgets() -> Generator[None, None, None]:
+    """Fail any API test whose requests exceed their route's query budget.
+
+    Routes declare budgets with @query_budget; every route is also held to
+    QUERY_BUDGET_MAX_REPEATS executions of one statement shape (N+1).
+    """
+    previous_mode = query_budget_guard.mode
+    query_budget_guard.enable(
+        [engine.sync_engine for engine in async_engines],
+        mode="raise",
+        default_max_repeats=settings.QUERY_BUDGET_MAX_REPEATS,
+    )
+    yield
+    if previous_mode == "off":
+        query_budget_guard.disable()
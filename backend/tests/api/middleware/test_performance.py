@@ -4,14 +4,14 @@ import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
-from app.api.middleware.performance import performance_middleware
+from app.middleware.logging import RequestLoggingMiddleware
 
 
 @pytest.fixture
 def app_with_performance_middleware():
     """Create a test FastAPI app with performance middleware."""
     app = FastAPI()
-    app.middleware("http")(performance_middleware)
+    app.add_middleware(RequestLoggingMiddleware)
 
     @app.get("/test")
     async def test_endpoint():
@@ -1,10 +1,20 @@
+import asyncio
 import uuid
+from typing import Any
 
+import fastapi.dependencies.utils
+import fastapi.routing
+import httpx
+import pytest
 from fastapi.testclient import TestClient
 from sqlmodel import Session
 
+from app.api.deps import get_current_user_snapshot
 from app.core.config import settings
+from app.core.user_cache import UserSnapshot
+from app.main import app
 from tests.utils.item import create_random_item
+from tests.utils.user import create_random_user
 
 
 def test_create_item(
@@ -162,3 +172,45 @@ def test_delete_item_not_enough_permissions(
     assert response.status_code == 400
     content = response.json()
     assert content["detail"] == "Not enough permissions"
+
+
+@pytest.mark.asyncio
+async def test_items_routes_serve_concurrent_requests_on_the_event_loop(
+    db: Session, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Concurrent creates and reads all succeed without a threadpool worker."""
+    snapshot = UserSnapshot.from_user(create_random_user(db))
+
+    async def current_user() -> UserSnapshot:
+        return snapshot
+
+    async def no_threadpool(*_args: Any, **_kwargs: Any) -> Any:
+        raise AssertionError("items routes must not run in the threadpool")
+
+    # FastAPI runs sync endpoints and dependencies through run_in_threadpool
+    monkeypatch.setattr(fastapi.routing, "run_in_threadpool", no_threadpool)
+    monkeypatch.setattr(fastapi.dependencies.utils, "run_in_threadpool", no_threadpool)
+    app.dependency_overrides[get_current_user_snapshot] = current_user
+    try:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+            created = await asyncio.gather(
+                *(
+                    ac.post(f"{settings.API_V1_STR}/items/", json={"title": f"item {i}"})
+                    for i in range(20)
+                )
+            )
+            assert [r.status_code for r in created] == [200] * 20
+            ids = [r.json()["id"] for r in created]
+
+            listing, *reads = await asyncio.gather(
+                ac.get(f"{settings.API_V1_STR}/items/"),
+                *(ac.get(f"{settings.API_V1_STR}/items/{id}") for id in ids),
+            )
+    finally:
+        app.dependency_overrides.pop(get_current_user_snapshot)
+
+    assert listing.status_code == 200
+    assert listing.json()["count"] == 20
+    assert [r.status_code for r in reads] == [200] * 20
+    assert [r.json()["id"] for r in reads] == ids
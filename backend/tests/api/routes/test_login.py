@@ -5,10 +5,9 @@ from sqlmodel import Session
 
 from app.core.config import settings
 from app.core.security import verify_password
-from app.crud import create_user
 from app.models import UserCreate
 from app.utils import generate_password_reset_token
-from tests.utils.user import user_authentication_headers
+from tests.utils.user import create_user, user_authentication_headers
 from tests.utils.utils import random_email, random_lower_string
 
 
@@ -84,7 +83,7 @@ def test_reset_password(client: TestClient, db: Session) -> None:
         is_active=True,
         is_superuser=False,
     )
-    user = create_user(session=db, user_create=user_create)
+    user = create_user(db, user_create)
     token = generate_password_reset_token(email=email)
     headers = user_authentication_headers(client=client, email=email, password=password)
     data = {"new_password": new_password, "token": token}
@@ -66,6 +66,27 @@ def test_monitoring_metrics_caching(
     assert data1["uptime_seconds"] == data2["uptime_seconds"]
 
 
+def test_monitoring_metrics_cache_stats_are_not_cached(
+    client: TestClient,
+    db: AsyncSession,  # noqa: ARG001
+    monkeypatch,
+):
+    """Per-process cache counters are read on every request."""
+    from app.api.v1.endpoints import monitoring
+
+    response1 = client.get("/api/v1/monitoring/metrics")
+    assert response1.status_code == 200
+
+    monkeypatch.setattr(monitoring, "get_cache_stats", lambda: {"marker": 1})
+    response2 = client.get("/api/v1/monitoring/metrics")
+    assert response2.status_code == 200
+
+    # The shared part still comes from the cache, the counters do not
+    assert response2.json()["timestamp"] == response1.json()["timestamp"]
+    assert response2.json()["cache"] == {"marker": 1}
+    assert "user_cache" in response2.json()
+
+
 def test_celery_tasks_endpoint(client: TestClient):
     """Test Celery tasks status endpoint."""
     response = client.get("/api/v1/monitoring/celery/tasks")
@@ -84,6 +105,43 @@ def test_celery_tasks_endpoint(client: TestClient):
         assert response.status_code == 500
 
 
+def test_celery_tasks_served_from_event_snapshot(client: TestClient, monkeypatch):
+    """The endpoint answers from the event monitor without contacting workers."""
+    from app.workers.event_monitor import celery_event_monitor
+
+    snapshot = {
+        "connected": True,
+        "updated_at": 1.0,
+        "workers": {"celery@w1": {"hostname": "celery@w1", "active": 1}},
+        "active": {"celery@w1": [{"id": "t1", "name": "app.t"}]},
+        "scheduled": {},
+        "reserved": {},
+    }
+    monkeypatch.setattr(celery_event_monitor, "_snapshot", snapshot)
+
+    response = client.get("/api/v1/monitoring/celery/tasks")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["workers"] == ["celery@w1"]
+    assert data["active_tasks"]["celery@w1"][0]["id"] == "t1"
+    assert data["event_stream_connected"] is True
+
+
+def test_celery_task_stats_endpoint(client: TestClient):
+    """Task stats are served per window; unknown windows are rejected."""
+    response = client.get("/api/v1/monitoring/celery/task-stats?window=1h")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["window"] == "1h"
+    assert data["buckets"] == 60
+    assert {"completed", "failed", "retried", "tasks"} <= data.keys()
+
+    response = client.get("/api/v1/monitoring/celery/task-stats?window=30d")
+    assert response.status_code == 422
+
+
 def test_task_status_endpoint_with_invalid_task_id(client: TestClient):
     """Test task status endpoint with an invalid task ID."""
     fake_task_id = "nonexistent-task-id-12345"
@@ -137,3 +195,28 @@ def test_monitoring_performance_header_present(
     # Performance middleware should add X-Response-Time header
     assert "X-Response-Time" in response.headers
     assert response.headers["X-Response-Time"].endswith("ms")
+
+
+def test_slow_queries_requires_superuser(
+    client: TestClient, normal_user_token_headers: dict[str, str]
+):
+    """Slow query captures are only visible to superusers."""
+    response = client.get(
+        "/api/v1/monitoring/slow-queries", headers=normal_user_token_headers
+    )
+
+    assert response.status_code == 403
+
+
+def test_slow_queries_lists_buffer(
+    client: TestClient, superuser_token_headers: dict[str, str]
+):
+    """Superusers get the threshold and buffered slow queries."""
+    response = client.get(
+        "/api/v1/monitoring/slow-queries", headers=superuser_token_headers
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert "threshold_ms" in data
+    assert isinstance(data["queries"], list)
@@ -407,6 +407,110 @@ def test_refresh_token_stored_in_database(db: Session) -> None:
     assert token.revoked_at is None
 
 
+def test_refresh_token_lookup_by_jti(db: Session) -> None:
+    """
+    Test refresh tokens carry a jti claim and are stored as a keyed digest.
+
+    The jti indexes the stored row so refresh is a single lookup, independent
+    of how many sessions the user has.
+    """
+    import jwt
+
+    from app.core.security import hash_refresh_token
+    from app.models import RefreshToken
+
+    email = "jtitoken@example.com"
+    password = "testpassword123"
+
+    client.post(
+        f"{settings.API_V1_STR}/auth/register",
+        json={"email": email, "password": password},
+    )
+
+    user = db.exec(select(User).where(User.email == email)).first()
+    user.is_verified = True
+    db.add(user)
+    db.commit()
+
+    # Several logins in the same second must still yield distinct tokens
+    refresh_tokens = []
+    for _ in range(3):
+        login_response = client.post(
+            f"{settings.API_V1_STR}/auth/login",
+            data={"username": email, "password": password},
+            headers={"Content-Type": "application/x-www-form-urlencoded"},
+        )
+        assert login_response.status_code == 200
+        refresh_tokens.append(login_response.json()["refresh_token"])
+    assert len(set(refresh_tokens)) == 3
+
+    refresh_token = refresh_tokens[1]
+    payload = jwt.decode(
+        refresh_token, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM]
+    )
+    assert "jti" in payload
+
+    db_token = db.exec(
+        select(RefreshToken).where(RefreshToken.jti == payload["jti"])
+    ).one()
+    assert db_token.user_id == user.id
+    assert db_token.token_hash == hash_refresh_token(refresh_token)
+
+    response = client.post(
+        f"{settings.API_V1_STR}/auth/refresh",
+        params={"refresh_token": refresh_token},
+    )
+    assert response.status_code == 200
+
+
+def test_legacy_refresh_token_without_jti_still_accepted(db: Session) -> None:
+    """
+    Test tokens issued before jti support (bcrypt-hashed rows) keep working.
+    """
+    from datetime import datetime, timedelta
+
+    from app.core.security import create_refresh_token, get_password_hash
+    from app.models import RefreshToken
+
+    email = "legacytoken@example.com"
+    password = "testpassword123"
+
+    client.post(
+        f"{settings.API_V1_STR}/auth/register",
+        json={"email": email, "password": password},
+    )
+
+    user = db.exec(select(User).where(User.email == email)).first()
+    user.is_verified = True
+    db.add(user)
+
+    # Simulate a row created by the previous bcrypt-based implementation
+    legacy_token = create_refresh_token(
+        subject=str(user.id), expires_delta=timedelta(days=1)
+    )
+    db.add(
+        RefreshToken(
+            user_id=user.id,
+            token_hash=get_password_hash(legacy_token),
+            expires_at=datetime.utcnow() + timedelta(days=1),
+        )
+    )
+    db.commit()
+
+    response = client.post(
+        f"{settings.API_V1_STR}/auth/refresh",
+        params={"refresh_token": legacy_token},
+    )
+    assert response.status_code == 200
+
+    # Rotation marks the legacy row as used
+    reuse_response = client.post(
+        f"{settings.API_V1_STR}/auth/refresh",
+        params={"refresh_token": legacy_token},
+    )
+    assert reuse_response.status_code == 401
+
+
 def test_logout_revokes_refresh_tokens(db: Session) -> None:
     """
     Test logout revokes all refresh tokens for user.
@@ -1,3 +1,4 @@
+import asyncio
 from collections.abc import AsyncGenerator, Generator
 
 import pytest
@@ -7,17 +8,74 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import Session, delete
 
 from app.core.config import settings
-from app.core.db import async_session_maker, engine, init_db
+from app.core.db import (
+    async_engines,
+    async_session_maker,
+    engine,
+    init_db,
+)
+from app.core.redis import RedisClient
 from app.main import app
 from app.models import Item, User
 from tests.utils.user import authentication_token_from_email
 from tests.utils.utils import get_superuser_token_headers
 
 
+async def _close_loop_bound_clients() -> None:
+    """Close the Redis clients and pooled DB connections of the running loop.
+
+    The RedisClient singletons and the engine pools keep connections bound to
+    the event loop that opened them; reusing them from another loop fails with
+    "attached to a different loop", and closing them from another loop leaves
+    the server side open. Called on the loop that used them before it goes.
+    """
+    for name in ("_instance", "_binary_instance"):
+        redis_client = getattr(RedisClient, name)
+        setattr(RedisClient, name, None)
+        if redis_client is None:
+            continue
+        try:
+            await redis_client.aclose()
+        except RuntimeError:
+            # Opened on a loop that is gone, e.g. by a TestClient used without
+            # `with`, which runs each request on its own loop: there is
+            # nothing left to close it on
+            pass
+    for async_engine_ in async_engines:
+        await async_engine_.dispose()
+
+
+async def _init_db() -> None:
+    try:
+        async with async_session_maker() as session:
+            await init_db(session)
+    finally:
+        # Tests run on other event loops
+        await _close_loop_bound_clients()
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def close_loop_bound_clients(
+    request: pytest.FixtureRequest,
+) -> AsyncGenerator[None, None]:
+    """Leave no Redis or DB connections behind for the next test's loop.
+
+    Async tests each run on their own event loop; requests made through the
+    module's TestClient run on the client's loop.
+    """
+    yield
+    if "client" in request.fixturenames:
+        client: TestClient = request.getfixturevalue("client")
+        if client.portal is not None:
+            client.portal.call(_close_loop_bound_clients)
+            return
+    await _close_loop_bound_clients()
+
+
 @pytest.fixture(scope="session")
 def db() -> Generator[Session, None, None]:
+    asyncio.run(_init_db())
     with Session(engine) as session:
-        init_db(session)
         yield session
         statement = delete(Item)
         session.execute(statement)
@@ -36,6 +94,7 @@ async def async_db() -> AsyncGenerator[AsyncSession, None]:
 
 @pytest.fixture(scope="module")
 def client() -> Generator[TestClient, None, None]:
+    # The app runs on the client's own event loop
     with TestClient(app) as c:
         yield c
 
@@ -1,12 +1,21 @@
 """Tests for caching utilities and decorators."""
+import asyncio
+import json
+
 import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.cache import (
+    CacheKeyBuilder,
     _generate_cache_key,
     cache_result,
+    cache_tag,
+    get_cache_stats,
     invalidate_cache,
     invalidate_pattern,
+    invalidate_tags,
 )
+from app.core.local_cache import INVALIDATION_CHANNEL
 from app.core.redis import RedisClient
 
 
@@ -55,6 +64,54 @@ def test_generate_cache_key_with_tenant():
     assert key.count(":") == 3  # prefix:function_name:tenant_id:hash
 
 
+def test_key_builder_declared_args_ignore_call_style():
+    """Declared key args give the same key for positional and keyword calls."""
+
+    async def cell(session: AsyncSession, tenant_id: int, location_id: int) -> None:
+        pass
+
+    builder = CacheKeyBuilder(cell, "analytics", "tenant_id", ("location_id",))
+    positional, tenant_id, _ = builder.build((object(), 7, 3), {})
+    keyword, _, _ = builder.build(
+        (), {"session": object(), "tenant_id": 7, "location_id": 3}
+    )
+
+    assert positional == keyword
+    assert tenant_id == 7
+    assert positional.startswith("analytics:cell:tenant_7:")
+
+
+def test_key_builder_rejects_session_without_key_args():
+    """Session parameters must be excluded by declaring key_args."""
+    with pytest.raises(TypeError, match="session"):
+
+        @cache_result(ttl=60)
+        async def uses_session(session: AsyncSession, x: int) -> int:  # noqa: ARG001
+            return x
+
+
+def test_key_builder_rejects_bad_key_args():
+    """Unknown, session and unhashable key args fail at decoration time."""
+
+    async def func(session: AsyncSession, ids: list[int], x: int) -> None:
+        pass
+
+    for key_args in (("missing",), ("session",), ("ids",)):
+        with pytest.raises(TypeError):
+            CacheKeyBuilder(func, "", None, key_args)
+
+
+def test_key_builder_rejects_unstable_values():
+    """Values without a stable repr are rejected when the key is built."""
+
+    async def func(x: object) -> None:
+        pass
+
+    builder = CacheKeyBuilder(func, "", None, ("x",))
+    with pytest.raises(TypeError):
+        builder.build((object(),), {})
+
+
 def test_generate_cache_key_stability():
     """Test that same inputs generate same cache key."""
     key1 = _generate_cache_key(
@@ -175,7 +232,8 @@ async def test_invalidate_pattern():
         await redis.set(key, "value")
 
     # Invalidate all test:pattern:* keys
-    await invalidate_pattern("test:pattern:*")
+    with pytest.deprecated_call():
+        await invalidate_pattern("test:pattern:*")
 
     # Check that pattern keys are deleted
     for key in test_keys[:3]:
@@ -206,3 +264,377 @@ async def test_cache_graceful_degradation():
     result = await resilient_function(5)
     assert result == 10
     assert call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_cache_result_local_tier_counts_hits_separately():
+    """L1 hits skip Redis and are counted apart from L2 hits and misses."""
+    call_count = 0
+
+    @cache_result(ttl=60, key_prefix="test_l1", local_ttl=30)
+    async def local_func(x: int) -> dict:
+        nonlocal call_count
+        call_count += 1
+        return {"value": x}
+
+    cache_key = _generate_cache_key(
+        function_name="local_func",
+        key_prefix="test_l1",
+        tenant_id=None,
+        args=(7,),
+        kwargs={},
+    )
+    redis = await RedisClient.get_client()
+    await redis.delete(cache_key)
+
+    assert await local_func(7) == {"value": 7}
+    # Served from L1 even though Redis no longer has the key
+    await redis.delete(cache_key)
+    assert await local_func(7) == {"value": 7}
+    assert call_count == 1
+
+    stats = get_cache_stats()["test_l1:local_func"]
+    assert stats["misses"] == 1
+    assert stats["l1_hits"] == 1
+    assert stats["l2_hits"] == 0
+
+
+@pytest.mark.asyncio
+async def test_cache_result_local_tier_invalidate_cache():
+    """invalidate_cache evicts the local tier as well as Redis."""
+    call_count = 0
+
+    @cache_result(ttl=60, key_prefix="test_l1_inv", local_ttl=30)
+    async def local_func(x: int) -> int:
+        nonlocal call_count
+        call_count += 1
+        return x
+
+    await local_func(1)
+    cache_key = _generate_cache_key(
+        function_name="local_func",
+        key_prefix="test_l1_inv",
+        tenant_id=None,
+        args=(1,),
+        kwargs={},
+    )
+    await invalidate_cache(cache_key)
+
+    await local_func(1)
+    assert call_count == 2
+    await invalidate_cache(cache_key)
+
+
+@pytest.mark.asyncio
+async def test_cache_result_local_tier_evicted_by_other_worker():
+    """An invalidation published by another worker evicts this worker's L1."""
+    call_count = 0
+
+    @cache_result(ttl=60, key_prefix="test_l1_pubsub", local_ttl=30)
+    async def local_func(x: int) -> int:
+        nonlocal call_count
+        call_count += 1
+        return x
+
+    await local_func(3)
+    redis = await RedisClient.get_client()
+    # Simulate another worker: delete from Redis and publish without local eviction
+    await redis.delete(
+        _generate_cache_key(
+            function_name="local_func",
+            key_prefix="test_l1_pubsub",
+            tenant_id=None,
+            args=(3,),
+            kwargs={},
+        )
+    )
+    await redis.publish(
+        INVALIDATION_CHANNEL, json.dumps({"pattern": "test_l1_pubsub:*"})
+    )
+
+    for _ in range(50):
+        await local_func(3)
+        if call_count == 2:
+            break
+        await asyncio.sleep(0.02)
+    assert call_count == 2, "L1 entry should be evicted by the pub/sub message"
+    await invalidate_tags(cache_tag("prefix", "test_l1_pubsub"))
+
+
+@pytest.mark.asyncio
+async def test_cache_result_single_flight_on_cold_key():
+    """Concurrent misses on the same key run the function once."""
+    call_count = 0
+
+    @cache_result(ttl=60, key_prefix="test_single_flight")
+    async def slow_func(x: int) -> dict:
+        nonlocal call_count
+        call_count += 1
+        await asyncio.sleep(0.1)
+        return {"value": x}
+
+    await invalidate_tags(cache_tag("prefix", "test_single_flight"))
+    results = await asyncio.gather(*(slow_func(1) for _ in range(50)))
+
+    assert call_count == 1
+    assert all(result == {"value": 1} for result in results)
+    # Callers get independent copies of the shared result
+    assert results[0] is not results[1]
+    await invalidate_tags(cache_tag("prefix", "test_single_flight"))
+
+
+@pytest.mark.asyncio
+async def test_cache_result_waits_for_lock_held_by_other_process():
+    """A caller that cannot take the Redis lock waits for the holder's value."""
+    call_count = 0
+
+    @cache_result(ttl=60, key_prefix="test_lock_wait")
+    async def locked_func(x: int) -> int:
+        nonlocal call_count
+        call_count += 1
+        return x
+
+    cache_key = _generate_cache_key(
+        function_name="locked_func",
+        key_prefix="test_lock_wait",
+        tenant_id=None,
+        args=(5,),
+        kwargs={},
+    )
+    redis = await RedisClient.get_client()
+    await redis.delete(cache_key)
+    # Another process holds the compute lock
+    await redis.set(f"cache_lock:{cache_key}", "other-process", px=5000)
+
+    pending = asyncio.create_task(locked_func(5))
+    await asyncio.sleep(0.1)
+    await redis.setex(cache_key, 60, json.dumps(42))
+
+    assert await pending == 42
+    assert call_count == 0
+    await redis.delete(cache_key, f"cache_lock:{cache_key}")
+
+
+@pytest.mark.asyncio
+async def test_cache_result_stale_while_revalidate():
+    """A stale value is served while one background refresh runs."""
+    call_count = 0
+
+    @cache_result(ttl=60, key_prefix="test_swr", stale_ttl=60)
+    async def swr_func(x: int) -> str:  # noqa: ARG001
+        nonlocal call_count
+        call_count += 1
+        return "fresh"
+
+    cache_key = _generate_cache_key(
+        function_name="swr_func",
+        key_prefix="test_swr",
+        tenant_id=None,
+        args=(1,),
+        kwargs={},
+    )
+    redis = await RedisClient.get_client()
+    await redis.setex(
+        cache_key, 60, json.dumps({"value": "stale", "fresh_until": 0})
+    )
+
+    results = await asyncio.gather(*(swr_func(1) for _ in range(10)))
+    assert results == ["stale"] * 10
+
+    for _ in range(50):
+        if call_count:
+            break
+        await asyncio.sleep(0.02)
+    await asyncio.sleep(0.05)
+    assert call_count == 1
+    assert await swr_func(1) == "fresh"
+    await redis.delete(cache_key)
+
+
+@pytest.mark.asyncio
+async def test_cache_result_function_errors_are_not_retried():
+    """Exceptions from the wrapped function reach the caller without a retry."""
+    call_count = 0
+
+    @cache_result(ttl=60, key_prefix="test_errors")
+    async def failing_func() -> None:
+        nonlocal call_count
+        call_count += 1
+        raise ValueError("boom")
+
+    await invalidate_tags(cache_tag("prefix", "test_errors"))
+    with pytest.raises(ValueError):
+        await failing_func()
+    assert call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_invalidate_tags_by_tenant_and_kwarg():
+    """Keys are registered under tenant, prefix and declared kwarg tags."""
+    call_count = 0
+
+    @cache_result(
+        ttl=60,
+        key_prefix="test_tags",
+        tenant_key="tenant_id",
+        tag_kwargs=("location_id", "period"),
+    )
+    async def location_data(tenant_id: int, location_id: int, period: str) -> int:  # noqa: ARG001
+        nonlocal call_count
+        call_count += 1
+        return location_id
+
+    await invalidate_tags(cache_tag("prefix", "test_tags"))
+    await location_data(tenant_id=1, location_id=10, period="2024-01")
+    await location_data(tenant_id=1, location_id=11, period="2024-02")
+    await location_data(tenant_id=2, location_id=20, period="2024-01")
+    assert call_count == 3
+
+    # Only tenant 1's January entry carries both tags
+    unlinked = await invalidate_tags(
+        cache_tag("tenant", 1), cache_tag("period", "2024-01"), match_all=True
+    )
+    assert unlinked == 1
+    await location_data(tenant_id=1, location_id=10, period="2024-01")
+    await location_data(tenant_id=1, location_id=11, period="2024-02")
+    await location_data(tenant_id=2, location_id=20, period="2024-01")
+    assert call_count == 4
+
+    # Any-tag invalidation drops every entry for the location
+    assert await invalidate_tags(cache_tag("location_id", 20)) == 1
+    await location_data(tenant_id=2, location_id=20, period="2024-01")
+    assert call_count == 5
+
+    assert await invalidate_tags(cache_tag("prefix", "test_tags")) == 3
+    redis = await RedisClient.get_client()
+    assert await redis.exists("cache_tag:prefix:test_tags") == 0
+
+
+@pytest.mark.asyncio
+async def test_invalidate_tags_unknown_tag():
+    """Invalidating a tag with no keys is a no-op."""
+    assert await invalidate_tags(cache_tag("tenant", "missing")) == 0
+
+
+@pytest.mark.asyncio
+async def test_cache_result_many_shares_keys_with_single_calls():
+    """Batch reads hit entries written by single calls and vice versa."""
+    calls: list[int] = []
+
+    @cache_result(ttl=60, key_prefix="test_many", tenant_key="tenant_id")
+    async def cell(tenant_id: int, location_id: int) -> dict:
+        calls.append(location_id)
+        return {"tenant": tenant_id, "location": location_id}
+
+    await invalidate_tags(cache_tag("prefix", "test_many"))
+    await cell(tenant_id=1, location_id=1)
+
+    batch = [{"tenant_id": 1, "location_id": i} for i in range(1, 6)]
+    results = await cell.many(batch, concurrency=4)
+
+    assert results == [{"tenant": 1, "location": i} for i in range(1, 6)]
+    assert sorted(calls) == [1, 2, 3, 4, 5], "only misses are computed"
+
+    # Everything is now cached for both APIs
+    assert await cell.many(batch) == results
+    assert await cell(tenant_id=1, location_id=3) == {"tenant": 1, "location": 3}
+    assert len(calls) == 5
+
+    # Tags were registered by the batch write-back
+    assert await invalidate_tags(cache_tag("prefix", "test_many")) == 5
+
+
+@pytest.mark.asyncio
+async def test_cache_result_many_limits_concurrency():
+    """At most `concurrency` misses are computed at the same time."""
+    running = 0
+    peak = 0
+
+    @cache_result(ttl=60, key_prefix="test_many_concurrency")
+    async def slow_cell(location_id: int) -> int:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.02)
+        running -= 1
+        return location_id
+
+    await invalidate_tags(cache_tag("prefix", "test_many_concurrency"))
+    results = await slow_cell.many(
+        [{"location_id": i} for i in range(10)], concurrency=3
+    )
+
+    assert results == list(range(10))
+    assert peak == 3
+    await invalidate_tags(cache_tag("prefix", "test_many_concurrency"))
+
+
+@pytest.mark.asyncio
+async def test_cache_result_many_computes_values_when_redis_is_down(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """A Redis outage turns the whole batch into misses instead of an error."""
+
+    async def unavailable() -> None:
+        raise ConnectionError("Redis is down")
+
+    @cache_result(ttl=60, key_prefix="test_many_redis_down")
+    async def cell(location_id: int) -> int:
+        return location_id * 2
+
+    monkeypatch.setattr(RedisClient, "get_binary_client", unavailable)
+
+    assert await cell.many([{"location_id": i} for i in range(3)]) == [0, 2, 4]
+
+
+@pytest.mark.asyncio
+async def test_cache_result_many_refreshes_stale_entries():
+    """Stale batch hits are served and recomputed once in the background."""
+    call_count = 0
+
+    @cache_result(ttl=60, key_prefix="test_many_swr", stale_ttl=60)
+    async def swr_cell(location_id: int) -> str:  # noqa: ARG001
+        nonlocal call_count
+        call_count += 1
+        return "fresh"
+
+    cache_key = _generate_cache_key(
+        function_name="swr_cell",
+        key_prefix="test_many_swr",
+        tenant_id=None,
+        args=(),
+        kwargs={"location_id": 1},
+    )
+    redis = await RedisClient.get_client()
+    await redis.setex(
+        cache_key, 60, json.dumps({"value": "stale", "fresh_until": 0})
+    )
+
+    assert await swr_cell.many([{"location_id": 1}]) == ["stale"]
+
+    for _ in range(50):
+        if call_count:
+            break
+        await asyncio.sleep(0.02)
+    await asyncio.sleep(0.05)
+    assert call_count == 1
+    assert await swr_cell.many([{"location_id": 1}]) == ["fresh"]
+    await invalidate_tags(cache_tag("prefix", "test_many_swr"))
+
+
+@pytest.mark.asyncio
+async def test_cache_result_key_args_ignore_other_arguments():
+    """Arguments outside key_args (e.g. a per-request session) do not split keys."""
+    call_count = 0
+
+    @cache_result(ttl=60, key_prefix="test_key_args", key_args=("x",))
+    async def keyed(session: AsyncSession | None, x: int) -> int:  # noqa: ARG001
+        nonlocal call_count
+        call_count += 1
+        return x
+
+    await invalidate_tags(cache_tag("prefix", "test_key_args"))
+    assert await keyed(None, 1) == 1
+    assert await keyed(session=None, x=1) == 1
+    assert call_count == 1
+    await invalidate_tags(cache_tag("prefix", "test_key_args"))
@@ -0,0 +1,118 @@
+"""Tests for cached payload codecs."""
+import json
+
+import pytest
+
+from app.core.cache import _generate_cache_key, cache_result, invalidate_cache
+from app.core.cache_codecs import (
+    CODECS,
+    COMPRESSORS,
+    HEADER_FLAG,
+    CacheCodecError,
+    PayloadSerializer,
+)
+from app.core.redis import RedisClient
+
+PAYLOAD = {
+    "tenant_id": 1,
+    "cells": [{"location_id": i, "month": "2024-01", "revenue": i * 1.5} for i in range(50)],
+}
+
+
+@pytest.mark.parametrize("codec", sorted(CODECS))
+def test_codec_round_trip(codec: str):
+    """Every installed codec round-trips a dashboard-style payload."""
+    serializer = PayloadSerializer(codec=codec)
+    encoded = serializer.encode(PAYLOAD)
+
+    assert encoded[0] & HEADER_FLAG
+    assert serializer.decode(encoded) == PAYLOAD
+
+
+@pytest.mark.parametrize("compression", sorted(COMPRESSORS))
+def test_compression_above_threshold(compression: str):
+    """Payloads are compressed only once they reach the size threshold."""
+    serializer = PayloadSerializer(compression=compression, compress_min_bytes=256)
+    small = serializer.encode({"a": 1})
+    large = serializer.encode(PAYLOAD)
+
+    assert small[0] >> 3 & 0x0F == 0
+    assert large[0] >> 3 & 0x0F == COMPRESSORS[compression].id
+    assert len(large) < len(json.dumps(PAYLOAD))
+    assert serializer.decode(large) == PAYLOAD
+
+
+def test_decode_legacy_headerless_json():
+    """Values written before codec headers are read as JSON."""
+    serializer = PayloadSerializer()
+
+    assert serializer.decode(json.dumps(PAYLOAD).encode()) == PAYLOAD
+    assert serializer.decode('"text"') == "text"
+
+
+def test_decode_accepts_other_writer_codec():
+    """A reader configured for one codec decodes payloads from any other."""
+    reader = PayloadSerializer(codec="json")
+    for codec in CODECS:
+        assert reader.decode(PayloadSerializer(codec=codec).encode(PAYLOAD)) == PAYLOAD
+
+
+def test_decode_unknown_header():
+    """Unknown codec ids raise CacheCodecError instead of returning garbage."""
+    with pytest.raises(CacheCodecError):
+        PayloadSerializer().decode(bytes([HEADER_FLAG | 0x07]) + b"{}")
+
+
+@pytest.mark.parametrize("codec", sorted(CODECS))
+def test_decode_corrupt_payload(codec: str):
+    """Corrupt payloads raise CacheCodecError, whichever library fails."""
+    serializer = PayloadSerializer(codec=codec)
+    encoded = serializer.encode(PAYLOAD)
+
+    with pytest.raises(CacheCodecError):
+        serializer.decode(encoded[: len(encoded) // 2])
+    with pytest.raises(CacheCodecError):
+        serializer.decode(b'{"truncated": ')
+
+
+@pytest.mark.parametrize("compression", sorted(COMPRESSORS))
+def test_decode_corrupt_compressed_payload(compression: str):
+    """Decompression errors are reported as CacheCodecError."""
+    serializer = PayloadSerializer(compression=compression, compress_min_bytes=0)
+    encoded = serializer.encode(PAYLOAD)
+
+    with pytest.raises(CacheCodecError):
+        serializer.decode(encoded[:1] + b"not compressed")
+
+
+def test_unavailable_codec_rejected():
+    """Configuring a codec that is not installed fails at construction."""
+    with pytest.raises(ValueError):
+        PayloadSerializer(codec="pickle")
+    with pytest.raises(ValueError):
+        PayloadSerializer(compression="brotli")
+
+
+@pytest.mark.asyncio
+async def test_cache_result_stores_headed_payload():
+    """cache_result writes payloads with a codec header."""
+
+    @cache_result(ttl=60, key_prefix="test_codec")
+    async def codec_func(x: int) -> dict:
+        return {"x": x}
+
+    cache_key = _generate_cache_key(
+        function_name="codec_func",
+        key_prefix="test_codec",
+        tenant_id=None,
+        args=(1,),
+        kwargs={},
+    )
+    await invalidate_cache(cache_key)
+
+    assert await codec_func(1) == {"x": 1}
+    redis = await RedisClient.get_binary_client()
+    raw = await redis.get(cache_key)
+    assert raw[0] & HEADER_FLAG
+    assert await codec_func(1) == {"x": 1}
+    await invalidate_cache(cache_key)
@@ -0,0 +1,103 @@
+"""Tests for connection pool profiles and pool metrics."""
+import pytest
+from sqlalchemy import create_engine, text
+
+from app.core.db import async_engine
+from app.core.db_pool import (
+    POOL_METRIC_FAMILIES,
+    POOL_PROFILES,
+    PoolMonitor,
+    TimedQueuePool,
+    driver_connect_args,
+    install_idle_liveness_check,
+    pool_options,
+)
+from app.core.metrics import render_worker_samples
+
+
+def test_pool_options_apply_overrides():
+    """Unset overrides keep the profile value."""
+    options = pool_options("celery", pool_size=3)
+
+    assert options == {
+        "pool_size": 3,
+        "max_overflow": POOL_PROFILES["celery"].max_overflow,
+        "pool_timeout": POOL_PROFILES["celery"].pool_timeout,
+        "pool_recycle": POOL_PROFILES["celery"].pool_recycle,
+    }
+
+
+def test_pgbouncer_connect_args_disable_prepared_statement_reuse():
+    """Behind PgBouncer, statements are never cached or named per connection."""
+    asyncpg_args = driver_connect_args("asyncpg", pgbouncer=True)
+
+    assert asyncpg_args["statement_cache_size"] == 0
+    assert asyncpg_args["prepared_statement_cache_size"] == 0
+    name_func = asyncpg_args["prepared_statement_name_func"]
+    assert name_func() != name_func()
+    assert driver_connect_args("psycopg", pgbouncer=True) == {"prepare_threshold": None}
+    assert driver_connect_args("asyncpg", pgbouncer=False) == {}
+
+
+def test_api_engine_uses_api_profile():
+    """The default profile keeps the API pool at 5 + 15 connections."""
+    pool = async_engine.pool
+
+    assert pool.size() == 5
+    assert pool._max_overflow == 15  # type: ignore[attr-defined]
+    assert pool.monitor is not None  # type: ignore[attr-defined]
+
+
+def test_monitor_reports_gauges_and_wait_histogram():
+    """Checkouts are timed and the pool state is reported per sample."""
+    engine = create_engine(
+        "sqlite://", poolclass=TimedQueuePool, **pool_options("script")
+    )
+    monitor = PoolMonitor("test")
+    engine.pool.monitor = monitor  # type: ignore[attr-defined]
+
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+        samples = {
+            (name, labels.get("le")): value
+            for _, name, labels, value in monitor.samples(engine.pool)
+        }
+        assert samples[("db_pool_checked_out", None)] == 1
+
+    assert samples[("db_pool_size", None)] == 1
+    assert samples[("db_pool_wait_seconds_count", None)] == 1
+    assert samples[("db_pool_wait_seconds_bucket", "+Inf")] == 1
+
+    text_output = render_worker_samples(
+        {name: (kind, help_text) for name, kind, help_text in POOL_METRIC_FAMILIES},
+        {"host:1": monitor.samples(engine.pool)},
+    )
+    assert 'db_pool_checked_out{pool="test",worker="host:1"} 0.0' in text_output
+    assert "# TYPE db_pool_wait_seconds histogram" in text_output
+
+
+def test_monitor_survives_pool_recreate():
+    """dispose() replaces the pool; the new one reports to the same monitor."""
+    engine = create_engine("sqlite://", poolclass=TimedQueuePool)
+    monitor = PoolMonitor("test")
+    engine.pool.monitor = monitor  # type: ignore[attr-defined]
+
+    engine.dispose()
+
+    assert engine.pool.monitor is monitor  # type: ignore[attr-defined]
+
+
+@pytest.mark.parametrize("idle_seconds, expected_pings", [(0, 1), (3600, 0)])
+def test_idle_check_pings_only_idle_connections(monkeypatch, idle_seconds, expected_pings):
+    """A connection returned to the pool is pinged only once it has been idle."""
+    engine = create_engine("sqlite://", poolclass=TimedQueuePool)
+    install_idle_liveness_check(engine, idle_seconds)
+    pings = []
+    monkeypatch.setattr(engine.dialect, "do_ping", lambda conn: pings.append(conn) or True)
+
+    with engine.connect():
+        pass
+    with engine.connect():
+        pass
+
+    assert len(pings) == expected_pings
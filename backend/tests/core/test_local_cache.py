@@ -0,0 +1,75 @@
+"""Tests for the in-process L1 cache tier."""
+import json
+
+from app.core.local_cache import InvalidationBus, LocalCache
+
+
+def test_local_cache_get_set():
+    """Values are stored per tenant partition."""
+    cache = LocalCache(max_entries=10, ttl=60)
+    cache.set(1, "key", "value-1", ttl=60)
+    cache.set(2, "key", "value-2", ttl=60)
+
+    assert cache.get(1, "key") == "value-1"
+    assert cache.get(2, "key") == "value-2"
+    assert cache.get(None, "key") is None
+
+
+def test_local_cache_lru_bound_is_per_tenant():
+    """A busy tenant evicts only its own entries."""
+    cache = LocalCache(max_entries=2, ttl=60)
+    cache.set(1, "a", "1", ttl=60)
+    for i in range(5):
+        cache.set(2, f"k{i}", str(i), ttl=60)
+
+    assert cache.get(1, "a") == "1"
+    assert cache.get(2, "k0") is None
+    assert cache.get(2, "k4") == "4"
+    assert len(cache) == 3
+
+
+def test_local_cache_ttl_expiry():
+    """Entries expire after min(local ttl, redis ttl)."""
+    cache = LocalCache(max_entries=10, ttl=60)
+    cache.set(None, "key", "value", ttl=-1)
+
+    assert cache.get(None, "key") is None
+
+
+def test_local_cache_evict_pattern():
+    """Pattern eviction uses Redis glob semantics across partitions."""
+    cache = LocalCache(max_entries=10, ttl=60)
+    cache.set(1, "analytics:f:tenant_1:abc", "x", ttl=60)
+    cache.set(2, "analytics:f:tenant_2:abc", "y", ttl=60)
+    cache.set(1, "other:f:tenant_1:abc", "z", ttl=60)
+
+    cache.evict_pattern("analytics:*:tenant_1:*")
+
+    assert cache.get(1, "analytics:f:tenant_1:abc") is None
+    assert cache.get(2, "analytics:f:tenant_2:abc") == "y"
+    assert cache.get(1, "other:f:tenant_1:abc") == "z"
+
+
+def test_local_cache_skips_stale_generation():
+    """A value fetched before an invalidation is not written back."""
+    cache = LocalCache(max_entries=10, ttl=60)
+    generation = cache.generation
+    cache.evict("key")
+    cache.set(None, "key", "stale", ttl=60, generation=generation)
+
+    assert cache.get(None, "key") is None
+
+
+def test_invalidation_bus_applies_messages_to_registered_caches():
+    """Messages from other workers evict keys and patterns."""
+    cache = LocalCache(max_entries=10, ttl=60)
+    InvalidationBus.register(cache)
+    cache.set(None, "a:1", "x", ttl=60)
+    cache.set(None, "b:1", "y", ttl=60)
+
+    InvalidationBus.apply(json.dumps({"key": "a:1"}))
+    InvalidationBus.apply(json.dumps({"pattern": "b:*"}))
+    InvalidationBus.apply("not json")
+
+    assert cache.get(None, "a:1") is None
+    assert cache.get(None, "b:1") is None
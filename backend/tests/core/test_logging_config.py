@@ -0,0 +1,93 @@
+"""Tests for the queue-based logging pipeline."""
+import json
+import logging
+import queue
+
+import pytest
+
+from app.core.logging_config import (
+    JSONFormatter,
+    LogQueueHandler,
+    SamplingFilter,
+    configure_logging,
+    shutdown_logging,
+)
+
+
+@pytest.fixture
+def restore_root_logger():
+    root = logging.getLogger()
+    handlers, level = root.handlers[:], root.level
+    yield
+    shutdown_logging()
+    root.handlers[:] = handlers
+    root.setLevel(level)
+
+
+def _record(name: str, level: int, msg: str = "hello", **extra) -> logging.LogRecord:
+    record = logging.LogRecord(name, level, __file__, 1, msg, None, None)
+    record.__dict__.update(extra)
+    return record
+
+
+def test_json_formatter_includes_extra_fields():
+    """Fields passed via `extra` are rendered next to the standard ones."""
+    record = _record("ayni.api", logging.INFO, request_id="abc", status_code=200)
+
+    entry = json.loads(JSONFormatter().format(record))
+
+    assert entry["message"] == "hello"
+    assert entry["level"] == "INFO"
+    assert entry["logger"] == "ayni.api"
+    assert entry["request_id"] == "abc"
+    assert entry["status_code"] == 200
+    assert "msg" not in entry
+
+
+def test_sampling_filter_applies_to_logger_and_children_only():
+    """Sampled loggers drop INFO records; warnings and other loggers pass."""
+    sampler = SamplingFilter({"ayni.api": 0.0, "ayni.api.monitoring": 1.0})
+
+    assert not sampler.filter(_record("ayni.api", logging.INFO))
+    assert not sampler.filter(_record("ayni.api.performance", logging.INFO))
+    assert sampler.filter(_record("ayni.api.monitoring", logging.INFO))
+    assert sampler.filter(_record("ayni.api", logging.WARNING))
+    assert sampler.filter(_record("app.core.cache", logging.INFO))
+
+
+def test_queue_handler_drops_when_full():
+    """A full queue drops records instead of blocking the caller."""
+    handler = LogQueueHandler(queue.Queue(maxsize=1))
+
+    handler.handle(_record("ayni.api", logging.INFO))
+    handler.handle(_record("ayni.api", logging.INFO))
+
+    assert handler.dropped == 1
+
+
+def test_queue_handler_resolves_args_before_enqueue():
+    """%-style args are captured at log time, not when the listener runs."""
+    log_queue: queue.Queue[logging.LogRecord] = queue.Queue()
+    handler = LogQueueHandler(log_queue)
+    items = ["a"]
+    record = logging.LogRecord("x", logging.INFO, __file__, 1, "%s", (items,), None)
+
+    handler.handle(record)
+    items.append("b")
+
+    assert log_queue.get_nowait().getMessage() == "['a']"
+
+
+def test_configure_logging_writes_json_from_listener(restore_root_logger, capsys):  # noqa: ARG001
+    """Records logged through the root logger come out as JSON lines."""
+    configure_logging(level="INFO", sampling={"ayni.api": 0.0})
+
+    logging.getLogger("ayni.api").info("Incoming request")
+    logging.getLogger("ayni.api").warning("Slow", extra={"duration_ms": 600})
+    shutdown_logging()
+
+    lines = capsys.readouterr().err.strip().splitlines()
+    assert len(lines) == 1
+    entry = json.loads(lines[0])
+    assert entry["message"] == "Slow"
+    assert entry["duration_ms"] == 600
@@ -0,0 +1,70 @@
+"""Tests for per-route request histograms."""
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.metrics import (
+    METRICS_KEY,
+    UNMATCHED_ROUTE,
+    RequestMetrics,
+    render_prometheus,
+    request_metrics,
+)
+from app.core.redis import RedisClient
+from app.middleware.logging import RequestLoggingMiddleware
+
+
+def test_render_prometheus_cumulative_buckets():
+    """Buckets are cumulative and exported in seconds."""
+    metrics = RequestMetrics(flush_interval=60, buckets_ms=(10, 100))
+    metrics.observe("GET", "/items/{item_id}", 200, 5)
+    metrics.observe("GET", "/items/{item_id}", 200, 50)
+    metrics.observe("GET", "/items/{item_id}", 200, 500)
+
+    text = render_prometheus(metrics.pending_fields(), (10, 100))
+
+    labels = 'method="GET",route="/items/{item_id}",status="200"'
+    assert f'http_request_duration_seconds_bucket{{{labels},le="0.01"}} 1' in text
+    assert f'http_request_duration_seconds_bucket{{{labels},le="0.1"}} 2' in text
+    assert f'http_request_duration_seconds_bucket{{{labels},le="+Inf"}} 3' in text
+    assert f"http_request_duration_seconds_sum{{{labels}}} 0.555" in text
+    assert f"http_requests_total{{{labels}}} 3" in text
+    assert "# TYPE http_request_duration_seconds histogram" in text
+
+
+def test_middleware_labels_by_route_template():
+    """Requests for different IDs share the route template series."""
+    app = FastAPI()
+    app.add_middleware(RequestLoggingMiddleware)
+
+    @app.get("/items/{item_id}")
+    async def read_item(item_id: int):
+        return {"id": item_id}
+
+    request_metrics._pending.clear()
+    client = TestClient(app)
+    client.get("/items/1")
+    client.get("/items/2")
+    client.get("/nope")
+
+    series = set(request_metrics._pending)
+    assert ("GET", "/items/{item_id}", 200) in series
+    assert ("GET", UNMATCHED_ROUTE, 404) in series
+    assert not any("/items/1" in route for _, route, _ in series)
+    request_metrics._pending.clear()
+
+
+@pytest.mark.asyncio
+async def test_flush_aggregates_workers_in_redis():
+    """Deltas from several workers add up in the shared hash."""
+    redis = await RedisClient.get_client()
+    await redis.delete(METRICS_KEY)
+    workers = [RequestMetrics(flush_interval=60) for _ in range(2)]
+    for worker in workers:
+        worker.observe("POST", "/login", 200, 20)
+        await worker.flush()
+
+    text = await workers[0].render()
+
+    assert 'http_requests_total{method="POST",route="/login",status="200"} 2' in text
+    await redis.delete(METRICS_KEY)
@@ -0,0 +1,93 @@
+"""Tests for query budgets and N+1 detection."""
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from app.core.db import async_engine
+from app.core.query_budget import (
+    QueryBudget,
+    QueryBudgetExceeded,
+    QueryRecorder,
+    normalize_sql,
+    query_budget,
+    query_budget_guard,
+    record_queries,
+)
+from app.middleware.logging import RequestLoggingMiddleware
+
+
+@pytest.fixture
+def guard():
+    query_budget_guard.enable([async_engine.sync_engine], mode="raise")
+    yield query_budget_guard
+    query_budget_guard.disable()
+
+
+def test_normalize_sql_collapses_parameters_and_in_lists():
+    """Statements differing only in values or IN-list length share a shape."""
+    first = normalize_sql("SELECT * FROM item WHERE id IN ($1, $2)\n  LIMIT 10")
+    second = normalize_sql("SELECT * FROM item WHERE id IN ($1, $2, $3) LIMIT 50")
+
+    assert first == second == "SELECT * FROM item WHERE id IN (?, ...) LIMIT ?"
+
+
+def test_recorder_reports_total_and_repeats():
+    """Both the total and the most repeated shape are checked."""
+    recorder = QueryRecorder(statements=["SELECT a"] + ["SELECT b WHERE id = ?"] * 3)
+
+    problems = recorder.violations(QueryBudget(max_queries=3, max_repeats=2))
+
+    assert len(problems) == 2
+    assert "4 queries" in problems[0]
+    assert "N+1" in problems[1]
+    assert recorder.violations(QueryBudget(max_queries=4, max_repeats=3)) == []
+
+
+@pytest.mark.asyncio
+async def test_record_queries_captures_engine_statements(guard):  # noqa: ARG001
+    """Statements issued inside record_queries() are recorded."""
+    with record_queries() as recorder:
+        async with async_engine.connect() as conn:
+            for i in range(3):
+                await conn.execute(text("SELECT CAST(:value AS int)"), {"value": i})
+
+    assert sum(s.startswith("SELECT CAST(? AS int)") for s in recorder.statements) == 3
+
+
+def test_middleware_raises_for_route_over_budget(guard):  # noqa: ARG001
+    """A route repeating a statement past its budget fails in raise mode."""
+    app = FastAPI()
+    app.add_middleware(RequestLoggingMiddleware)
+
+    @app.get("/n-plus-one")
+    @query_budget(max_repeats=2)
+    async def n_plus_one():
+        async with async_engine.connect() as conn:
+            for i in range(3):
+                await conn.execute(text("SELECT CAST(:value AS int)"), {"value": i})
+        return {"ok": True}
+
+    with pytest.raises(QueryBudgetExceeded, match="repeated 3 times"):
+        TestClient(app).get("/n-plus-one")
+
+
+def test_middleware_warns_in_warn_mode(guard, caplog):
+    """In warn mode the request succeeds and a warning is logged."""
+    guard.mode = "warn"
+    app = FastAPI()
+    app.add_middleware(RequestLoggingMiddleware)
+
+    @app.get("/chatty")
+    @query_budget(max_queries=1)
+    async def chatty():
+        async with async_engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+            await conn.execute(text("SELECT 2"))
+        return {"ok": True}
+
+    with caplog.at_level("WARNING", logger="ayni.api.query_budget"):
+        response = TestClient(app).get("/chatty")
+
+    assert response.status_code == 200
+    assert any("Query budget exceeded" in r.message for r in caplog.records)
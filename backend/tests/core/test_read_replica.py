@@ -0,0 +1,115 @@
+"""Tests for read-replica routing and read-your-writes stickiness.
+
+The replica-only tests run when POSTGRES_REPLICA_SERVER is set, e.g. against
+`docker compose --profile replica up` with POSTGRES_REPLICA_PORT=5433.
+"""
+import uuid
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select
+
+from app.api import deps
+from app.core.db import async_engine, async_session_maker, replica_engine
+from app.core.read_replica import USER_KEY, WROTE_KEY, ReadAfterWrite
+from app.core.tenant_context import current_tenant
+from app.models import Tenant
+
+requires_replica = pytest.mark.skipif(
+    replica_engine is None, reason="POSTGRES_REPLICA_SERVER not configured"
+)
+
+
+@pytest.mark.asyncio
+async def test_sessions_flag_writes(async_db: AsyncSession):
+    """Reads leave a session unflagged; a flush flags it."""
+    await async_db.execute(select(Tenant).limit(1))
+    assert not async_db.info.get(WROTE_KEY)
+
+    async_db.add(Tenant())
+    await async_db.flush()
+    assert async_db.info.get(WROTE_KEY)
+
+
+@pytest.mark.asyncio
+async def test_user_sticks_to_primary_after_write():
+    """A session that wrote for a user keeps that user on the primary."""
+    routing = ReadAfterWrite(sticky_seconds=30, enabled=True)
+    writer, other = uuid.uuid4(), uuid.uuid4()
+
+    async with async_session_maker() as session:
+        session.info[USER_KEY] = writer
+        session.info[WROTE_KEY] = True
+        await routing.session_closed(session)
+
+    assert await routing.use_primary(writer)
+    assert not await routing.use_primary(other)
+    assert not await routing.use_primary(None)
+
+
+@pytest.mark.asyncio
+async def test_read_only_session_does_not_stick():
+    """Reads alone never route the user to the primary."""
+    routing = ReadAfterWrite(sticky_seconds=30, enabled=True)
+    user_id = uuid.uuid4()
+
+    async with async_session_maker() as session:
+        session.info[USER_KEY] = user_id
+        await session.execute(text("SELECT 1"))
+        await routing.session_closed(session)
+
+    assert not await routing.use_primary(user_id)
+
+
+@pytest.mark.asyncio
+async def test_read_session_uses_primary_without_replica(monkeypatch):
+    """Without a replica, ReadSessionDep is an ordinary primary session."""
+    monkeypatch.setattr(deps, "replica_engine", None)
+    monkeypatch.setattr(deps, "replica_session_maker", async_session_maker)
+
+    sessions = deps.get_read_db(token=None)
+    session = await anext(sessions)
+    try:
+        assert session.bind is async_engine
+    finally:
+        await sessions.aclose()
+
+
+@requires_replica
+@pytest.mark.asyncio
+async def test_read_session_routing(monkeypatch, superuser_token_headers):
+    """Reads go to the replica unless the user wrote recently."""
+    token = superuser_token_headers["Authorization"].removeprefix("Bearer ")
+    user_id = deps._token_user_id(token)
+    routing = ReadAfterWrite(sticky_seconds=30, enabled=True)
+    monkeypatch.setattr(deps, "read_after_write", routing)
+
+    sessions = deps.get_read_db(token=token)
+    session = await anext(sessions)
+    assert session.bind is replica_engine
+    await sessions.aclose()
+
+    await routing.mark_write(user_id)
+    sessions = deps.get_read_db(token=token)
+    session = await anext(sessions)
+    assert session.bind is async_engine
+    await sessions.aclose()
+
+
+@requires_replica
+@pytest.mark.asyncio
+async def test_replica_applies_tenant_context():
+    """The RLS tenant rides on BEGIN on the replica as on the primary."""
+    assert replica_engine is not None
+    token = current_tenant.set(77)
+    try:
+        async with replica_engine.begin() as conn:
+            result = await conn.execute(
+                text("SELECT current_setting('app.current_tenant', true)")
+            )
+            assert result.scalar() == "77"
+            in_recovery = await conn.execute(text("SELECT pg_is_in_recovery()"))
+            assert in_recovery.scalar() is True
+    finally:
+        current_tenant.reset(token)
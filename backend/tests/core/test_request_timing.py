@@ -0,0 +1,75 @@
+"""Tests for per-request DB and Redis timing."""
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from app.core.db import async_engine
+from app.core.redis import RedisClient
+from app.core.request_timing import RequestTiming, request_timing
+from app.middleware.logging import RequestLoggingMiddleware
+
+
+def test_server_timing_header_format():
+    """Totals are rendered as Server-Timing metrics in milliseconds."""
+    timing = RequestTiming()
+    timing.add_query(2_500_000)
+    timing.add_query(500_000)
+    timing.add_redis(3, 1_000_000)
+
+    assert timing.server_timing(10) == (
+        'db;dur=3.00;desc="2 queries", redis;dur=1.00;desc="3 commands", '
+        "total;dur=10.00"
+    )
+
+
+@pytest.mark.asyncio
+async def test_queries_and_redis_commands_are_counted():
+    """Engine events and the Redis client add to the active RequestTiming."""
+    timing = RequestTiming()
+    token = request_timing.set(timing)
+    try:
+        async with async_engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+            await conn.execute(text("SELECT 2"))
+        redis = await RedisClient.get_client()
+        await redis.set("test:request_timing", "1")
+        async with redis.pipeline(transaction=False) as pipe:
+            pipe.get("test:request_timing")
+            pipe.delete("test:request_timing")
+            await pipe.execute()
+    finally:
+        request_timing.reset(token)
+
+    assert timing.db_queries >= 2
+    assert timing.db_ns > 0
+    assert timing.redis_commands == 3
+    assert timing.redis_ns > 0
+
+
+@pytest.mark.asyncio
+async def test_nothing_recorded_outside_a_request():
+    """Without an active RequestTiming the hooks are no-ops."""
+    redis = await RedisClient.get_client()
+    await redis.get("test:request_timing")
+
+    assert request_timing.get() is None
+
+
+def test_middleware_adds_server_timing_header():
+    """Responses carry the breakdown for the request."""
+    app = FastAPI()
+    app.add_middleware(RequestLoggingMiddleware)
+
+    @app.get("/cached")
+    async def cached():
+        timing = request_timing.get()
+        assert timing is not None
+        timing.add_redis(1, 1_000_000)
+        return {"ok": True}
+
+    response = TestClient(app).get("/cached")
+
+    server_timing = response.headers["server-timing"]
+    assert 'redis;dur=1.00;desc="1 commands"' in server_timing
+    assert "total;dur=" in server_timing
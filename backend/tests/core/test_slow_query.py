@@ -0,0 +1,60 @@
+"""Tests for the slow-query log."""
+import asyncio
+import uuid
+
+import pytest
+from sqlalchemy import text
+
+from app.core.db import async_engine
+from app.core.slow_query import SlowQueryLog, parameter_shape
+from app.core.tenant_context import current_tenant
+
+
+def test_parameter_shape_never_includes_values():
+    """Only parameter types are kept."""
+    assert parameter_shape(("secret", 3, uuid.uuid4()), False) == [
+        "str",
+        "int",
+        "UUID",
+    ]
+    assert parameter_shape([(1, "a"), (2, "b")], True) == ["2 rows", "int", "str"]
+
+
+def test_record_buffers_normalized_statement_with_tenant():
+    """Entries carry the shape, tenant and repeat count; the buffer is bounded."""
+    log = SlowQueryLog(threshold_ms=1, buffer_size=2, explain=False, explain_after=3)
+    token = current_tenant.set(42)
+    try:
+        for user_id in range(3):
+            log.record(
+                f"SELECT * FROM item WHERE owner_id = {user_id}", (), False, 250.0
+            )
+    finally:
+        current_tenant.reset(token)
+
+    entries = log.entries()
+    assert len(entries) == 2
+    assert entries[0]["statement"] == "SELECT * FROM item WHERE owner_id = ?"
+    assert entries[0]["tenant_id"] == 42
+    assert entries[0]["occurrences"] == 3
+    assert entries[0]["plan"] is None
+
+
+@pytest.mark.asyncio
+async def test_repeat_offender_gets_explain_plan():
+    """A SELECT that is slow repeatedly is explained on a separate connection."""
+    log = SlowQueryLog(threshold_ms=20, buffer_size=10, explain=True, explain_after=2)
+    log.install(async_engine)
+    try:
+        async with async_engine.connect() as conn:
+            for _ in range(2):
+                await conn.execute(text("SELECT pg_sleep(0.03)"))
+        for _ in range(100):
+            if log.recent and log.recent[-1].plan is not None:
+                break
+            await asyncio.sleep(0.05)
+    finally:
+        log.uninstall()
+
+    assert len(log.recent) == 2
+    assert "Result" in (log.recent[-1].plan or "")
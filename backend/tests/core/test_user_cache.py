@@ -0,0 +1,89 @@
+"""Tests for the authenticated user snapshot cache."""
+import uuid
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import Session, select
+
+from app.core.config import settings
+from app.core.redis import RedisClient
+from app.core.user_cache import UserSnapshot, UserSnapshotCache
+from app.models import User
+
+
+def _snapshot(**overrides) -> UserSnapshot:
+    data = {
+        "id": uuid.uuid4(),
+        "tenant_id": 1,
+        "role": "Owner",
+        "is_active": True,
+        "is_superuser": False,
+        "is_verified": True,
+    }
+    data.update(overrides)
+    return UserSnapshot(**data)
+
+
+def test_snapshot_json_roundtrip():
+    """Test snapshots survive Redis serialization unchanged."""
+    snapshot = _snapshot(tenant_id=None, role=None)
+
+    assert UserSnapshot.from_json(snapshot.to_json()) == snapshot
+
+
+@pytest.mark.asyncio
+async def test_get_counts_miss_then_local_hit(db: Session, async_db: AsyncSession):
+    """Test first lookup hits the database and later lookups hit L1."""
+    user = db.exec(select(User).where(User.email == settings.FIRST_SUPERUSER)).one()
+    cache = UserSnapshotCache(max_entries=10, local_ttl=60, redis_ttl=60)
+    await cache.invalidate(user.id)
+
+    first = await cache.get(user.id, async_db)
+    second = await cache.get(user.id, async_db)
+
+    assert first == second == UserSnapshot.from_user(user)
+    assert cache.stats()["misses"] == 1
+    assert cache.stats()["local_hits"] == 1
+
+    # A fresh process (empty L1) is served from Redis
+    other_worker = UserSnapshotCache(max_entries=10, local_ttl=60, redis_ttl=60)
+    assert await other_worker.get(user.id, async_db) == first
+    assert other_worker.stats()["redis_hits"] == 1
+
+    await cache.invalidate(user.id)
+
+
+@pytest.mark.asyncio
+async def test_invalidate_removes_both_levels():
+    """Test invalidation drops the L1 entry and the Redis key."""
+    cache = UserSnapshotCache(max_entries=10, local_ttl=60, redis_ttl=60)
+    snapshot = _snapshot()
+    await cache.set(snapshot)
+
+    await cache.invalidate(snapshot.id)
+
+    redis = await RedisClient.get_client()
+    assert await redis.get(f"user_snapshot:{snapshot.id}") is None
+    assert cache.stats()["local_entries"] == 0
+
+
+@pytest.mark.asyncio
+async def test_local_lru_evicts_oldest():
+    """Test L1 stays bounded by max_entries."""
+    cache = UserSnapshotCache(max_entries=2, local_ttl=60, redis_ttl=60)
+    snapshots = [_snapshot() for _ in range(3)]
+    for snapshot in snapshots:
+        cache._set_local(snapshot)
+
+    assert cache._get_local(snapshots[0].id) is None
+    assert cache._get_local(snapshots[2].id) == snapshots[2]
+
+
+@pytest.mark.asyncio
+async def test_local_entry_expires():
+    """Test L1 entries are dropped after local_ttl."""
+    cache = UserSnapshotCache(max_entries=10, local_ttl=-1, redis_ttl=60)
+    snapshot = _snapshot()
+    cache._set_local(snapshot)
+
+    assert cache._get_local(snapshot.id) is None
@@ -6,9 +6,12 @@ Covers AC4: Request logging middleware captures all requests with request IDs
 
 import logging
 
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
 from fastapi.testclient import TestClient
 
 from app.main import app
+from app.middleware.logging import RequestLoggingMiddleware
 
 client = TestClient(app)
 
@@ -94,3 +97,33 @@ class TestRequestLoggingMiddleware:
 
             assert request_log_id == response_log_id
             assert request_log_id == response_request_id
+
+    def test_response_time_header_on_app(self):
+        """Test that the app's single middleware also adds X-Response-Time"""
+        response = client.get("/health")
+
+        assert response.headers["x-response-time"].endswith("ms")
+
+    def test_streaming_response_passes_through(self, caplog):
+        """Test that streamed bodies are not buffered and are fully timed"""
+        streaming_app = FastAPI()
+        streaming_app.add_middleware(RequestLoggingMiddleware)
+
+        @streaming_app.get("/stream")
+        async def stream():
+            async def chunks():
+                for i in range(3):
+                    yield f"chunk-{i}\n"
+
+            return StreamingResponse(chunks(), media_type="text/plain")
+
+        with caplog.at_level(logging.INFO, logger="ayni.api"):
+            response = TestClient(streaming_app).get("/stream")
+
+        assert response.text == "chunk-0\nchunk-1\nchunk-2\n"
+        assert "x-request-id" in response.headers
+        assert "x-response-time" in response.headers
+        response_logs = [
+            r for r in caplog.records if "Outgoing response" in r.message
+        ]
+        assert response_logs[-1].__dict__["status_code"] == 200
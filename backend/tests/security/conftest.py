@@ -14,6 +14,7 @@ from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
+from app.core.tenant_context import apply_tenant
 from app.models import Company, Location, Tenant
 
 
@@ -148,11 +149,9 @@ def set_rls_context():
             session: The database session to use
             tenant_id: The tenant ID to set in the session variable
         """
-        await session.execute(
-            text("SELECT set_config('app.current_tenant', :tenant_id, false)"),
-            {"tenant_id": str(tenant_id)},
-        )
-        # Don't commit - just set the session variable
+        # Transaction-local, as in production: a session-level setting would
+        # stay on the pooled connection (and on a PgBouncer server connection)
+        await apply_tenant(session, tenant_id)
 
     return _set_context
 
@@ -292,11 +291,8 @@ async def attempt_cross_tenant_query(
     Returns:
         list: Query results (should be empty if RLS works)
     """
-    # Set RLS context
-    await session.execute(
-        text("SELECT set_config('app.current_tenant', :tenant_id, false)"),
-        {"tenant_id": str(current_tenant_id)},
-    )
+    # Set RLS context for this transaction
+    await apply_tenant(session, current_tenant_id)
 
     # Attempt to query target tenant's data
     if tenant_id_field == "tenant_id":
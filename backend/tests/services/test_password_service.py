@@ -0,0 +1,99 @@
+"""Tests for the async password hashing service."""
+import asyncio
+import time
+import uuid
+from datetime import timedelta
+
+import pytest
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.core.security import create_refresh_token
+from app.services.password_service import PasswordHasher, PasswordHasherBusyError
+
+
+@pytest.mark.asyncio
+async def test_hash_and_verify_roundtrip():
+    """Test hashing on the pool produces a bcrypt hash that verifies."""
+    hashed = await PasswordHasher.hash("correct-horse-battery")
+
+    assert hashed.startswith("$2")
+    assert await PasswordHasher.verify("correct-horse-battery", hashed)
+    assert not await PasswordHasher.verify("wrong-password", hashed)
+    assert PasswordHasher.pending() == 0
+
+
+@pytest.mark.asyncio
+async def test_verify_none_hash_returns_false():
+    """Test OAuth-only users (no password hash) never verify."""
+    assert not await PasswordHasher.verify("anything", None)
+
+
+@pytest.mark.asyncio
+async def test_hashing_does_not_block_event_loop():
+    """Test the event loop keeps running while bcrypt works on the pool."""
+    ticks = 0
+
+    async def ticker() -> None:
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    task = asyncio.create_task(ticker())
+    start = time.perf_counter()
+    await PasswordHasher.hash("blocking-check-password")
+    elapsed = time.perf_counter() - start
+    task.cancel()
+
+    # ~1 tick per 10ms proves the loop was free during the hash
+    assert ticks >= int(elapsed / 0.01) // 2
+
+
+@pytest.mark.asyncio
+async def test_queue_full_raises_busy(monkeypatch: pytest.MonkeyPatch):
+    """Test backpressure once the pending limit is reached."""
+    monkeypatch.setattr(settings, "PASSWORD_HASH_MAX_PENDING", 0)
+
+    with pytest.raises(PasswordHasherBusyError):
+        await PasswordHasher.hash("some-password")
+
+
+def test_busy_error_returns_503(
+    db: Session,  # noqa: ARG001
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Test a saturated pool surfaces as 503 with Retry-After."""
+    from fastapi.testclient import TestClient
+
+    from app.main import app
+
+    monkeypatch.setattr(settings, "PASSWORD_HASH_MAX_PENDING", 0)
+    client = TestClient(app)
+
+    response = client.post(
+        f"{settings.API_V1_STR}/auth/login",
+        data={"username": settings.FIRST_SUPERUSER, "password": "whatever123"},
+        headers={"Content-Type": "application/x-www-form-urlencoded"},
+    )
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
+    assert response.json()["error"] == "Service Unavailable"
+
+
+@pytest.mark.asyncio
+async def test_busy_error_propagates_from_refresh_token_lookup(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Test a saturated pool during the legacy bcrypt lookup is not a bad token."""
+    from app.services import token_service
+
+    async def busy(*_args: object, **_kwargs: object) -> None:
+        raise PasswordHasherBusyError
+
+    monkeypatch.setattr(token_service, "_find_refresh_token", busy)
+    token = create_refresh_token(str(uuid.uuid4()), timedelta(minutes=5))
+
+    with pytest.raises(PasswordHasherBusyError):
+        await token_service.invalidate_refresh_token(token, session=None)  # type: ignore[arg-type]
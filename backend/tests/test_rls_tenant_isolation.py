@@ -6,15 +6,29 @@ This test module verifies:
 3. Tenant context switching works correctly (AC2)
 4. Connection pooling is configured (AC4)
 
+Run against PgBouncer in transaction pooling mode as well (docker compose
+--profile pgbouncer, POSTGRES_PORT=6432, DB_PGBOUNCER=true): the tenant
+switching and concurrency tests then check that no tenant leaks through a
+server connection shared between clients.
+
 CRITICAL: These tests validate tenant data isolation which is non-negotiable (NFR2.11-2.14)
 """
 
+import asyncio
+from collections.abc import AsyncGenerator
+
 import pytest
-from sqlalchemy import inspect, text
-from sqlmodel import select
+from sqlalchemy import delete, inspect, text
+from sqlmodel import col, select
 
 from app.api.deps import set_tenant_context
 from app.core.db import async_engine, async_session_maker
+from app.core.tenant_context import (
+    apply_tenant,
+    current_tenant,
+    reset_tenant,
+    with_tenant,
+)
 from app.models import Company, Location, Tenant, User
 
 # ============================================================================
@@ -395,6 +409,168 @@ async def test_tenant_context_switching():
                 assert companies[0].name == expected_name
 
 
+def test_with_tenant_appends_local_set_config():
+    """The tenant rides on BEGIN as a transaction-local setting"""
+    query = with_tenant("BEGIN ISOLATION LEVEL READ COMMITTED;", 42)
+
+    assert query == (
+        "BEGIN ISOLATION LEVEL READ COMMITTED; "
+        "SELECT set_config('app.current_tenant', '42', true);"
+    )
+    assert with_tenant("BEGIN;", None) == "BEGIN;"
+    assert with_tenant("COMMIT;", 42) == "COMMIT;"
+
+
+async def test_reset_tenant_restores_previous_tenant():
+    """The tenant applied for a request does not outlive its session"""
+    token = current_tenant.set(None)
+    try:
+        async with async_session_maker() as session:
+            await apply_tenant(session, 7)
+            await apply_tenant(session, 8)
+            assert current_tenant.get() == 8
+
+            reset_tenant(session)
+            assert current_tenant.get() is None
+            # Idempotent: the dependency may close after an explicit reset
+            reset_tenant(session)
+    finally:
+        current_tenant.reset(token)
+
+
+async def test_set_tenant_context_inside_started_transaction():
+    """Tenant set after the first query (user cache miss) applies immediately"""
+    token = current_tenant.set(None)
+    try:
+        async with async_session_maker() as session:
+            await session.execute(text("SELECT 1"))
+            await set_tenant_context(session, 321)
+
+            result = await session.execute(
+                text("SELECT current_setting('app.current_tenant', true)")
+            )
+            assert result.scalar() == "321"
+    finally:
+        current_tenant.reset(token)
+
+
+async def test_tenant_context_survives_commit():
+    """A new transaction in the same request gets the tenant again"""
+    token = current_tenant.set(None)
+    try:
+        async with async_session_maker() as session:
+            await set_tenant_context(session, 654)
+            await session.execute(text("SELECT 1"))
+            await session.commit()
+
+            result = await session.execute(
+                text("SELECT current_setting('app.current_tenant', true)")
+            )
+            assert result.scalar() == "654"
+    finally:
+        current_tenant.reset(token)
+
+
+async def test_tenant_context_cleared_when_connection_returns_to_pool():
+    """A connection checked in by one tenant carries no tenant to the next user"""
+    token = current_tenant.set(None)
+    try:
+        async with async_session_maker() as session:
+            await set_tenant_context(session, 987)
+            await session.execute(text("SELECT 1"))
+            await session.commit()
+    finally:
+        current_tenant.reset(token)
+
+    # Drain the whole pool so the connection used above is checked out again
+    connections = [await async_engine.connect() for _ in range(5)]
+    try:
+        for conn in connections:
+            result = await conn.execute(
+                text("SELECT current_setting('app.current_tenant', true)")
+            )
+            assert result.scalar() in (None, "")
+    finally:
+        for conn in connections:
+            await conn.close()
+
+
+@pytest.fixture
+async def concurrent_tenants() -> AsyncGenerator[list[Tenant], None]:
+    """Three tenants with one company each, deleted after the test"""
+    async with async_session_maker() as session:
+        tenants = [Tenant() for _ in range(3)]
+        session.add_all(tenants)
+        await session.commit()
+        for tenant in tenants:
+            await session.refresh(tenant)
+        session.add_all(
+            Company(tenant_id=t.id, name=f"Concurrent {t.id}", country="Chile")
+            for t in tenants
+        )
+        await session.commit()
+
+    yield tenants
+
+    async with async_session_maker() as session:
+        # Under RLS each tenant's companies are only visible in its context
+        for tenant in tenants:
+            await set_tenant_context(session, tenant.id)
+            await session.execute(
+                delete(Company).where(col(Company.tenant_id) == tenant.id)
+            )
+            await session.commit()
+        await session.execute(
+            delete(Tenant).where(col(Tenant.id).in_([t.id for t in tenants]))
+        )
+        await session.commit()
+
+
+async def test_no_cross_tenant_leakage_under_concurrent_requests(
+    concurrent_tenants: list[Tenant],
+):
+    """Concurrent requests sharing pooled connections only see their own tenant"""
+    async def request(tenant_id: int | None) -> None:
+        # Each task has its own context, like one request per task in FastAPI
+        async with async_session_maker() as session:
+            if tenant_id is not None:
+                await set_tenant_context(session, tenant_id)
+            for _ in range(3):
+                result = await session.execute(
+                    text("SELECT current_setting('app.current_tenant', true)")
+                )
+                setting = result.scalar()
+                if tenant_id is None:
+                    assert setting in (None, ""), f"leaked tenant {setting}"
+                    continue
+                assert setting == str(tenant_id)
+                companies = (await session.execute(select(Company))).scalars().all()
+                assert {c.tenant_id for c in companies} == {tenant_id}
+                await session.commit()
+                await asyncio.sleep(0)
+
+    # 60 tasks over a 20-connection pool forces connection reuse across tenants
+    tenant_ids: list[int | None] = [t.id for t in concurrent_tenants] + [None]
+    await asyncio.gather(*(request(tenant_ids[i % 4]) for i in range(60)))
+
+
+async def test_set_tenant_context_sql_helper_is_transaction_local():
+    """The SQL helper's tenant ends with the transaction (PgBouncer-safe)"""
+    async with async_engine.connect() as conn:
+        async with conn.begin():
+            await conn.execute(text("SELECT set_tenant_context(55)"))
+            result = await conn.execute(
+                text("SELECT current_setting('app.current_tenant', true)")
+            )
+            assert result.scalar() == "55"
+
+        async with conn.begin():
+            result = await conn.execute(
+                text("SELECT current_setting('app.current_tenant', true)")
+            )
+            assert result.scalar() in (None, "")
+
+
 # ============================================================================
 # AC4: Connection Pooling Tests
 # ============================================================================
@@ -434,7 +610,7 @@ async def test_connection_pooling_under_load():
     for i in range(25):  # 25 > max pool size of 20
         async with async_engine.connect() as conn:
             # Simple query to verify connection works
-            result = await conn.execute(text("SELECT :id as query_id"), {"id": i})
+            result = await conn.execute(text("SELECT CAST(:id AS int) as query_id"), {"id": i})
             row = result.fetchone()
             assert row[0] == i, f"Query {i} should return {i}"
             successful_connections += 1
@@ -446,6 +622,29 @@ async def test_connection_pooling_under_load():
     # This test validates pool configuration and basic overflow handling
 
 
+async def test_same_statement_across_transactions_and_tenants():
+    """Repeated statements work when transactions move between server connections
+
+    Behind PgBouncer each transaction may run on another server connection,
+    where a cached or sequentially named prepared statement would be missing
+    or already exist.
+    """
+    token = current_tenant.set(None)
+    try:
+        for i in range(20):
+            current_tenant.set(i + 1)
+            async with async_session_maker() as session:
+                result = await session.execute(
+                    text(
+                        "SELECT current_setting('app.current_tenant', true), CAST(:i AS int)"
+                    ),
+                    {"i": i},
+                )
+                assert tuple(result.one()) == (str(i + 1), i)
+    finally:
+        current_tenant.reset(token)
+
+
 # ============================================================================
 # Helper function tests
 # ============================================================================
@@ -1,11 +1,14 @@
 from fastapi.testclient import TestClient
-from sqlmodel import Session
+from sqlmodel import Session, select
 
-from app import crud
 from app.core.config import settings
-from app.models import User, UserCreate, UserUpdate
+from app.core.security import get_password_hash
+from app.models import User, UserCreate
 from tests.utils.utils import random_email, random_lower_string
 
+# Sync-session setup helpers for tests that drive the API through TestClient.
+# The async crud functions are covered in tests/crud.
+
 
 def user_authentication_headers(
     *, client: TestClient, email: str, password: str
@@ -19,12 +22,25 @@ def user_authentication_headers(
     return headers
 
 
+def create_user(db: Session, user_in: UserCreate) -> User:
+    user = User.model_validate(
+        user_in, update={"hashed_password": get_password_hash(user_in.password)}
+    )
+    db.add(user)
+    db.commit()
+    db.refresh(user)
+    return user
+
+
+def get_user_by_email(db: Session, email: str) -> User | None:
+    return db.exec(select(User).where(User.email == email)).first()
+
+
 def create_random_user(db: Session) -> User:
     email = random_email()
     password = random_lower_string()
     user_in = UserCreate(email=email, password=password)
-    user = crud.create_user(session=db, user_create=user_in)
-    return user
+    return create_user(db, user_in)
 
 
 def authentication_token_from_email(
@@ -36,14 +52,12 @@ def authentication_token_from_email(
     If the user doesn't exist it is created first.
     """
     password = random_lower_string()
-    user = crud.get_user_by_email(session=db, email=email)
+    user = get_user_by_email(db, email)
     if not user:
-        user_in_create = UserCreate(email=email, password=password)
-        user = crud.create_user(session=db, user_create=user_in_create)
+        user = create_user(db, UserCreate(email=email, password=password))
     else:
-        user_in_update = UserUpdate(password=password)
-        if not user.id:
-            raise Exception("User id not set")
-        user = crud.update_user(session=db, db_user=user, user_in=user_in_update)
+        user.hashed_password = get_password_hash(password)
+        db.add(user)
+        db.commit()
 
     return user_authentication_headers(client=client, email=email, password=password)
@@ -0,0 +1,44 @@
+"""Tests for Celery queue routing and per-queue worker settings."""
+import pytest
+from celery import Celery
+
+from app.workers.celery_app import (
+    DEFAULT_QUEUE,
+    QUEUES,
+    _configure_queue_worker,
+    celery_app,
+)
+
+
+@pytest.mark.parametrize(
+    "task_name, queue",
+    [
+        ("app.workers.email.send_reset_password", "fast"),
+        ("app.workers.tokens.cleanup_expired_tokens", "fast"),
+        ("app.workers.ingest.parse_csv", "ingest"),
+        ("app.workers.aggregate.daily_rollup", "aggregate"),
+        ("app.workers.scheduled.nightly_report", "scheduled"),
+        ("app.workers.tasks.sample_task", DEFAULT_QUEUE),
+    ],
+)
+def test_tasks_are_routed_by_name(task_name, queue):
+    route = celery_app.amqp.router.route({}, task_name)
+
+    assert route["queue"].name == queue
+    if queue != DEFAULT_QUEUE:
+        assert route["priority"] == QUEUES[queue].priority
+
+
+def test_single_queue_worker_takes_queue_settings():
+    """A worker for one queue gets its limits; multi-queue workers keep defaults."""
+    app = Celery("test")
+    _configure_queue_worker(conf=app.conf, options={"queues": ["ingest"]})
+
+    assert app.conf.worker_prefetch_multiplier == 1
+    assert app.conf.worker_concurrency == QUEUES["ingest"].concurrency
+    assert app.conf.task_soft_time_limit == QUEUES["ingest"].soft_time_limit
+    assert app.conf.task_time_limit == QUEUES["ingest"].time_limit
+
+    other = Celery("test")
+    _configure_queue_worker(conf=other.conf, options={"queues": ["fast", "ingest"]})
+    assert other.conf.task_time_limit is None
@@ -0,0 +1,75 @@
+"""Tests for the Celery event stream monitor."""
+import time
+
+from app.workers.celery_app import celery_app
+from app.workers.event_monitor import CeleryEventMonitor
+
+
+def _monitor() -> CeleryEventMonitor:
+    # Publish after every event so snapshot() reflects it immediately
+    return CeleryEventMonitor(celery_app, publish_interval=0)
+
+
+def _heartbeat(hostname: str = "celery@w1", **fields) -> dict:
+    return {"type": "worker-heartbeat", "hostname": hostname, "freq": 2.0, **fields}
+
+
+def test_task_moves_from_reserved_to_active_then_disappears():
+    """Unfinished tasks are grouped by worker and state; finished are dropped."""
+    monitor = _monitor()
+    monitor.handle(_heartbeat(active=0, processed=10))
+    monitor.handle(
+        {"type": "task-received", "uuid": "t1", "name": "app.t", "hostname": "celery@w1"}
+    )
+
+    snapshot = monitor.snapshot()
+    assert [t["id"] for t in snapshot["reserved"]["celery@w1"]] == ["t1"]
+    assert snapshot["workers"]["celery@w1"]["processed"] == 10
+
+    monitor.handle({"type": "task-started", "uuid": "t1", "hostname": "celery@w1"})
+    snapshot = monitor.snapshot()
+    assert snapshot["reserved"] == {}
+    assert snapshot["active"]["celery@w1"][0]["name"] == "app.t"
+
+    monitor.handle({"type": "task-succeeded", "uuid": "t1", "hostname": "celery@w1"})
+    assert monitor.snapshot()["active"] == {}
+
+
+def test_task_with_eta_is_scheduled():
+    monitor = _monitor()
+    monitor.handle(_heartbeat())
+    monitor.handle(
+        {
+            "type": "task-received",
+            "uuid": "t2",
+            "name": "app.t",
+            "hostname": "celery@w1",
+            "eta": "2026-10-18T00:00:00+00:00",
+        }
+    )
+
+    assert monitor.snapshot()["scheduled"]["celery@w1"][0]["id"] == "t2"
+
+
+def test_offline_and_silent_workers_are_dropped_with_their_tasks():
+    """worker-offline or missed heartbeats remove the worker and its tasks."""
+    monitor = _monitor()
+    monitor.handle(_heartbeat("celery@w1"))
+    monitor.handle(_heartbeat("celery@w2"))
+    monitor.handle({"type": "task-started", "uuid": "t3", "hostname": "celery@w2"})
+
+    monitor.handle({"type": "worker-offline", "hostname": "celery@w1"})
+    assert list(monitor.snapshot()["workers"]) == ["celery@w2"]
+
+    monitor.workers["celery@w2"].last_heartbeat = time.time() - 60
+    monitor.handle({"type": "task-sent", "uuid": "t4"})
+    snapshot = monitor.snapshot()
+    assert snapshot["workers"] == {}
+    assert snapshot["active"] == {}
+
+
+def test_snapshot_before_connecting_is_empty():
+    snapshot = CeleryEventMonitor(celery_app).snapshot()
+
+    assert snapshot["connected"] is False
+    assert snapshot["workers"] == {}
@@ -0,0 +1,153 @@
+"""Integration tests for staged pipelines, against the local Redis.
+
+An in-process Celery worker consumes the real broker, so the chords,
+checkpoints and events all go through Redis.
+"""
+import json
+import time
+import uuid
+from collections.abc import Generator
+from typing import Any
+
+import pytest
+from celery.contrib.testing.worker import start_worker
+
+from app.core.redis import RedisClient
+from app.workers.celery_app import celery_app
+from app.workers.pipeline import (
+    EVENTS_CHANNEL,
+    KEY_PREFIX,
+    Pipeline,
+    Stage,
+    by_month,
+    by_param,
+    pipeline_outputs,
+    pipeline_progress,
+    register_pipeline,
+    resume_pipeline,
+    start_pipeline,
+)
+
+# Shards run so far, and shards that fail (a crashed run); the worker runs in
+# this process
+calls: list[tuple[str, str]] = []
+failing: set[str] = set()
+
+
+def _square(_params: dict[str, Any], shard: str, _inputs: dict[str, Any]) -> int:
+    calls.append(("per_location", shard))
+    if shard in failing:
+        raise RuntimeError(f"shard {shard} crashed")
+    return int(shard) ** 2
+
+
+def _month_total(_params: dict[str, Any], shard: str, inputs: dict[str, Any]) -> dict:
+    calls.append(("per_month", shard))
+    return {"month": shard, "total": inputs["per_location"]}
+
+
+register_pipeline(
+    Pipeline(
+        "test_pipeline",
+        [
+            Stage(
+                "per_location",
+                by_param("locations"),
+                _square,
+                reduce=lambda params, results: sum(results.values()),
+            ),
+            Stage("per_month", by_month(), _month_total),
+        ],
+    )
+)
+
+PARAMS = {"locations": [1, 2, 3], "start": "2026-01-15", "end": "2026-02-01"}
+
+
+@pytest.fixture(scope="module")
+def worker() -> Generator[None, None, None]:
+    with start_worker(celery_app, perform_ping_check=False, loglevel="WARNING"):
+        yield
+
+
+@pytest.fixture
+def run_id() -> Generator[str, None, None]:
+    run_id = uuid.uuid4().hex
+    calls.clear()
+    failing.clear()
+    yield run_id
+    redis = RedisClient.get_sync_client()
+    keys = list(redis.scan_iter(f"{KEY_PREFIX}test_pipeline:{run_id}:*"))
+    if keys:
+        redis.delete(*keys)
+
+
+def _wait_for_end(run_id: str, timeout: float = 30) -> dict[str, Any]:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        progress = pipeline_progress("test_pipeline", run_id)
+        if progress["status"] in ("completed", "failed"):
+            return progress
+        time.sleep(0.1)
+    raise AssertionError(f"Pipeline run {run_id} did not finish")
+
+
+def test_stages_fan_out_and_in_with_progress_events(worker, run_id):  # noqa: ARG001
+    events = RedisClient.get_sync_client().pubsub(ignore_subscribe_messages=True)
+    events.subscribe(EVENTS_CHANNEL)
+    try:
+        start_pipeline("test_pipeline", PARAMS, run_id=run_id)
+        progress = _wait_for_end(run_id)
+
+        # get_message() also returns None for the skipped subscribe reply
+        received = []
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline:
+            message = events.get_message(timeout=0.5)
+            if message is None:
+                continue
+            event = json.loads(message["data"])
+            if event["run_id"] == run_id:
+                received.append(event)
+                if event["event"] == "pipeline_done":
+                    break
+    finally:
+        events.close()
+
+    assert progress["status"] == "completed"
+    assert progress["stages"]["per_location"] == {"done": 3, "total": 3, "completed": True}
+    assert pipeline_outputs("test_pipeline", run_id) == {
+        "per_location": 14,
+        "per_month": {
+            "2026-01": {"month": "2026-01", "total": 14},
+            "2026-02": {"month": "2026-02", "total": 14},
+        },
+    }
+    kinds = [event["event"] for event in received]
+    assert kinds.count("shard_done") == 5
+    assert kinds.count("stage_done") == 2
+    assert kinds[-1] == "pipeline_done"
+
+
+def test_resume_reruns_only_unfinished_shards(worker, run_id):  # noqa: ARG001
+    """After a failed run, completed shards come from their checkpoints."""
+    failing.add("3")
+    start_pipeline("test_pipeline", PARAMS, run_id=run_id)
+    progress = _wait_for_end(run_id)
+
+    assert progress["status"] == "failed"
+    assert progress["stages"]["per_location"]["done"] == 2
+    assert not progress["stages"]["per_location"]["completed"]
+
+    failing.clear()
+    calls.clear()
+    resume_pipeline("test_pipeline", run_id)
+    progress = _wait_for_end(run_id)
+
+    assert progress["status"] == "completed"
+    assert sorted(calls) == [
+        ("per_location", "3"),
+        ("per_month", "2026-01"),
+        ("per_month", "2026-02"),
+    ]
+    assert pipeline_outputs("test_pipeline", run_id)["per_location"] == 14
@@ -0,0 +1,68 @@
+"""Tests for the Celery task outcome time series."""
+import pytest
+
+from app.core.redis import RedisClient
+from app.workers.task_stats import (
+    TaskStatsRecorder,
+    outcome_fields,
+    percentile,
+    read_task_stats,
+    summarize_buckets,
+    window_keys,
+)
+
+# A fixed hour in the past, so the test buckets never mix with real ones
+NOW = 1_000_000 * 3600.0 + 1800
+
+
+def test_percentiles_merge_across_buckets():
+    """Histograms from several buckets add up before percentiles are taken."""
+    first = outcome_fields("app.t", "completed", 5)
+    second = outcome_fields("app.t", "completed", 40)
+    failed = outcome_fields("app.t", "failed", 40)
+
+    stats = summarize_buckets([first, second, failed, {"app.u\tretried": "2"}])
+
+    assert (stats["completed"], stats["failed"], stats["retried"]) == (2, 1, 2)
+    task = stats["tasks"]["app.t"]
+    assert task["runtime_ms"]["mean"] == pytest.approx(85 / 3)
+    assert 25 < task["runtime_ms"]["p50"] <= 50
+    assert stats["tasks"]["app.u"]["runtime_ms"]["p99"] is None
+
+
+def test_percentile_overflow_reports_highest_bound():
+    counts = [0.0] * 14 + [1.0]
+
+    assert percentile(counts, 99) == 900000
+
+
+def test_window_keys_use_minute_and_hour_buckets():
+    assert len(window_keys("1h", NOW)) == 60
+    assert window_keys("24h", NOW)[0] == "tasks:stats:h:1000000"
+    assert window_keys("7d", NOW)[-1] == "tasks:stats:h:999833"
+
+
+@pytest.mark.asyncio
+async def test_recorded_outcomes_are_read_per_window():
+    """Outcomes land in minute and hour buckets, which expire on their own."""
+    recorder = TaskStatsRecorder()
+    redis = await RedisClient.get_client()
+    keys = set(window_keys("1h", NOW)[:1] + window_keys("24h", NOW)[:1])
+    await redis.delete(*keys)
+    try:
+        recorder.task_started("t1")
+        recorder.task_finished("t1", "app.t", "completed", now=NOW)
+        recorder.task_finished("t2", "app.t", "failed", now=NOW)
+        # Two hours earlier: outside 1h, inside 24h
+        recorder.task_finished("t3", "app.t", "completed", now=NOW - 7200)
+        keys |= {window_keys("1h", NOW - 7200)[0], window_keys("24h", NOW - 7200)[0]}
+
+        last_hour = await read_task_stats("1h", now=NOW)
+        last_day = await read_task_stats("24h", now=NOW)
+
+        assert (last_hour["completed"], last_hour["failed"]) == (1, 1)
+        assert last_hour["tasks"]["app.t"]["runtime_ms"]["p50"] is not None
+        assert (last_day["completed"], last_day["failed"]) == (2, 1)
+        assert 0 < await redis.ttl(window_keys("1h", NOW)[0]) <= 2 * 3600
+    finally:
+        await redis.delete(*keys)
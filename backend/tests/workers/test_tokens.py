@@ -0,0 +1,56 @@
+"""Tests for expired-token cleanup and the periodic job lock."""
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import Session, select
+
+from app.models import RefreshToken
+from app.services.token_service import cleanup_expired_tokens
+from app.workers import tokens
+from app.workers.locks import periodic_lock
+from tests.utils.user import create_random_user
+
+
+@pytest.mark.asyncio
+async def test_cleanup_deletes_expired_tokens_in_chunks(
+    db: Session, async_db: AsyncSession
+):
+    """Expired rows go in several chunks; unexpired rows stay."""
+    user = create_random_user(db)
+    now = datetime.utcnow()
+    valid = RefreshToken(
+        user_id=user.id, token_hash="valid", expires_at=now + timedelta(days=1)
+    )
+    db.add_all(
+        [
+            RefreshToken(
+                user_id=user.id, token_hash=f"expired-{i}", expires_at=now - timedelta(days=1)
+            )
+            for i in range(5)
+        ]
+        + [valid]
+    )
+    db.commit()
+
+    # Other tests may leave expired rows behind, hence >=
+    assert await cleanup_expired_tokens(async_db, batch_size=2) >= 5
+
+    db.expire_all()
+    remaining = db.exec(select(RefreshToken).where(RefreshToken.user_id == user.id)).all()
+    assert [token.token_hash for token in remaining] == ["valid"]
+
+
+def test_periodic_lock_is_exclusive():
+    with periodic_lock("test-job", ttl_seconds=30) as first:
+        with periodic_lock("test-job", ttl_seconds=30) as second:
+            assert first is True
+            assert second is False
+
+    with periodic_lock("test-job", ttl_seconds=30) as again:
+        assert again is True
+
+
+def test_cleanup_task_skips_while_another_run_holds_the_lock():
+    with periodic_lock("cleanup_expired_tokens", ttl_seconds=30):
+        assert tokens.cleanup_expired_tokens() == {"skipped": True}